@@ -5,6 +5,9 @@ from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
 from app.application.common.services.authorization.authorize import (
     authorize,
 )
@@ -15,6 +18,7 @@ from app.application.common.services.authorization.permissions import (
     UserManagementContext,
 )
 from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.optimistic_write import write_optimistically
 from app.domain.entities.user import User
 from app.domain.enums.user_type import UserRole
 from app.domain.exceptions.user import UserNotFoundByUsernameError
@@ -42,11 +46,13 @@ class ActivateUserInteractor:
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         transaction_manager: TransactionManager,
+        user_listing_invalidator: UserListingInvalidator,
     ):
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
+        self._user_listing_invalidator = user_listing_invalidator
 
     async def execute(self, request_data: ActivateUserRequest) -> None:
         """
@@ -56,6 +62,7 @@ class ActivateUserInteractor:
         :raises DomainFieldError:
         :raises UserNotFoundByUsernameError:
         :raises ActivationChangeNotPermittedError:
+        :raises ConcurrentUpdateError:
         """
         log.info(
             "Activate user: started. Username: '%s'.",
@@ -73,10 +80,26 @@ class ActivateUserInteractor:
         )
 
         username = Username(request_data.username)
-        user: User | None = await self._user_command_gateway.read_by_username(
-            username,
-            for_update=True,
+        user = await write_optimistically(
+            self._transaction_manager,
+            lambda: self._activate(current_user, username),
+        )
+        await self._transaction_manager.commit()
+        self._user_listing_invalidator.invalidate()
+
+        log.info(
+            "Activate user: done. Username: '%s'.",
+            user.username.value,
         )
+
+    async def _activate(self, current_user: User, username: Username) -> User:
+        """
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises UserNotFoundByUsernameError:
+        :raises ActivationChangeNotPermittedError:
+        """
+        user: User | None = await self._user_command_gateway.read_by_username(username)
         if user is None:
             raise UserNotFoundByUsernameError(username)
 
@@ -89,9 +112,4 @@ class ActivateUserInteractor:
         )
 
         self._user_service.toggle_user_activation(user, is_active=True)
-        await self._transaction_manager.commit()
-
-        log.info(
-            "Activate user: done. Username: '%s'.",
-            user.username.value,
-        )
+        return user
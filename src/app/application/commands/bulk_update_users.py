@@ -0,0 +1,183 @@
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TypedDict
+
+from app.application.common.exceptions.bulk import EmptySelectionError
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.transaction_manager import (
+    TransactionManager,
+)
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
+from app.application.common.query_params.user import UserListFilters
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    CanManageSubordinate,
+    RoleManagementContext,
+    UserManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.entities.user import User
+from app.domain.enums.user_type import UserRole
+from app.domain.value_objects.user_id import UserId
+from app.domain.value_objects.username.username import Username
+
+log = logging.getLogger(__name__)
+
+
+class UserBulkAction(StrEnum):
+    ACTIVATE = "activate"
+    DEACTIVATE = "deactivate"
+    GRANT_ADMIN = "grant_admin"
+    REVOKE_ADMIN = "revoke_admin"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BulkUpdateUsersRequest:
+    action: UserBulkAction
+    usernames: Sequence[str] | None = None
+    role: UserRole | None = None
+    is_active: bool | None = None
+    username_prefix: str | None = None
+    username_contains: str | None = None
+
+
+class BulkUpdateUsersResponse(TypedDict):
+    updated: list[str]
+    not_permitted: list[str]
+    not_found: list[str]
+
+
+class BulkUpdateUsersInteractor:
+    """
+    - Open to admins; granting and revoking admin rights to super admins.
+    - Activates, deactivates, grants or revokes admin rights to every user
+    selected by a list of usernames, by list filters, or by both.
+    - Deactivation also deletes the users' sessions.
+    - Users the current user can't manage are left unchanged and reported,
+    as are listed usernames that don't exist.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_command_gateway: UserCommandGateway,
+        transaction_manager: TransactionManager,
+        access_revoker: AccessRevoker,
+        user_listing_invalidator: UserListingInvalidator,
+    ):
+        self._current_user_service = current_user_service
+        self._user_command_gateway = user_command_gateway
+        self._transaction_manager = transaction_manager
+        self._access_revoker = access_revoker
+        self._user_listing_invalidator = user_listing_invalidator
+
+    async def execute(
+        self,
+        request_data: BulkUpdateUsersRequest,
+    ) -> BulkUpdateUsersResponse:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises DomainFieldError:
+        :raises EmptySelectionError:
+        """
+        log.info("Bulk update users: started. Action: '%s'.", request_data.action)
+
+        filters = UserListFilters(
+            role=request_data.role,
+            is_active=request_data.is_active,
+            username_prefix=request_data.username_prefix,
+            username_contains=request_data.username_contains,
+        )
+        if request_data.usernames is None and filters == UserListFilters():
+            raise EmptySelectionError(
+                "Select users by username, by at least one filter, or both.",
+            )
+
+        current_user = await self._current_user_service.get_current_user()
+
+        is_admin_action = request_data.action in {
+            UserBulkAction.GRANT_ADMIN,
+            UserBulkAction.REVOKE_ADMIN,
+        }
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.ADMIN if is_admin_action else UserRole.USER,
+            ),
+        )
+
+        usernames = (
+            None
+            if request_data.usernames is None
+            else [Username(username) for username in request_data.usernames]
+        )
+        users = await self._user_command_gateway.read_many_for_update(
+            usernames=usernames,
+            filters=filters,
+        )
+
+        # The same checks as the single-user commands, applied in memory.
+        permission = CanManageSubordinate()
+        permitted: list[User] = []
+        not_permitted: list[User] = []
+        for user in users:
+            is_permitted = user.role.is_changeable and permission.is_satisfied_by(
+                UserManagementContext(subject=current_user, target=user),
+            )
+            (permitted if is_permitted else not_permitted).append(user)
+
+        user_ids = [user.id_ for user in permitted]
+        if user_ids:
+            await self._update(request_data.action, user_ids)
+            await self._transaction_manager.commit()
+            self._user_listing_invalidator.invalidate()
+            if request_data.action == UserBulkAction.DEACTIVATE:
+                await self._access_revoker.remove_all_users_access(user_ids)
+
+        found = {user.username.value for user in users}
+        response = BulkUpdateUsersResponse(
+            updated=[user.username.value for user in permitted],
+            not_permitted=[user.username.value for user in not_permitted],
+            not_found=[
+                username.value
+                for username in usernames or ()
+                if username.value not in found
+            ],
+        )
+        log.info(
+            "Bulk update users: done. Action: '%s'. Updated: %d.",
+            request_data.action,
+            len(permitted),
+        )
+        return response
+
+    async def _update(self, action: UserBulkAction, user_ids: Sequence[UserId]) -> None:
+        """
+        :raises DataMapperError:
+        """
+        match action:
+            case UserBulkAction.ACTIVATE:
+                await self._user_command_gateway.update_many(user_ids, is_active=True)
+            case UserBulkAction.DEACTIVATE:
+                await self._user_command_gateway.update_many(user_ids, is_active=False)
+            case UserBulkAction.GRANT_ADMIN:
+                await self._user_command_gateway.update_many(
+                    user_ids,
+                    role=UserRole.ADMIN,
+                )
+            case UserBulkAction.REVOKE_ADMIN:
+                await self._user_command_gateway.update_many(
+                    user_ids,
+                    role=UserRole.USER,
+                )
@@ -15,10 +15,12 @@ from app.application.common.services.authorization.permissions import (
     UserManagementContext,
 )
 from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.optimistic_write import write_optimistically
 from app.domain.entities.user import User
 from app.domain.exceptions.user import UserNotFoundByUsernameError
 from app.domain.services.user import UserService
 from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.domain.value_objects.user_password_hash import UserPasswordHash
 from app.domain.value_objects.username.username import Username
 
 log = logging.getLogger(__name__)
@@ -56,7 +58,9 @@ class ChangePasswordInteractor:
         :raises DataMapperError:
         :raises AuthorizationError:
         :raises DomainFieldError:
+        :raises PasswordHasherBusyError:
         :raises UserNotFoundByUsernameError:
+        :raises ConcurrentUpdateError:
         """
         log.info("Change password: started.")
 
@@ -64,10 +68,34 @@ class ChangePasswordInteractor:
 
         username = Username(request_data.username)
         password = RawPassword(request_data.password)
-        user: User | None = await self._user_command_gateway.read_by_username(
-            username,
-            for_update=True,
-        )
+        # No row lock is held while the password is hashed.
+        # It's hashed once, after the first authorization;
+        # retries only read, authorize and assign again.
+        password_hash: UserPasswordHash | None = None
+
+        async def change_password() -> None:
+            nonlocal password_hash
+            user = await self._read_authorized_user(current_user, username)
+            if password_hash is None:
+                password_hash = await self._user_service.hash_password(password)
+            self._user_service.set_password_hash(user, password_hash)
+
+        await write_optimistically(self._transaction_manager, change_password)
+        await self._transaction_manager.commit()
+
+        log.info("Change password: done.")
+
+    async def _read_authorized_user(
+        self,
+        current_user: User,
+        username: Username,
+    ) -> User:
+        """
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises UserNotFoundByUsernameError:
+        """
+        user: User | None = await self._user_command_gateway.read_by_username(username)
         if user is None:
             raise UserNotFoundByUsernameError(username)
 
@@ -81,8 +109,4 @@ class ChangePasswordInteractor:
                 target=user,
             ),
         )
-
-        self._user_service.change_password(user, password)
-        await self._transaction_manager.commit()
-
-        log.info("Change password: done.")
+        return user
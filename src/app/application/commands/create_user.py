@@ -8,6 +8,9 @@ from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
 from app.application.common.services.authorization.authorize import (
     authorize,
 )
@@ -50,12 +53,14 @@ class CreateUserInteractor:
         user_command_gateway: UserCommandGateway,
         flusher: Flusher,
         transaction_manager: TransactionManager,
+        user_listing_invalidator: UserListingInvalidator,
     ):
         self._current_user_service = current_user_service
         self._user_service = user_service
         self._user_command_gateway = user_command_gateway
         self._flusher = flusher
         self._transaction_manager = transaction_manager
+        self._user_listing_invalidator = user_listing_invalidator
 
     async def execute(self, request_data: CreateUserRequest) -> CreateUserResponse:
         """
@@ -63,6 +68,7 @@ class CreateUserInteractor:
         :raises DataMapperError:
         :raises AuthorizationError:
         :raises DomainFieldError:
+        :raises PasswordHasherBusyError:
         :raises RoleAssignmentNotPermittedError:
         :raises UsernameAlreadyExistsError:
         """
@@ -83,7 +89,11 @@ class CreateUserInteractor:
 
         username = Username(request_data.username)
         password = RawPassword(request_data.password)
-        user = self._user_service.create_user(username, password, request_data.role)
+        user = await self._user_service.create_user(
+            username,
+            password,
+            request_data.role,
+        )
 
         self._user_command_gateway.add(user)
 
@@ -93,6 +103,7 @@ class CreateUserInteractor:
             raise
 
         await self._transaction_manager.commit()
+        self._user_listing_invalidator.invalidate()
 
         log.info("Create user: done. Username: '%s'.", user.username.value)
         return CreateUserResponse(id=user.id_.value)
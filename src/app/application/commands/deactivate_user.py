@@ -6,6 +6,9 @@ from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
 from app.application.common.services.authorization.authorize import (
     authorize,
 )
@@ -16,6 +19,7 @@ from app.application.common.services.authorization.permissions import (
     UserManagementContext,
 )
 from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.optimistic_write import write_optimistically
 from app.domain.entities.user import User
 from app.domain.enums.user_type import UserRole
 from app.domain.exceptions.user import UserNotFoundByUsernameError
@@ -46,12 +50,14 @@ class DeactivateUserInteractor:
         user_service: UserService,
         transaction_manager: TransactionManager,
         access_revoker: AccessRevoker,
+        user_listing_invalidator: UserListingInvalidator,
     ):
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
         self._access_revoker = access_revoker
+        self._user_listing_invalidator = user_listing_invalidator
 
     async def execute(self, request_data: DeactivateUserRequest) -> None:
         """
@@ -61,6 +67,7 @@ class DeactivateUserInteractor:
         :raises DomainFieldError:
         :raises UserNotFoundByUsernameError:
         :raises ActivationChangeNotPermittedError:
+        :raises ConcurrentUpdateError:
         """
         log.info(
             "Deactivate user: started. Username: '%s'.",
@@ -78,10 +85,27 @@ class DeactivateUserInteractor:
         )
 
         username = Username(request_data.username)
-        user: User | None = await self._user_command_gateway.read_by_username(
-            username,
-            for_update=True,
+        user = await write_optimistically(
+            self._transaction_manager,
+            lambda: self._deactivate(current_user, username),
         )
+        await self._transaction_manager.commit()
+        self._user_listing_invalidator.invalidate()
+        await self._access_revoker.remove_all_user_access(user.id_)
+
+        log.info(
+            "Deactivate user: done. Username: '%s'.",
+            user.username.value,
+        )
+
+    async def _deactivate(self, current_user: User, username: Username) -> User:
+        """
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises UserNotFoundByUsernameError:
+        :raises ActivationChangeNotPermittedError:
+        """
+        user: User | None = await self._user_command_gateway.read_by_username(username)
         if user is None:
             raise UserNotFoundByUsernameError(username)
 
@@ -94,10 +118,4 @@ class DeactivateUserInteractor:
         )
 
         self._user_service.toggle_user_activation(user, is_active=False)
-        await self._transaction_manager.commit()
-        await self._access_revoker.remove_all_user_access(user.id_)
-
-        log.info(
-            "Deactivate user: done. Username: '%s'.",
-            user.username.value,
-        )
+        return user
@@ -5,6 +5,9 @@ from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
 from app.application.common.services.authorization.authorize import (
     authorize,
 )
@@ -13,6 +16,7 @@ from app.application.common.services.authorization.permissions import (
     RoleManagementContext,
 )
 from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.optimistic_write import write_optimistically
 from app.domain.entities.user import User
 from app.domain.enums.user_type import UserRole
 from app.domain.exceptions.user import UserNotFoundByUsernameError
@@ -40,11 +44,13 @@ class GrantAdminInteractor:
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         transaction_manager: TransactionManager,
+        user_listing_invalidator: UserListingInvalidator,
     ):
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
+        self._user_listing_invalidator = user_listing_invalidator
 
     async def execute(self, request_data: GrantAdminRequest) -> None:
         """
@@ -54,6 +60,7 @@ class GrantAdminInteractor:
         :raises DomainFieldError:
         :raises UserNotFoundByUsernameError:
         :raises RoleChangeNotPermittedError:
+        :raises ConcurrentUpdateError:
         """
         log.info(
             "Grant admin: started. Username: '%s'.",
@@ -71,14 +78,24 @@ class GrantAdminInteractor:
         )
 
         username = Username(request_data.username)
-        user: User | None = await self._user_command_gateway.read_by_username(
-            username,
-            for_update=True,
+        user = await write_optimistically(
+            self._transaction_manager,
+            lambda: self._grant_admin(username),
         )
+        await self._transaction_manager.commit()
+        self._user_listing_invalidator.invalidate()
+
+        log.info("Grant admin: done. Username: '%s'.", user.username.value)
+
+    async def _grant_admin(self, username: Username) -> User:
+        """
+        :raises DataMapperError:
+        :raises UserNotFoundByUsernameError:
+        :raises RoleChangeNotPermittedError:
+        """
+        user: User | None = await self._user_command_gateway.read_by_username(username)
         if user is None:
             raise UserNotFoundByUsernameError(username)
 
         self._user_service.toggle_user_admin_role(user, is_admin=True)
-        await self._transaction_manager.commit()
-
-        log.info("Grant admin: done. Username: '%s'.", user.username.value)
+        return user
@@ -0,0 +1,243 @@
+import logging
+from collections.abc import AsyncIterable, Sequence
+from dataclasses import dataclass
+from typing import Final, TypedDict
+
+from app.application.common.exceptions.user_import import UserImportTooLargeError
+from app.application.common.ports.transaction_manager import (
+    TransactionManager,
+)
+from app.application.common.ports.user_importer import ImportedUser, UserImporter
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    RoleManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.entities.user import User
+from app.domain.enums.user_type import UserRole
+from app.domain.exceptions.base import DomainFieldError
+from app.domain.exceptions.user import (
+    RoleAssignmentNotPermittedError,
+    UsernameAlreadyExistsError,
+)
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.ports.user_id_generator import UserIdGenerator
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.domain.value_objects.user_id import UserId
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from app.domain.value_objects.username.username import Username
+
+log = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE: Final[int] = 1_000
+IMPORT_MAX_ROWS: Final[int] = 100_000
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserImportRow:
+    """
+    A record as decoded from the import stream.
+    `error` is set for records that couldn't be decoded.
+    """
+
+    line: int
+    username: str = ""
+    password: str = ""
+    role: str | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _ValidatedRow:
+    line: int
+    username: Username
+    password: RawPassword
+    role: UserRole
+
+
+class UserImportIssue(TypedDict):
+    line: int
+    reason: str
+
+
+class ImportUsersResponse(TypedDict):
+    imported: int
+    rejected: list[UserImportIssue]
+    conflicts: list[UserImportIssue]
+
+
+class ImportUsersInteractor:
+    """
+    - Open to admins.
+    - Creates users in bulk from an NDJSON or CSV stream,
+    with the `user` role unless a record sets another one.
+    - Only super admins can import admins.
+    - Invalid records are rejected and existing usernames are skipped,
+    both reported by line; every other record is imported in one transaction.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_id_generator: UserIdGenerator,
+        password_hasher: PasswordHasher,
+        user_importer: UserImporter,
+        transaction_manager: TransactionManager,
+        user_listing_invalidator: UserListingInvalidator,
+    ):
+        self._current_user_service = current_user_service
+        self._user_id_generator = user_id_generator
+        self._password_hasher = password_hasher
+        self._user_importer = user_importer
+        self._transaction_manager = transaction_manager
+        self._user_listing_invalidator = user_listing_invalidator
+
+    async def execute(self, rows: AsyncIterable[UserImportRow]) -> ImportUsersResponse:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises PasswordHasherBusyError:
+        :raises UserImportTooLargeError:
+        """
+        log.info("Import users: started.")
+
+        current_user = await self._current_user_service.get_current_user()
+        self._authorize_role(current_user, UserRole.USER)
+        authorized_roles = {UserRole.USER}
+
+        rejected: list[UserImportIssue] = []
+        seen_usernames: set[str] = set()
+        batch: list[_ValidatedRow] = []
+        n_staged = 0
+        n_rows = 0
+        async for row in rows:
+            n_rows += 1
+            if n_rows > IMPORT_MAX_ROWS:
+                raise UserImportTooLargeError(
+                    f"Import is limited to {IMPORT_MAX_ROWS} records.",
+                )
+
+            validated = self._validate(row, seen_usernames, rejected)
+            if validated is None:
+                continue
+
+            if validated.role not in authorized_roles:
+                self._authorize_role(current_user, validated.role)
+                authorized_roles.add(validated.role)
+
+            batch.append(validated)
+            if len(batch) == IMPORT_BATCH_SIZE:
+                await self._stage(batch)
+                n_staged += len(batch)
+                batch = []
+
+        if batch:
+            await self._stage(batch)
+            n_staged += len(batch)
+
+        conflicts = await self._user_importer.merge()
+        await self._transaction_manager.commit()
+        self._user_listing_invalidator.invalidate()
+
+        imported = n_staged - len(conflicts)
+        log.info(
+            "Import users: done. Imported: %d, rejected: %d, conflicts: %d.",
+            imported,
+            len(rejected),
+            len(conflicts),
+        )
+        return ImportUsersResponse(
+            imported=imported,
+            rejected=rejected,
+            conflicts=[
+                UserImportIssue(
+                    line=conflict.line,
+                    reason=str(UsernameAlreadyExistsError(conflict.username)),
+                )
+                for conflict in conflicts
+            ],
+        )
+
+    @staticmethod
+    def _authorize_role(current_user: User, role: UserRole) -> None:
+        """
+        :raises AuthorizationError:
+        """
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=role,
+            ),
+        )
+
+    @staticmethod
+    def _validate(
+        row: UserImportRow,
+        seen_usernames: set[str],
+        rejected: list[UserImportIssue],
+    ) -> _ValidatedRow | None:
+        """
+        :returns: `None` if the row is rejected, after reporting it.
+        """
+        if row.error is not None:
+            rejected.append(UserImportIssue(line=row.line, reason=row.error))
+            return None
+
+        if row.role is not None and row.role not in UserRole:
+            reason = f"Unknown role {row.role!r}."
+            rejected.append(UserImportIssue(line=row.line, reason=reason))
+            return None
+
+        try:
+            username = Username(row.username)
+            password = RawPassword(row.password)
+            role = UserRole.USER if row.role is None else UserRole(row.role)
+            if not role.is_assignable:
+                raise RoleAssignmentNotPermittedError(role)
+
+        except (DomainFieldError, RoleAssignmentNotPermittedError) as error:
+            rejected.append(UserImportIssue(line=row.line, reason=str(error)))
+            return None
+
+        if username.value in seen_usernames:
+            reason = f"Username {username.value!r} is repeated in the import."
+            rejected.append(UserImportIssue(line=row.line, reason=reason))
+            return None
+
+        seen_usernames.add(username.value)
+        return _ValidatedRow(
+            line=row.line,
+            username=username,
+            password=password,
+            role=role,
+        )
+
+    async def _stage(self, batch: Sequence[_ValidatedRow]) -> None:
+        """
+        :raises DataMapperError:
+        :raises PasswordHasherBusyError:
+        """
+        password_hashes = await self._password_hasher.hash_many(
+            [row.password for row in batch],
+        )
+        await self._user_importer.stage(
+            [
+                ImportedUser(
+                    line=row.line,
+                    id_=UserId(self._user_id_generator()),
+                    username=row.username,
+                    password_hash=UserPasswordHash(password_hash),
+                    role=row.role,
+                )
+                for row, password_hash in zip(batch, password_hashes, strict=True)
+            ],
+        )
+        log.debug("Import users: staged %d users.", len(batch))
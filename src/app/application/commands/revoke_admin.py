@@ -5,12 +5,16 @@ from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
 from app.application.common.services.authorization.authorize import authorize
 from app.application.common.services.authorization.permissions import (
     CanManageRole,
     RoleManagementContext,
 )
 from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.optimistic_write import write_optimistically
 from app.domain.entities.user import User
 from app.domain.enums.user_type import UserRole
 from app.domain.exceptions.user import UserNotFoundByUsernameError
@@ -38,11 +42,13 @@ class RevokeAdminInteractor:
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         transaction_manager: TransactionManager,
+        user_listing_invalidator: UserListingInvalidator,
     ):
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
+        self._user_listing_invalidator = user_listing_invalidator
 
     async def execute(self, request_data: RevokeAdminRequest) -> None:
         """
@@ -52,6 +58,7 @@ class RevokeAdminInteractor:
         :raises DomainFieldError:
         :raises UserNotFoundByUsernameError:
         :raises RoleChangeNotPermittedError:
+        :raises ConcurrentUpdateError:
         """
         log.info(
             "Revoke admin: started. Username: '%s'.",
@@ -69,17 +76,27 @@ class RevokeAdminInteractor:
         )
 
         username = Username(request_data.username)
-        user: User | None = await self._user_command_gateway.read_by_username(
-            username,
-            for_update=True,
+        user = await write_optimistically(
+            self._transaction_manager,
+            lambda: self._revoke_admin(username),
         )
-        if user is None:
-            raise UserNotFoundByUsernameError(username)
-
-        self._user_service.toggle_user_admin_role(user, is_admin=False)
         await self._transaction_manager.commit()
+        self._user_listing_invalidator.invalidate()
 
         log.info(
             "Revoke admin: done. Username: '%s'.",
             user.username.value,
         )
+
+    async def _revoke_admin(self, username: Username) -> User:
+        """
+        :raises DataMapperError:
+        :raises UserNotFoundByUsernameError:
+        :raises RoleChangeNotPermittedError:
+        """
+        user: User | None = await self._user_command_gateway.read_by_username(username)
+        if user is None:
+            raise UserNotFoundByUsernameError(username)
+
+        self._user_service.toggle_user_admin_role(user, is_admin=False)
+        return user
@@ -0,0 +1,5 @@
+from app.application.common.exceptions.base import ApplicationError
+
+
+class EmptySelectionError(ApplicationError):
+    pass
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
 from app.domain.value_objects.user_id import UserId
@@ -10,3 +11,9 @@ class AccessRevoker(Protocol):
         """
         :raises DataMapperError:
         """
+
+    @abstractmethod
+    async def remove_all_users_access(self, user_ids: Sequence[UserId]) -> None:
+        """
+        :raises DataMapperError:
+        """
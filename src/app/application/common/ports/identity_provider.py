@@ -1,6 +1,7 @@
 from abc import abstractmethod
 from typing import Protocol
 
+from app.domain.entities.user import User
 from app.domain.value_objects.user_id import UserId
 
 
@@ -10,3 +11,11 @@ class IdentityProvider(Protocol):
         """
         :raises AuthenticationError:
         """
+
+    @abstractmethod
+    def get_loaded_current_user(self) -> User | None:
+        """
+        Returns the current user if resolving the identity already loaded it,
+        otherwise it has to be read by ID.
+        Only meaningful after `get_current_user_id`.
+        """
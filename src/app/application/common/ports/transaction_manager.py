@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from contextlib import AbstractAsyncContextManager
 from typing import Protocol
 
 
@@ -16,3 +17,15 @@ class TransactionManager(Protocol):
 
         :raises DataMapperError:
         """
+
+    @abstractmethod
+    def savepoint(self) -> AbstractAsyncContextManager[None]:
+        """
+        Scope for changes that can be undone on their own.
+        They're written on leaving the scope; if writing fails,
+        only they are undone and the business transaction carries on.
+        Changes must be made inside the scope, not before it.
+
+        :raises DataMapperError:
+        :raises ConcurrentUpdateError:
+        """
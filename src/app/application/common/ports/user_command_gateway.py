@@ -1,7 +1,10 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
+from app.application.common.query_params.user import UserListFilters
 from app.domain.entities.user import User
+from app.domain.enums.user_type import UserRole
 from app.domain.value_objects.user_id import UserId
 from app.domain.value_objects.username.username import Username
 
@@ -20,11 +23,38 @@ class UserCommandGateway(Protocol):
         """
 
     @abstractmethod
-    async def read_by_username(
+    async def read_by_username(self, username: Username) -> User | None:
+        """
+        Takes no row lock: writes to the user are checked against its version
+        as it was read, see `TransactionManager.savepoint`.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def read_many_for_update(
+        self,
+        *,
+        usernames: Sequence[Username] | None,
+        filters: UserListFilters,
+    ) -> list[User]:
+        """
+        Locks every user matching both `usernames`, if given, and `filters`.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def update_many(
         self,
-        username: Username,
-        for_update: bool = False,
-    ) -> User | None:
+        user_ids: Sequence[UserId],
+        *,
+        is_active: bool | None = None,
+        role: UserRole | None = None,
+    ) -> None:
         """
+        Sets the given values on all `user_ids` in one statement.
+        Users already read in the same transaction reflect the new values.
+
         :raises DataMapperError:
         """
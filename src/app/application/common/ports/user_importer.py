@@ -0,0 +1,46 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from app.domain.enums.user_type import UserRole
+from app.domain.value_objects.user_id import UserId
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from app.domain.value_objects.username.username import Username
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImportedUser:
+    line: int
+    id_: UserId
+    username: Username
+    password_hash: UserPasswordHash
+    role: UserRole
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserImportConflict:
+    line: int
+    username: str
+
+
+class UserImporter(Protocol):
+    """
+    Loads users in two steps within the current transaction:
+    batches are staged as they arrive, then merged into users at once.
+    """
+
+    @abstractmethod
+    async def stage(self, users: Sequence[ImportedUser]) -> None:
+        """
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def merge(self) -> list[UserImportConflict]:
+        """
+        Inserts every staged user whose username isn't taken yet.
+
+        :returns: Staged users that were skipped, by line.
+        :raises DataMapperError:
+        """
@@ -0,0 +1,10 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class UserListingInvalidator(Protocol):
+    @abstractmethod
+    def invalidate(self) -> None:
+        """
+        Discards cached user listing data once a change to users is committed.
+        """
@@ -1,8 +1,13 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from typing import Protocol
 
-from app.application.common.query_models.user import UserQueryModel
-from app.application.common.query_params.user import UserListParams
+from app.application.common.query_models.user import UserQueryCount, UserQueryPage
+from app.application.common.query_params.user import (
+    UserExportFormat,
+    UserListFilters,
+    UserListParams,
+)
 
 
 class UserQueryGateway(Protocol):
@@ -10,7 +15,28 @@ class UserQueryGateway(Protocol):
     async def read_all(
         self,
         user_read_all_params: UserListParams,
-    ) -> list[UserQueryModel] | None:
+    ) -> UserQueryPage | None:
         """
         :raises ReaderError:
         """
+
+    @abstractmethod
+    async def count_all(self, filters: UserListFilters) -> UserQueryCount:
+        """
+        May be inexact for large results, as reported by `is_exact`.
+
+        :raises ReaderError:
+        """
+
+    @abstractmethod
+    def export_all(
+        self,
+        filters: UserListFilters,
+        export_format: UserExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """
+        Streams matching users as serialized chunks, ordered by ID.
+        Nothing is read until iteration starts.
+
+        :raises ReaderError:
+        """
@@ -1,6 +1,7 @@
 from typing import TypedDict
 from uuid import UUID
 
+from app.application.common.query_params.pagination import KeysetPosition
 from app.domain.enums.user_type import UserRole
 
 
@@ -9,3 +10,13 @@ class UserQueryModel(TypedDict):
     username: str
     role: UserRole
     is_active: bool
+
+
+class UserQueryPage(TypedDict):
+    users: list[UserQueryModel]
+    next_position: KeysetPosition | None
+
+
+class UserQueryCount(TypedDict):
+    total: int
+    is_exact: bool
@@ -0,0 +1,55 @@
+import base64
+import binascii
+import json
+from uuid import UUID
+
+from app.application.common.exceptions.query import PaginationError
+from app.application.common.query_params.pagination import KeysetPosition
+from app.application.common.query_params.sorting import SortingOrder
+
+
+def encode_cursor(
+    position: KeysetPosition,
+    *,
+    sorting_field: str,
+    sorting_order: SortingOrder,
+) -> str:
+    """
+    Opaque to clients. Records the sorting it was issued for,
+    so it can't be replayed against a different order.
+    """
+    sorting_value = position.sorting_value
+    payload = {
+        "field": sorting_field,
+        "order": sorting_order.value,
+        "value": (
+            str(sorting_value) if isinstance(sorting_value, UUID) else sorting_value
+        ),
+        "id": str(position.id_),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(
+    cursor: str,
+    *,
+    sorting_field: str,
+    sorting_order: SortingOrder,
+) -> tuple[object, UUID]:
+    """
+    :returns: raw sorting value and ID of the last row of the previous page.
+    :raises PaginationError:
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        field, order = payload["field"], payload["order"]
+        sorting_value, id_ = payload["value"], UUID(payload["id"])
+
+    except (binascii.Error, ValueError, TypeError, KeyError) as error:
+        raise PaginationError("Invalid cursor") from error
+
+    if field != sorting_field or order != sorting_order.value:
+        raise PaginationError("Cursor was issued for a different sorting")
+    return sorting_value, id_
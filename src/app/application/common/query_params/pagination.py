@@ -1,7 +1,21 @@
 from dataclasses import dataclass
+from uuid import UUID
 
 from app.application.common.exceptions.query import PaginationError
 
+SortingValue = UUID | str | bool
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KeysetPosition:
+    """
+    Sort key of the last row of a page, with the ID breaking ties,
+    so the next page starts strictly after it.
+    """
+
+    sorting_value: SortingValue
+    id_: UUID
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class Pagination:
@@ -11,9 +25,12 @@ class Pagination:
 
     limit: int
     offset: int
+    after: KeysetPosition | None = None
 
     def __post_init__(self):
         if self.limit <= 0:
             raise PaginationError(f"Limit must be greater than 0, got {self.limit}")
         if self.offset < 0:
             raise PaginationError(f"Offset must be non-negative, got {self.offset}")
+        if self.after is not None and self.offset:
+            raise PaginationError("Offset can't be combined with a cursor")
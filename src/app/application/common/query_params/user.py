@@ -1,7 +1,11 @@
 from dataclasses import dataclass
+from enum import StrEnum
+from uuid import UUID
 
-from app.application.common.query_params.pagination import Pagination
+from app.application.common.exceptions.query import PaginationError, SortingError
+from app.application.common.query_params.pagination import Pagination, SortingValue
 from app.application.common.query_params.sorting import SortingOrder
+from app.domain.enums.user_type import UserRole
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -10,7 +14,51 @@ class UserListSorting:
     sorting_order: SortingOrder
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserListFilters:
+    """
+    Unset filters match every user. Username filters are case-insensitive.
+    """
+
+    role: UserRole | None = None
+    is_active: bool | None = None
+    username_prefix: str | None = None
+    username_contains: str | None = None
+
+
+class UserExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 @dataclass(frozen=True, slots=True)
 class UserListParams:
     pagination: Pagination
     sorting: UserListSorting
+    filters: UserListFilters = UserListFilters()
+
+
+def parse_user_sorting_value(sorting_field: str, raw_value: object) -> SortingValue:
+    """
+    Restores a sorting value read from a cursor to the field's type.
+
+    :raises PaginationError:
+    :raises SortingError:
+    """
+    try:
+        match sorting_field:
+            case "id" if isinstance(raw_value, str):
+                return UUID(raw_value)
+            case "username" if isinstance(raw_value, str):
+                return raw_value
+            case "role" if isinstance(raw_value, str):
+                return UserRole(raw_value)
+            case "is_active" if isinstance(raw_value, bool):
+                return raw_value
+            case "id" | "username" | "role" | "is_active":
+                raise PaginationError("Invalid cursor")
+
+    except ValueError as error:
+        raise PaginationError("Invalid cursor") from error
+
+    raise SortingError("Invalid sorting field for cursor pagination.")
@@ -35,7 +35,9 @@ class CurrentUserService:
             return self._cached_current_user
 
         current_user_id = await self._identity_provider.get_current_user_id()
-        user: User | None = await self._user_command_gateway.read_by_id(current_user_id)
+        user: User | None = self._identity_provider.get_loaded_current_user()
+        if user is None:
+            user = await self._user_command_gateway.read_by_id(current_user_id)
         if user is None:
             log.warning("%s ID: %s.", AUTHZ_NO_CURRENT_USER, current_user_id)
             await self._access_revoker.remove_all_user_access(current_user_id)
@@ -0,0 +1,43 @@
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Final
+
+from app.application.common.exceptions.concurrency import ConcurrentUpdateError
+from app.application.common.ports.transaction_manager import (
+    TransactionManager,
+)
+
+log = logging.getLogger(__name__)
+
+OPTIMISTIC_WRITE_ATTEMPTS: Final[int] = 3
+
+
+async def write_optimistically[T](
+    transaction_manager: TransactionManager,
+    operation: Callable[[], Awaitable[T]],
+    *,
+    attempts: int = OPTIMISTIC_WRITE_ATTEMPTS,
+) -> T:
+    """
+    Runs a read-modify-write `operation` without row locks, in a savepoint.
+    If a user it changed was changed concurrently since it was read,
+    its changes are undone and it's run again from a fresh read,
+    up to `attempts` times. The caller commits.
+
+    :raises ConcurrentUpdateError:
+    """
+    attempt = 1
+    while True:
+        try:
+            async with transaction_manager.savepoint():
+                return await operation()
+
+        except ConcurrentUpdateError:
+            if attempt >= attempts:
+                raise
+            log.info(
+                "Optimistic write: concurrent update, retrying. Attempt %d of %d.",
+                attempt,
+                attempts,
+            )
+            attempt += 1
@@ -0,0 +1,79 @@
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from app.application.common.ports.user_query_gateway import UserQueryGateway
+from app.application.common.query_params.user import (
+    UserExportFormat,
+    UserListFilters,
+)
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    RoleManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.enums.user_type import UserRole
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExportUsersRequest:
+    export_format: UserExportFormat
+    role: UserRole | None = None
+    is_active: bool | None = None
+    username_prefix: str | None = None
+    username_contains: str | None = None
+
+
+class ExportUsersQueryService:
+    """
+    - Open to admins.
+    - Streams every matching user as NDJSON or CSV in a single response,
+    with the same filters as the user list.
+    - Rows are read through a server-side cursor and written in batches,
+    so memory use doesn't depend on the number of users.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_query_gateway: UserQueryGateway,
+    ):
+        self._current_user_service = current_user_service
+        self._user_query_gateway = user_query_gateway
+
+    async def execute(self, request_data: ExportUsersRequest) -> AsyncIterator[bytes]:
+        """
+        Authorizes before returning, so errors are raised
+        before any part of the export is sent.
+
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        """
+        log.info("Export users: started. Format: '%s'.", request_data.export_format)
+
+        current_user = await self._current_user_service.get_current_user()
+
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.USER,
+            ),
+        )
+
+        filters = UserListFilters(
+            role=request_data.role,
+            is_active=request_data.is_active,
+            username_prefix=request_data.username_prefix,
+            username_contains=request_data.username_contains,
+        )
+        return self._user_query_gateway.export_all(
+            filters,
+            request_data.export_format,
+        )
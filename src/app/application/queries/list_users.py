@@ -4,12 +4,15 @@ from typing import TypedDict
 
 from app.application.common.exceptions.query import SortingError
 from app.application.common.ports.user_query_gateway import UserQueryGateway
-from app.application.common.query_models.user import UserQueryModel
-from app.application.common.query_params.pagination import Pagination
+from app.application.common.query_models.user import UserQueryModel, UserQueryPage
+from app.application.common.query_params.cursor import decode_cursor, encode_cursor
+from app.application.common.query_params.pagination import KeysetPosition, Pagination
 from app.application.common.query_params.sorting import SortingOrder
 from app.application.common.query_params.user import (
+    UserListFilters,
     UserListParams,
     UserListSorting,
+    parse_user_sorting_value,
 )
 from app.application.common.services.authorization.authorize import (
     authorize,
@@ -30,16 +33,31 @@ class ListUsersRequest:
     offset: int
     sorting_field: str
     sorting_order: SortingOrder
+    cursor: str | None = None
+    role: UserRole | None = None
+    is_active: bool | None = None
+    username_prefix: str | None = None
+    username_contains: str | None = None
 
 
 class ListUsersResponse(TypedDict):
     users: list[UserQueryModel]
+    next_cursor: str | None
+    total: int
+    is_total_exact: bool
 
 
 class ListUsersQueryService:
     """
     - Open to admins.
     - Retrieves a paginated list of existing users with relevant information.
+    - Filters by role, activity and username prefix or substring.
+    - Reports the total number of matching users; for large results
+    `is_total_exact` is false and the total is an estimate, or,
+    when filtered, a lower bound.
+    - Pages by offset, or, given the `next_cursor` of the previous page,
+    starts right after its last user: deep pages stay as fast as the first
+    and don't shift when users are added or removed.
     """
 
     def __init__(
@@ -72,28 +90,72 @@ class ListUsersQueryService:
         )
 
         log.debug("Retrieving list of users.")
+        filters = UserListFilters(
+            role=request_data.role,
+            is_active=request_data.is_active,
+            username_prefix=request_data.username_prefix,
+            username_contains=request_data.username_contains,
+        )
         user_list_params = UserListParams(
             pagination=Pagination(
                 limit=request_data.limit,
                 offset=request_data.offset,
+                after=self._read_cursor(request_data),
             ),
             sorting=UserListSorting(
                 sorting_field=request_data.sorting_field,
                 sorting_order=request_data.sorting_order,
             ),
+            filters=filters,
         )
 
-        users: list[UserQueryModel] | None = await self._user_query_gateway.read_all(
+        page: UserQueryPage | None = await self._user_query_gateway.read_all(
             user_list_params,
         )
-        if users is None:
+        if page is None:
             log.error(
                 "Retrieving list of users failed: invalid sorting column '%s'.",
                 request_data.sorting_field,
             )
             raise SortingError("Invalid sorting field.")
 
-        response = ListUsersResponse(users=users)
+        count = await self._user_query_gateway.count_all(filters)
+        next_position = page["next_position"]
+        response = ListUsersResponse(
+            users=page["users"],
+            next_cursor=(
+                None
+                if next_position is None
+                else encode_cursor(
+                    next_position,
+                    sorting_field=request_data.sorting_field,
+                    sorting_order=request_data.sorting_order,
+                )
+            ),
+            total=count["total"],
+            is_total_exact=count["is_exact"],
+        )
 
         log.info("List users: done.")
         return response
+
+    def _read_cursor(self, request_data: ListUsersRequest) -> KeysetPosition | None:
+        """
+        :raises PaginationError:
+        :raises SortingError:
+        """
+        if request_data.cursor is None:
+            return None
+
+        raw_sorting_value, id_ = decode_cursor(
+            request_data.cursor,
+            sorting_field=request_data.sorting_field,
+            sorting_order=request_data.sorting_order,
+        )
+        return KeysetPosition(
+            sorting_value=parse_user_sorting_value(
+                request_data.sorting_field,
+                raw_sorting_value,
+            ),
+            id_=id_,
+        )
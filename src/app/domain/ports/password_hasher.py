@@ -1,12 +1,34 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
 from app.domain.value_objects.raw_password.raw_password import RawPassword
 
 
 class PasswordHasher(Protocol):
+    """
+    Async, so that slow hashing can run off the event loop.
+    """
+
+    @abstractmethod
+    async def hash(self, raw_password: RawPassword) -> bytes: ...
+
+    @abstractmethod
+    async def hash_many(self, raw_passwords: Sequence[RawPassword]) -> list[bytes]:
+        """
+        For bulk work. Hashes are returned in the order of `raw_passwords`.
+        """
+
     @abstractmethod
-    def hash(self, raw_password: RawPassword) -> bytes: ...
+    async def verify(
+        self,
+        *,
+        raw_password: RawPassword,
+        hashed_password: bytes,
+    ) -> bool: ...
 
     @abstractmethod
-    def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool: ...
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        """
+        Whether the hash was made with weaker parameters than current ones.
+        """
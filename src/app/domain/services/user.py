@@ -27,7 +27,7 @@ class UserService:
         self._user_id_generator = user_id_generator
         self._password_hasher = password_hasher
 
-    def create_user(
+    async def create_user(
         self,
         *,
         username: Username,
@@ -47,7 +47,9 @@ class UserService:
             raise RoleAssignmentNotPermittedError(role)
 
         user_id = UserId(self._user_id_generator())
-        password_hash = UserPasswordHash(self._password_hasher.hash(raw_password))
+        password_hash = UserPasswordHash(
+            await self._password_hasher.hash(raw_password),
+        )
         return User(
             id_=user_id,
             username=username,
@@ -60,15 +62,23 @@ class UserService:
             balance=balance,
         )
 
-    def is_password_valid(self, user: User, raw_password: RawPassword) -> bool:
-        return self._password_hasher.verify(
+    async def is_password_valid(self, user: User, raw_password: RawPassword) -> bool:
+        return await self._password_hasher.verify(
             raw_password=raw_password,
             hashed_password=user.password_hash.value,
         )
 
-    def change_password(self, user: User, raw_password: RawPassword) -> None:
-        hashed_password = UserPasswordHash(self._password_hasher.hash(raw_password))
-        user.password_hash = hashed_password
+    def needs_password_rehash(self, user: User) -> bool:
+        return self._password_hasher.needs_rehash(user.password_hash.value)
+
+    async def change_password(self, user: User, raw_password: RawPassword) -> None:
+        self.set_password_hash(user, await self.hash_password(raw_password))
+
+    async def hash_password(self, raw_password: RawPassword) -> UserPasswordHash:
+        return UserPasswordHash(await self._password_hasher.hash(raw_password))
+
+    def set_password_hash(self, user: User, password_hash: UserPasswordHash) -> None:
+        user.password_hash = password_hash
 
     def toggle_user_activation(self, user: User, *, is_active: bool) -> None:
         """
@@ -6,3 +6,5 @@ DB_COMMIT_FAILED: Final[str] = "Commit failed."
 DB_FLUSH_DONE: Final[str] = "Flush was done."
 DB_FLUSH_FAILED: Final[str] = "Flush failed."
 DB_QUERY_FAILED: Final[str] = "Database query failed."
+DB_REPLICA_LAG_CHECK_FAILED: Final[str] = "Replica lag check failed."
+DB_CONCURRENT_UPDATE: Final[str] = "Row was changed concurrently since it was read."
@@ -1,13 +1,19 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.application.common.exceptions.concurrency import ConcurrentUpdateError
 from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.infrastructure.adapters.constants import (
     DB_COMMIT_DONE,
     DB_COMMIT_FAILED,
+    DB_CONCURRENT_UPDATE,
+    DB_FLUSH_FAILED,
     DB_QUERY_FAILED,
 )
 from app.infrastructure.adapters.types import MainAsyncSession
@@ -30,3 +36,24 @@ class SqlaMainTransactionManager(TransactionManager):
 
         except SQLAlchemyError as error:
             raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from error
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        """
+        A `SAVEPOINT`, flushed on leaving.
+        A versioned row updated by someone else since it was read
+        fails the flush; rolling back to the savepoint then expires
+        only the objects changed inside it, so they're reloaded on the next read.
+
+        :raises DataMapperError:
+        :raises ConcurrentUpdateError:
+        """
+        try:
+            async with self._session.begin_nested():
+                yield
+
+        except StaleDataError as error:
+            raise ConcurrentUpdateError(DB_CONCURRENT_UPDATE) from error
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(f"{DB_QUERY_FAILED} {DB_FLUSH_FAILED}") from error
@@ -1,21 +1,57 @@
+import asyncio
 import base64
 import hashlib
 import hmac
-from typing import NewType
+from collections.abc import Sequence
+from typing import Final, NewType
 
 import bcrypt
 
 from app.domain.ports.password_hasher import PasswordHasher
 from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.infrastructure.adapters.password_hasher_bcrypt_cost import (
+    BcryptRounds,
+    read_rounds,
+)
+from app.infrastructure.adapters.password_hasher_executor import (
+    PasswordHasherExecutor,
+)
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
 
 PasswordPepper = NewType("PasswordPepper", str)
 
+# Passwords hashed per executor job by `hash_many`.
+BULK_HASH_CHUNK_SIZE: Final[int] = 8
+
+
+def _hash_chunk(peppered_passwords: list[bytes], rounds: int) -> list[bytes]:
+    """
+    Module-level, so that the process pool can pickle it.
+    """
+    return [
+        bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+        for password in peppered_passwords
+    ]
+
 
 class BcryptPasswordHasher(PasswordHasher):
-    def __init__(self, pepper: PasswordPepper):
+    """
+    Peppering is cheap and done inline; the bcrypt rounds themselves
+    run on `PasswordHasherExecutor`, off the event loop.
+    The work factor is configured or calibrated once at startup.
+    """
+
+    def __init__(
+        self,
+        pepper: PasswordPepper,
+        executor: PasswordHasherExecutor,
+        rounds: BcryptRounds,
+    ):
         self._pepper = pepper
+        self._executor = executor
+        self._rounds = rounds
 
-    def hash(self, raw_password: RawPassword) -> bytes:
+    async def hash(self, raw_password: RawPassword) -> bytes:
         """
         Bcrypt is limited to 72-character passwords. Adding a pepper may surpass this character count.
         To keep the input within the 72-character limit, pre-hashing can be employed.
@@ -25,10 +61,43 @@ class BcryptPasswordHasher(PasswordHasher):
         The resulting `base64(hmac-sha256(password, pepper))` string is then ready for bcrypt hashing.
         Salt is added to this string before passing it to `bcrypt` for the final hashing step.
         Inspired by: https://blog.ircmaxell.com/2015/03/security-issue-combining-bcrypt-with.html
+
+        :raises PasswordHasherBusyError:
         """
         base64_hmac_password: bytes = self._add_pepper(raw_password, self._pepper)
-        salt: bytes = bcrypt.gensalt()
-        return bcrypt.hashpw(base64_hmac_password, salt)
+        salt: bytes = bcrypt.gensalt(self._rounds)
+        return await self._executor.run(bcrypt.hashpw, base64_hmac_password, salt)
+
+    async def hash_many(self, raw_passwords: Sequence[RawPassword]) -> list[bytes]:
+        """
+        Passwords are hashed in chunks, one bulk executor job per chunk,
+        so that the bulk workers are kept busy without a job per password.
+        Other requests' jobs wait for at most one chunk instead of the batch.
+        On the first failure, chunks not yet submitted are cancelled.
+
+        :raises PasswordHasherBusyError:
+        """
+        peppered_passwords = [
+            self._add_pepper(raw_password, self._pepper)
+            for raw_password in raw_passwords
+        ]
+        chunks = [
+            peppered_passwords[start : start + BULK_HASH_CHUNK_SIZE]
+            for start in range(0, len(peppered_passwords), BULK_HASH_CHUNK_SIZE)
+        ]
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(
+                        self._executor.run_bulk(_hash_chunk, chunk, self._rounds),
+                    )
+                    for chunk in chunks
+                ]
+
+        except* PasswordHasherBusyError as error_group:
+            raise error_group.exceptions[0] from None
+
+        return [hashed for task in tasks for hashed in task.result()]
 
     @staticmethod
     def _add_pepper(raw_password: RawPassword, pepper: PasswordPepper) -> bytes:
@@ -39,6 +108,26 @@ class BcryptPasswordHasher(PasswordHasher):
         ).digest()
         return base64.b64encode(hmac_password)
 
-    def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool:
+    async def verify(
+        self,
+        *,
+        raw_password: RawPassword,
+        hashed_password: bytes,
+    ) -> bool:
+        """
+        :raises PasswordHasherBusyError:
+        """
         base64_hmac_password: bytes = self._add_pepper(raw_password, self._pepper)
-        return bcrypt.checkpw(base64_hmac_password, hashed_password)
+        return await self._executor.run(
+            bcrypt.checkpw,
+            base64_hmac_password,
+            hashed_password,
+        )
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        """
+        Only hashes weaker than the current work factor are upgraded,
+        so a slower machine calibrating lower never downgrades them.
+        """
+        rounds = read_rounds(hashed_password)
+        return rounds is not None and rounds < self._rounds
@@ -0,0 +1,67 @@
+import math
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Final, NewType
+
+import bcrypt
+
+BcryptRounds = NewType("BcryptRounds", int)
+
+BCRYPT_MIN_ROUNDS: Final[int] = 4
+BCRYPT_MAX_ROUNDS: Final[int] = 31
+CALIBRATION_PASSWORD: Final[bytes] = b"calibration-password"
+MODULAR_CRYPT_PARTS: Final[int] = 4
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BcryptCostConfig:
+    """
+    `rounds` is `None` when the work factor is calibrated at startup.
+    """
+
+    rounds: int | None
+    target_hash_time: timedelta
+    min_rounds: int
+    max_rounds: int
+
+
+def measure_hash_time(rounds: int, samples: int = 1) -> float:
+    """
+    Best of `samples` runs, in seconds.
+    """
+    salt = bcrypt.gensalt(rounds)
+    best = math.inf
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        bcrypt.hashpw(CALIBRATION_PASSWORD, salt)
+        best = min(best, time.perf_counter() - started_at)
+    return best
+
+
+def calibrate_rounds(target_sec: float, min_rounds: int, max_rounds: int) -> int:
+    """
+    Each extra round doubles the hashing time, so a single measurement
+    at `min_rounds` is extrapolated to the largest work factor
+    that stays within the target. Never goes below `min_rounds`.
+    """
+    measure_hash_time(BCRYPT_MIN_ROUNDS)  # warm-up
+    base_sec = measure_hash_time(min_rounds, samples=2)
+    if base_sec >= target_sec:
+        return min_rounds
+
+    extra_rounds = math.floor(math.log2(target_sec / base_sec))
+    return min(min_rounds + extra_rounds, max_rounds)
+
+
+def read_rounds(hashed_password: bytes) -> int | None:
+    """
+    Modular crypt format: `$2b$<rounds>$<salt and hash>`.
+    """
+    parts = hashed_password.split(b"$")
+    if len(parts) != MODULAR_CRYPT_PARTS:
+        return None
+    try:
+        return int(parts[2])
+    except ValueError:
+        return None
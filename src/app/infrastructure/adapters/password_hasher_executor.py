@@ -0,0 +1,106 @@
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Literal
+
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+from app.infrastructure.metrics import MetricsRegistry
+
+PasswordHasherExecutorKind = Literal["thread", "process"]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PasswordHasherExecutorConfig:
+    kind: PasswordHasherExecutorKind
+    max_workers: int
+    max_pending: int
+
+
+class PasswordHasherExecutor:
+    """
+    App-scoped pool running CPU-bound hashing off the event loop.
+    `bcrypt` releases the GIL, so threads scale across cores;
+    processes isolate hashing from the interpreter entirely.
+
+    At most `max_workers + max_pending` jobs are accepted at a time.
+    Beyond that, `PasswordHasherBusyError` is raised immediately instead of
+    queueing without bound, so a login storm sheds load
+    rather than delaying every other request on the worker.
+
+    Bulk jobs of all requests share `max_workers - 1` slots,
+    so one worker is always left to single jobs such as logins
+    when there's more than one.
+    """
+
+    def __init__(
+        self,
+        config: PasswordHasherExecutorConfig,
+        metrics: MetricsRegistry,
+    ):
+        self._executor: Executor
+        if config.kind == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=config.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=config.max_workers,
+                thread_name_prefix="password-hasher",
+            )
+        self._capacity = config.max_workers + config.max_pending
+        self._n_accepted = 0
+        self._bulk_slots = asyncio.Semaphore(max(1, config.max_workers - 1))
+
+        self._in_flight = metrics.gauge(
+            "password_hasher_in_flight",
+            "Hashing jobs running or waiting for a worker.",
+        )
+        self._rejected = metrics.counter(
+            "password_hasher_rejected_total",
+            "Hashing jobs rejected because the pool was saturated.",
+        )
+
+    async def run[*Ts, R](self, fn: Callable[[*Ts], R], *args: *Ts) -> R:
+        """
+        `fn` and its arguments must be picklable for the process pool.
+
+        :raises PasswordHasherBusyError:
+        """
+        if self._n_accepted >= self._capacity:
+            self._rejected.inc()
+            raise PasswordHasherBusyError("Password hasher is saturated.")
+
+        loop = asyncio.get_running_loop()
+        self._acquire()
+        future: Future[R] = self._executor.submit(fn, *args)
+        # Released when the job actually ends, even if the awaiting request
+        # is cancelled, so the bound reflects the pool's real load.
+        future.add_done_callback(lambda _: self._release_threadsafe(loop))
+        return await asyncio.wrap_future(future)
+
+    async def run_bulk[*Ts, R](self, fn: Callable[[*Ts], R], *args: *Ts) -> R:
+        """
+        Waits for a bulk slot, then runs like `run`.
+
+        :raises PasswordHasherBusyError:
+        """
+        async with self._bulk_slots:
+            return await self.run(fn, *args)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _acquire(self) -> None:
+        self._n_accepted += 1
+        self._in_flight.set(self._n_accepted)
+
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop) -> None:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._release)
+
+    def _release(self) -> None:
+        self._n_accepted -= 1
+        self._in_flight.set(self._n_accepted)
@@ -0,0 +1,82 @@
+import logging
+from collections.abc import Iterator
+from datetime import timedelta
+
+from app.infrastructure.adapters.password_hasher_bcrypt_cost import (
+    BcryptCostConfig,
+    BcryptRounds,
+    calibrate_rounds,
+)
+from app.infrastructure.adapters.password_hasher_executor import (
+    PasswordHasherExecutor,
+    PasswordHasherExecutorConfig,
+)
+from app.infrastructure.adapters.user_listing_cache import (
+    MAX_CACHED_COUNTS,
+    UserCountCache,
+    UserCountConfig,
+    UserListingGeneration,
+    UserPageCache,
+    UserPageCacheConfig,
+)
+from app.infrastructure.metrics import MetricsRegistry
+
+log = logging.getLogger(__name__)
+
+
+def get_password_hasher_executor(
+    config: PasswordHasherExecutorConfig,
+    metrics: MetricsRegistry,
+) -> Iterator[PasswordHasherExecutor]:
+    executor = PasswordHasherExecutor(config, metrics)
+    log.debug(
+        "Password hasher executor started: %s pool of %d.",
+        config.kind,
+        config.max_workers,
+    )
+    yield executor
+    log.debug("Shutting down password hasher executor...")
+    executor.shutdown()
+    log.debug("Password hasher executor shut down.")
+
+
+async def get_bcrypt_rounds(
+    config: BcryptCostConfig,
+    executor: PasswordHasherExecutor,
+) -> BcryptRounds:
+    """
+    Calibrates on the hashing pool itself, so the measurement reflects
+    the workers that will actually hash.
+    """
+    if config.rounds is not None:
+        log.info("Bcrypt work factor configured: %d rounds.", config.rounds)
+        return BcryptRounds(config.rounds)
+
+    rounds = await executor.run(
+        calibrate_rounds,
+        config.target_hash_time.total_seconds(),
+        config.min_rounds,
+        config.max_rounds,
+    )
+    log.info(
+        "Bcrypt work factor calibrated: %d rounds for a %d ms target.",
+        rounds,
+        config.target_hash_time // timedelta(milliseconds=1),
+    )
+    return BcryptRounds(rounds)
+
+
+def get_user_count_cache(
+    config: UserCountConfig,
+    generation: UserListingGeneration,
+    metrics: MetricsRegistry,
+) -> UserCountCache:
+    return UserCountCache(config.cache_ttl, MAX_CACHED_COUNTS, generation, metrics)
+
+
+def get_user_page_cache(
+    config: UserPageCacheConfig,
+    generation: UserListingGeneration,
+    metrics: MetricsRegistry,
+) -> UserPageCache:
+    return UserPageCache(config.ttl, config.max_entries, generation, metrics)
@@ -1,18 +1,43 @@
-from sqlalchemy import Select, select
+from collections.abc import Sequence
+
+from sqlalchemy import ColumnElement, Select, Update, any_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.query_params.user import UserListFilters
 from app.domain.entities.user import User
+from app.domain.enums.user_type import UserRole
 from app.domain.value_objects.user_id import UserId
 from app.domain.value_objects.username.username import Username
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.user_filters_sqla import (
+    FilterShape,
+    filter_criteria,
+    filter_params,
+    filter_shape,
+)
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+from app.infrastructure.persistence_sqla.statement_registry import (
+    SqlaStatementRegistry,
+)
 
 
 class SqlaUserDataMapper(UserCommandGateway):
-    def __init__(self, session: MainAsyncSession):
+    """
+    Lookups filter on table columns with bound parameters,
+    since composite attributes only compare to value objects.
+    """
+
+    def __init__(
+        self,
+        session: MainAsyncSession,
+        statements: SqlaStatementRegistry,
+    ):
         self._session = session
+        self._statements = statements
 
     def add(self, user: User) -> None:
         """
@@ -28,11 +53,14 @@ class SqlaUserDataMapper(UserCommandGateway):
         """
         :raises DataMapperError:
         """
-        select_stmt: Select[tuple[User]] = select(User).where(User.id_ == user_id)  # type: ignore
+        select_stmt: Select[tuple[User]] = self._statements.get(
+            ("user_by_id",),
+            lambda: select(User).where(users_table.c.id == bindparam("user_id")),
+        )
 
         try:
             user: User | None = (
-                await self._session.execute(select_stmt)
+                await self._session.execute(select_stmt, {"user_id": user_id.value})
             ).scalar_one_or_none()
 
             return user
@@ -40,25 +68,128 @@ class SqlaUserDataMapper(UserCommandGateway):
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
-    async def read_by_username(
-        self,
-        username: Username,
-        for_update: bool = False,
-    ) -> User | None:
+    async def read_by_username(self, username: Username) -> User | None:
         """
         :raises DataMapperError:
         """
-        select_stmt: Select[tuple[User]] = select(User).where(User.username == username)  # type: ignore
-
-        if for_update:
-            select_stmt = select_stmt.with_for_update()
+        select_stmt: Select[tuple[User]] = self._statements.get(
+            ("user_by_username",),
+            lambda: select(User).where(
+                users_table.c.username == bindparam("username"),
+            ),
+        )
 
         try:
             user: User | None = (
-                await self._session.execute(select_stmt)
+                await self._session.execute(select_stmt, {"username": username.value})
             ).scalar_one_or_none()
 
             return user
 
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def read_many_for_update(
+        self,
+        *,
+        usernames: Sequence[Username] | None,
+        filters: UserListFilters,
+    ) -> list[User]:
+        """
+        Usernames are bound as one array parameter,
+        so the statement doesn't depend on how many there are.
+
+        :raises DataMapperError:
+        """
+        has_usernames = usernames is not None
+        shape = filter_shape(filters)
+        select_stmt: Select[tuple[User]] = self._statements.get(
+            ("users_for_update", has_usernames, shape),
+            lambda: _build_select_many_for_update(
+                has_usernames=has_usernames,
+                filter_shape=shape,
+            ),
+        )
+        params = filter_params(filters)
+        if usernames is not None:
+            params["usernames"] = [username.value for username in usernames]
+
+        try:
+            return list((await self._session.execute(select_stmt, params)).scalars())
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def update_many(
+        self,
+        user_ids: Sequence[UserId],
+        *,
+        is_active: bool | None = None,
+        role: UserRole | None = None,
+    ) -> None:
+        """
+        :raises DataMapperError:
+        """
+        values: dict[str, object] = {}
+        if is_active is not None:
+            values["is_active"] = is_active
+        if role is not None:
+            values["role"] = role
+
+        update_stmt: Update = self._statements.get(
+            ("users_update_many", *sorted(values)),
+            lambda: _build_update_many(sorted(values)),
+        )
+
+        try:
+            await self._session.execute(
+                update_stmt,
+                {"user_ids": [user_id.value for user_id in user_ids], **values},
+            )
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+
+def _build_select_many_for_update(
+    *,
+    has_usernames: bool,
+    filter_shape: FilterShape,
+) -> Select[tuple[User]]:
+    criteria: list[ColumnElement[bool]] = filter_criteria(filter_shape)
+    if has_usernames:
+        criteria.append(
+            users_table.c.username
+            == any_(bindparam("usernames", type_=ARRAY(users_table.c.username.type))),
+        )
+    # Locking in `id` order keeps concurrent bulk operations from deadlocking.
+    return (
+        select(User)
+        .where(*criteria)
+        .order_by(users_table.c.id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+
+
+def _build_update_many(fields: Sequence[str]) -> Update:
+    """
+    Users loaded in the session are updated from `RETURNING`
+    instead of being left with stale values.
+    The version is bumped as the mapper would for a single user,
+    so optimistic writes that read the users before fail.
+    """
+    return (
+        update(User)
+        .where(
+            users_table.c.id
+            == any_(bindparam("user_ids", type_=ARRAY(users_table.c.id.type)))
+        )
+        .values(
+            {
+                **{field: bindparam(field) for field in fields},
+                users_table.c.version: users_table.c.version + 1,
+            },
+        )
+        .execution_options(synchronize_session="fetch")
+    )
@@ -0,0 +1,67 @@
+from typing import Final
+
+from sqlalchemy import ColumnElement, bindparam
+
+from app.application.common.query_params.user import UserListFilters
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+
+LIKE_ESCAPE: Final[str] = "/"
+
+# Which of role, activity, username prefix and substring filters are set.
+FilterShape = tuple[bool, bool, bool, bool]
+
+
+def filter_shape(filters: UserListFilters) -> FilterShape:
+    return (
+        filters.role is not None,
+        filters.is_active is not None,
+        filters.username_prefix is not None,
+        filters.username_contains is not None,
+    )
+
+
+def filter_criteria(shape: FilterShape) -> list[ColumnElement[bool]]:
+    """
+    Username patterns are matched with `ILIKE`, served by the trigram index;
+    wildcards in the input are escaped by `filter_params`.
+    """
+    has_role, has_is_active, has_prefix, has_substring = shape
+    criteria: list[ColumnElement[bool]] = []
+    if has_role:
+        criteria.append(users_table.c.role == bindparam("role"))
+    if has_is_active:
+        criteria.append(users_table.c.is_active == bindparam("is_active"))
+    if has_prefix:
+        criteria.append(
+            users_table.c.username.istartswith(
+                bindparam("username_prefix"),
+                escape=LIKE_ESCAPE,
+            ),
+        )
+    if has_substring:
+        criteria.append(
+            users_table.c.username.icontains(
+                bindparam("username_contains"),
+                escape=LIKE_ESCAPE,
+            ),
+        )
+    return criteria
+
+
+def filter_params(filters: UserListFilters) -> dict[str, object]:
+    params: dict[str, object] = {}
+    if filters.role is not None:
+        params["role"] = filters.role
+    if filters.is_active is not None:
+        params["is_active"] = filters.is_active
+    if filters.username_prefix is not None:
+        params["username_prefix"] = escape_like(filters.username_prefix)
+    if filters.username_contains is not None:
+        params["username_contains"] = escape_like(filters.username_contains)
+    return params
+
+
+def escape_like(value: str) -> str:
+    for char in (LIKE_ESCAPE, "%", "_"):
+        value = value.replace(char, LIKE_ESCAPE + char)
+    return value
@@ -0,0 +1,160 @@
+from collections.abc import Sequence
+from typing import Any, Final, cast
+
+import psycopg
+from sqlalchemy import (
+    UUID,
+    Column,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    cast as sql_cast,
+    literal,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import CreateTable
+
+from app.application.common.ports.user_importer import (
+    ImportedUser,
+    UserImportConflict,
+    UserImporter,
+)
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.drivers import PostgresDriver
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+
+# Kept out of the mapping metadata, so that migrations never see it.
+users_import_table: Final[Table] = Table(
+    "users_import",
+    MetaData(),
+    Column("line", Integer, nullable=False),
+    Column("id", UUID(as_uuid=True), nullable=False),
+    Column("username", String, nullable=False),
+    Column("password_hash", LargeBinary, nullable=False),
+    # Enum labels, cast on merge.
+    Column("role", String, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+COPY_USERS_IMPORT: Final[str] = (
+    "COPY users_import (line, id, username, password_hash, role) FROM STDIN"
+)
+
+
+class SqlaUserImporter(UserImporter):
+    """
+    Batches are loaded into a temporary staging table with `COPY`,
+    or a pipelined insert on asyncpg,
+    one round trip per batch instead of one per user.
+    The merge is a single `INSERT ... SELECT ... ON CONFLICT DO NOTHING`,
+    and the staging table is dropped on commit.
+    Both go through the main session's connection and transaction.
+    """
+
+    def __init__(self, session: MainAsyncSession):
+        self._session = session
+        self._is_staging_created = False
+
+    async def stage(self, users: Sequence[ImportedUser]) -> None:
+        """
+        :raises DataMapperError:
+        """
+        try:
+            connection = await self._session.connection()
+            if not self._is_staging_created:
+                await connection.execute(CreateTable(users_import_table))
+                self._is_staging_created = True
+
+            if connection.dialect.driver == PostgresDriver.PSYCOPG:
+                await self._copy(connection, users)
+            else:
+                # asyncpg sends the rows as one pipelined `executemany`.
+                await connection.execute(
+                    insert(users_import_table),
+                    [
+                        {
+                            "line": user.line,
+                            "id": user.id_.value,
+                            "username": user.username.value,
+                            "password_hash": user.password_hash.value,
+                            "role": user.role.name,
+                        }
+                        for user in users
+                    ],
+                )
+
+        # `COPY` runs on the driver connection, bypassing SQLAlchemy's error wrapping.
+        except (SQLAlchemyError, psycopg.Error) as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    @staticmethod
+    async def _copy(connection: AsyncConnection, users: Sequence[ImportedUser]) -> None:
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = cast(
+            psycopg.AsyncConnection[Any],
+            raw_connection.driver_connection,
+        )
+        async with (
+            driver_connection.cursor() as cursor,
+            cursor.copy(COPY_USERS_IMPORT) as copy,
+        ):
+            for user in users:
+                await copy.write_row(
+                    (
+                        user.line,
+                        user.id_.value,
+                        user.username.value,
+                        user.password_hash.value,
+                        user.role.name,
+                    ),
+                )
+
+    async def merge(self) -> list[UserImportConflict]:
+        """
+        :raises DataMapperError:
+        """
+        if not self._is_staging_created:
+            return []
+
+        staging = users_import_table
+        inserted = (
+            insert(users_table)
+            .from_select(
+                ["id", "username", "password_hash", "role", "is_active"],
+                select(
+                    staging.c.id,
+                    staging.c.username,
+                    staging.c.password_hash,
+                    sql_cast(staging.c.role, users_table.c.role.type),
+                    literal(value=True),
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=[users_table.c.username])
+            .returning(users_table.c.username)
+            .cte("inserted")
+        )
+        skipped_stmt = (
+            select(staging.c.line, staging.c.username)
+            .outerjoin(inserted, inserted.c.username == staging.c.username)
+            .where(inserted.c.username.is_(None))
+            .order_by(staging.c.line)
+        )
+
+        try:
+            result = await self._session.execute(skipped_stmt)
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+        return [
+            UserImportConflict(line=line, username=username)
+            for line, username in result.tuples()
+        ]
@@ -0,0 +1,120 @@
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import ClassVar, Final
+
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
+from app.application.common.query_models.user import UserQueryCount, UserQueryPage
+from app.application.common.query_params.user import (
+    UserListFilters,
+    UserListParams,
+)
+from app.infrastructure.metrics import MetricsRegistry
+
+# Filters are client-chosen, so the oldest counts are dropped beyond this.
+MAX_CACHED_COUNTS: Final[int] = 1_024
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserCountConfig:
+    exact_threshold: int
+    cache_ttl: timedelta
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserPageCacheConfig:
+    ttl: timedelta
+    max_entries: int
+
+
+class UserListingGeneration(UserListingInvalidator):
+    """
+    App-scoped version of the user listing data.
+    Changes committed by this worker bump it, which invalidates
+    every listing cache at once; changes made by other workers
+    show up once the cached entries expire.
+    """
+
+    def __init__(self) -> None:
+        self._value = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def invalidate(self) -> None:
+        self._value += 1
+
+
+class UserListingCache[K: Hashable, V]:
+    """
+    Entries are stored with the generation they were computed under
+    and are stale once it's bumped. A value computed under an older
+    generation is not stored, so a read racing a write can't outlive it.
+    Beyond `max_entries`, the oldest entries are dropped.
+    """
+
+    kind: ClassVar[str]
+
+    def __init__(
+        self,
+        ttl: timedelta,
+        max_entries: int,
+        generation: UserListingGeneration,
+        metrics: MetricsRegistry,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl_sec = ttl.total_seconds()
+        self._max_entries = max_entries
+        self._generation = generation
+        self._clock = clock
+        self._entries: dict[K, tuple[int, float, V]] = {}
+
+        self._requests = metrics.counter(
+            "user_listing_cache_requests_total",
+            "User listing cache lookups by cache and result.",
+            label_names=("cache", "result"),
+        )
+
+    @property
+    def generation(self) -> int:
+        return self._generation.value
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._requests.inc(cache=self.kind, result="miss")
+            return None
+
+        generation, expires_at, value = entry
+        if generation != self._generation.value or expires_at <= self._clock():
+            del self._entries[key]
+            self._requests.inc(cache=self.kind, result="miss")
+            return None
+
+        self._requests.inc(cache=self.kind, result="hit")
+        return value
+
+    def put(self, key: K, value: V, generation: int) -> None:
+        if generation != self._generation.value or self._max_entries <= 0:
+            return
+
+        self._entries.pop(key, None)
+        if len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (generation, self._clock() + self._ttl_sec, value)
+
+
+class UserCountCache(UserListingCache[UserListFilters, UserQueryCount]):
+    kind = "count"
+
+
+class UserPageCache(UserListingCache[UserListParams, UserQueryPage]):
+    """
+    Pages are shared between requests and must not be modified.
+    """
+
+    kind = "page"
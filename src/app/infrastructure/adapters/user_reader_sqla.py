@@ -1,77 +1,369 @@
+import csv
+import io
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import replace
+from typing import Final
 from uuid import UUID
 
-from sqlalchemy import ColumnElement, Result, Row, Select, select
+import orjson
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Result,
+    Row,
+    Select,
+    bindparam,
+    cast,
+    column,
+    func,
+    select,
+    table,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import REGCLASS
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.application.common.ports.user_query_gateway import UserQueryGateway
-from app.application.common.query_models.user import UserQueryModel
+from app.application.common.query_models.user import (
+    UserQueryCount,
+    UserQueryModel,
+    UserQueryPage,
+)
+from app.application.common.query_params.pagination import KeysetPosition
 from app.application.common.query_params.sorting import SortingOrder
-from app.application.common.query_params.user import UserListParams
+from app.application.common.query_params.user import (
+    UserExportFormat,
+    UserListFilters,
+    UserListParams,
+)
 from app.domain.enums.user_type import UserRole
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
-from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.types import ReaderAsyncSession
+from app.infrastructure.adapters.user_filters_sqla import (
+    FilterShape,
+    filter_criteria,
+    filter_params,
+    filter_shape,
+)
+from app.infrastructure.adapters.user_listing_cache import (
+    UserCountCache,
+    UserCountConfig,
+    UserPageCache,
+)
 from app.infrastructure.exceptions.gateway import ReaderError
 from app.infrastructure.persistence_sqla.mappings.user import users_table
+from app.infrastructure.persistence_sqla.statement_registry import (
+    SqlaStatementRegistry,
+)
 
 log = logging.getLogger(__name__)
 
+pg_class = table("pg_class", column("oid"), column("reltuples"))
+
+# Rows fetched from the server-side cursor and serialized per chunk.
+EXPORT_BATCH_SIZE: Final[int] = 1_000
+EXPORT_FIELDS: Final[tuple[str, ...]] = ("id", "username", "role", "is_active")
+
+UserRowSelect = Select[tuple[UUID, str, UserRole, bool]]
+
 
 class SqlaUserReader(UserQueryGateway):
-    def __init__(self, session: MainAsyncSession):
+    def __init__(
+        self,
+        session: ReaderAsyncSession,
+        count_cache: UserCountCache,
+        page_cache: UserPageCache,
+        count_config: UserCountConfig,
+        statements: SqlaStatementRegistry,
+    ):
         self._session = session
+        self._statements = statements
+        self._count_cache = count_cache
+        self._page_cache = page_cache
+        self._exact_count_threshold = count_config.exact_threshold
 
     async def read_all(
         self,
         user_read_all_params: UserListParams,
-    ) -> list[UserQueryModel] | None:
+    ) -> UserQueryPage | None:
         """
+        Pages are cached until users change or the entry expires.
+
         :raises ReaderError:
         """
+        cache_key = replace(
+            user_read_all_params,
+            filters=_normalize_filters(user_read_all_params.filters),
+        )
+        cached_page = self._page_cache.get(cache_key)
+        if cached_page is not None:
+            return cached_page
+
+        generation = self._page_cache.generation
+        page = await self._read_page(user_read_all_params)
+        if page is not None:
+            self._page_cache.put(cache_key, page, generation)
+        return page
+
+    async def _read_page(
+        self,
+        user_read_all_params: UserListParams,
+    ) -> UserQueryPage | None:
+        """
+        Rows are ordered by the sorting field with the ID breaking ties,
+        so every row has a unique position. Given a position to start after,
+        the page is located with a row-value comparison on that index order
+        instead of skipping `offset` rows, so deep pages cost as much
+        as the first one and don't shift when users are added.
+
+        One extra row is read to tell whether a next page exists.
+
+        :raises ReaderError:
+        """
+        sorting_field_name = user_read_all_params.sorting.sorting_field
         table_sorting_field: ColumnElement[UUID | str | UserRole | bool] | None = (
-            users_table.c.get(user_read_all_params.sorting.sorting_field)
+            users_table.c.get(sorting_field_name)
         )
         if table_sorting_field is None:
-            log.error(
-                "Invalid sorting field: '%s'.",
-                user_read_all_params.sorting.sorting_field,
-            )
+            log.error("Invalid sorting field: '%s'.", sorting_field_name)
             return None
 
-        order_by: ColumnElement[UUID | str | UserRole | bool] = (
-            table_sorting_field.asc()
-            if user_read_all_params.sorting.sorting_order == SortingOrder.ASC
-            else table_sorting_field.desc()
-        )
-
-        select_stmt: Select[tuple[UUID, str, UserRole, bool]] = (
-            select(
-                users_table.c.id,
-                users_table.c.username,
-                users_table.c.role,
-                users_table.c.is_active,
-            )
-            .order_by(order_by)
-            .limit(user_read_all_params.pagination.limit)
-            .offset(user_read_all_params.pagination.offset)
+        pagination = user_read_all_params.pagination
+        filters = user_read_all_params.filters
+        is_ascending = user_read_all_params.sorting.sorting_order == SortingOrder.ASC
+        is_keyset = pagination.after is not None
+        shape = filter_shape(filters)
+        select_stmt: UserRowSelect = self._statements.get(
+            ("users_page", sorting_field_name, is_ascending, is_keyset, shape),
+            lambda: _build_page_stmt(
+                table_sorting_field,
+                is_ascending=is_ascending,
+                is_keyset=is_keyset,
+                filter_shape=shape,
+            ),
         )
+        params = {**filter_params(filters), "limit": pagination.limit + 1}
+        if pagination.after is None:
+            params["offset"] = pagination.offset
+        else:
+            params["after_value"] = pagination.after.sorting_value
+            params["after_id"] = pagination.after.id_
 
         try:
             result: Result[
                 tuple[UUID, str, UserRole, bool]
-            ] = await self._session.execute(select_stmt)
+            ] = await self._session.execute(select_stmt, params)
             rows: Sequence[Row[tuple[UUID, str, UserRole, bool]]] = result.all()
 
-            return [
+        except SQLAlchemyError as error:
+            raise ReaderError(DB_QUERY_FAILED) from error
+
+        page_rows = rows[: pagination.limit]
+        next_position: KeysetPosition | None = None
+        if len(rows) > pagination.limit:
+            last_row = page_rows[-1]
+            # Only selected columns can position the next page.
+            sorting_value = getattr(last_row, sorting_field_name, None)
+            if sorting_value is not None:
+                next_position = KeysetPosition(
+                    sorting_value=sorting_value,
+                    id_=last_row.id,
+                )
+
+        return UserQueryPage(
+            users=[
                 UserQueryModel(
                     id_=row.id,
                     username=row.username,
                     role=row.role,
                     is_active=row.is_active,
                 )
-                for row in rows
-            ]
+                for row in page_rows
+            ],
+            next_position=next_position,
+        )
+
+    async def count_all(self, filters: UserListFilters) -> UserQueryCount:
+        """
+        `COUNT(*)` reads every matching row, so large results aren't counted.
+        Without filters, the exact count is only run while the planner's
+        row estimate (`pg_class.reltuples`, kept current by autovacuum)
+        is below the threshold; above it, the estimate is the total.
+        A table never analyzed has a negative estimate and is counted exactly.
+        With filters, counting stops at the threshold,
+        which is then reported as the inexact total.
+
+        :raises ReaderError:
+        """
+        cache_key = _normalize_filters(filters)
+        cached_count = self._count_cache.get(cache_key)
+        if cached_count is not None:
+            return cached_count
+
+        generation = self._count_cache.generation
+        try:
+            if filters == UserListFilters():
+                count = await self._count_all_users()
+            else:
+                count = await self._count_filtered_users(filters)
 
         except SQLAlchemyError as error:
             raise ReaderError(DB_QUERY_FAILED) from error
+
+        self._count_cache.put(cache_key, count, generation)
+        return count
+
+    async def export_all(
+        self,
+        filters: UserListFilters,
+        export_format: UserExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """
+        Rows are fetched from a server-side cursor `EXPORT_BATCH_SIZE` at a time
+        and serialized straight from the row tuples, one chunk per batch,
+        so memory use is bounded by the batch, not by the number of users.
+
+        :raises ReaderError:
+        """
+        shape = filter_shape(filters)
+        select_stmt: UserRowSelect = self._statements.get(
+            ("users_export", shape),
+            lambda: (
+                _select_user_rows()
+                .where(*filter_criteria(shape))
+                .order_by(users_table.c.id)
+                .execution_options(yield_per=EXPORT_BATCH_SIZE)
+            ),
+        )
+        serialize = (
+            _serialize_csv_rows
+            if export_format == UserExportFormat.CSV
+            else _serialize_ndjson_rows
+        )
+        if export_format == UserExportFormat.CSV:
+            yield _serialize_csv_rows((EXPORT_FIELDS,))
+
+        try:
+            result = await self._session.stream(select_stmt, filter_params(filters))
+            async for rows in result.partitions():
+                yield serialize(rows)
+
+        except SQLAlchemyError as error:
+            raise ReaderError(DB_QUERY_FAILED) from error
+
+    async def _count_all_users(self) -> UserQueryCount:
+        """
+        :raises SQLAlchemyError:
+        """
+        estimate_stmt: Select[tuple[int]] = self._statements.get(
+            ("users_estimate",),
+            lambda: select(cast(pg_class.c.reltuples, BigInteger)).where(
+                pg_class.c.oid == cast(users_table.name, REGCLASS),
+            ),
+        )
+        estimate: int = (await self._session.execute(estimate_stmt)).scalar_one()
+        if estimate >= self._exact_count_threshold:
+            return UserQueryCount(total=estimate, is_exact=False)
+
+        count_stmt: Select[tuple[int]] = self._statements.get(
+            ("users_count",),
+            lambda: select(func.count()).select_from(users_table),
+        )
+        total: int = (await self._session.execute(count_stmt)).scalar_one()
+        return UserQueryCount(total=total, is_exact=True)
+
+    async def _count_filtered_users(self, filters: UserListFilters) -> UserQueryCount:
+        """
+        :raises SQLAlchemyError:
+        """
+        shape = filter_shape(filters)
+        count_stmt: Select[tuple[int]] = self._statements.get(
+            ("users_count", shape),
+            lambda: select(func.count()).select_from(
+                select(users_table.c.id)
+                .where(*filter_criteria(shape))
+                .limit(bindparam("limit"))
+                .subquery(),
+            ),
+        )
+        params = {**filter_params(filters), "limit": self._exact_count_threshold}
+        total: int = (await self._session.execute(count_stmt, params)).scalar_one()
+        return UserQueryCount(
+            total=total,
+            is_exact=total < self._exact_count_threshold,
+        )
+
+
+def _select_user_rows() -> UserRowSelect:
+    return select(
+        users_table.c.id,
+        users_table.c.username,
+        users_table.c.role,
+        users_table.c.is_active,
+    )
+
+
+def _build_page_stmt(
+    table_sorting_field: ColumnElement[UUID | str | UserRole | bool],
+    *,
+    is_ascending: bool,
+    is_keyset: bool,
+    filter_shape: FilterShape,
+) -> UserRowSelect:
+    order_by = (
+        (table_sorting_field.asc(), users_table.c.id.asc())
+        if is_ascending
+        else (table_sorting_field.desc(), users_table.c.id.desc())
+    )
+    select_stmt = (
+        _select_user_rows()
+        .where(*filter_criteria(filter_shape))
+        .order_by(*order_by)
+        .limit(bindparam("limit"))
+    )
+    if not is_keyset:
+        return select_stmt.offset(bindparam("offset"))
+
+    sort_key = tuple_(table_sorting_field, users_table.c.id)
+    position = tuple_(
+        bindparam("after_value", type_=table_sorting_field.type),
+        bindparam("after_id", type_=users_table.c.id.type),
+    )
+    return select_stmt.where(
+        sort_key > position if is_ascending else sort_key < position,
+    )
+
+
+def _normalize_filters(filters: UserListFilters) -> UserListFilters:
+    """
+    Username patterns are matched case-insensitively,
+    so their case doesn't distinguish cached results.
+    """
+    return replace(
+        filters,
+        username_prefix=(
+            None if filters.username_prefix is None else filters.username_prefix.lower()
+        ),
+        username_contains=(
+            None
+            if filters.username_contains is None
+            else filters.username_contains.lower()
+        ),
+    )
+
+
+def _serialize_ndjson_rows(rows: Sequence[Sequence[object]]) -> bytes:
+    return b"".join(
+        orjson.dumps(
+            dict(zip(EXPORT_FIELDS, row, strict=True)),
+            option=orjson.OPT_APPEND_NEWLINE,
+        )
+        for row in rows
+    )
+
+
+def _serialize_csv_rows(rows: Sequence[Sequence[object]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode()
@@ -1,4 +1,18 @@
-from sqlalchemy import Delete, delete
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import (
+    Delete,
+    Select,
+    Update,
+    any_,
+    bindparam,
+    delete,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.domain.value_objects.user_id import UserId
@@ -9,11 +23,27 @@ from app.infrastructure.auth.session.ports.gateway import (
     AuthSessionGateway,
 )
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_sessions_table,
+)
+from app.infrastructure.persistence_sqla.statement_registry import (
+    SqlaStatementRegistry,
+)
 
 
 class SqlaAuthSessionDataMapper(AuthSessionGateway):
-    def __init__(self, session: AuthAsyncSession):
+    """
+    Statements are built once and filter on table columns
+    with bound parameters, since `user_id` is a composite attribute.
+    """
+
+    def __init__(
+        self,
+        session: AuthAsyncSession,
+        statements: SqlaStatementRegistry,
+    ):
         self._session = session
+        self._statements = statements
 
     def add(self, auth_session: AuthSession) -> None:
         """
@@ -45,12 +75,83 @@ class SqlaAuthSessionDataMapper(AuthSessionGateway):
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
+    async def read_live_for_user(
+        self,
+        user_id: UserId,
+        now: datetime,
+        limit: int,
+    ) -> list[AuthSession]:
+        """
+        Served by an index-only scan of `(user_id, expiration) INCLUDE (id)`.
+
+        :raises DataMapperError:
+        """
+        table = auth_sessions_table
+        select_stmt: Select[tuple[AuthSession]] = self._statements.get(
+            ("auth_sessions_live_for_user",),
+            lambda: (
+                select(AuthSession)
+                .where(
+                    table.c.user_id == bindparam("user_id"),
+                    table.c.expiration > bindparam("now"),
+                )
+                .order_by(table.c.expiration.desc())
+                .limit(bindparam("limit"))
+            ),
+        )
+        params = {"user_id": user_id.value, "now": now, "limit": limit}
+
+        try:
+            return list((await self._session.scalars(select_stmt, params)).all())
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def count_live_for_user(self, user_id: UserId, now: datetime) -> int:
+        """
+        Served by an index-only scan of `(user_id, expiration)`.
+
+        :raises DataMapperError:
+        """
+        table = auth_sessions_table
+        count_stmt: Select[tuple[int]] = self._statements.get(
+            ("auth_sessions_live_count_for_user",),
+            lambda: select(func.count()).where(
+                table.c.user_id == bindparam("user_id"),
+                table.c.expiration > bindparam("now"),
+            ),
+        )
+        params = {"user_id": user_id.value, "now": now}
+
+        try:
+            return (await self._session.execute(count_stmt, params)).scalar_one()
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
     async def update(self, auth_session: AuthSession) -> None:
         """
+        Only the expiration of a session can change, so a direct UPDATE
+        is issued instead of `merge`, which would SELECT the row first.
+        It's a Core statement, so it doesn't autoflush the ORM session.
+
         :raises DataMapperError:
         """
+        update_stmt: Update = self._statements.get(
+            ("auth_session_update_expiration",),
+            lambda: (
+                update(auth_sessions_table)
+                .where(auth_sessions_table.c.id == bindparam("session_id"))
+                .values(expiration=bindparam("new_expiration"))
+            ),
+        )
+        params = {
+            "session_id": auth_session.id_,
+            "new_expiration": auth_session.expiration,
+        }
+
         try:
-            await self._session.merge(auth_session)
+            await self._session.execute(update_stmt, params)
 
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
@@ -59,26 +160,63 @@ class SqlaAuthSessionDataMapper(AuthSessionGateway):
         """
         :raises DataMapperError:
         """
-        delete_stmt: Delete = delete(AuthSession).where(
-            AuthSession.id_ == auth_session_id,  # type: ignore
+        delete_stmt: Delete = self._statements.get(
+            ("auth_session_delete",),
+            lambda: delete(AuthSession).where(
+                auth_sessions_table.c.id == bindparam("session_id"),
+            ),
         )
 
         try:
-            await self._session.execute(delete_stmt)
+            await self._session.execute(delete_stmt, {"session_id": auth_session_id})
 
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
     async def delete_all_for_user(self, user_id: UserId) -> None:
         """
+        Located through the `(user_id, expiration)` index,
+        so the cost depends on the user's sessions, not on the table size.
+
+        :raises DataMapperError:
+        """
+        delete_stmt: Delete = self._statements.get(
+            ("auth_sessions_delete_for_user",),
+            lambda: delete(AuthSession).where(
+                auth_sessions_table.c.user_id == bindparam("user_id"),
+            ),
+        )
+
+        try:
+            await self._session.execute(delete_stmt, {"user_id": user_id.value})
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def delete_all_for_users(self, user_ids: Sequence[UserId]) -> None:
+        """
+        One statement for all users, with their ids bound as a single array.
+
         :raises DataMapperError:
         """
-        delete_stmt: Delete = delete(AuthSession).where(
-            AuthSession.user_id == user_id,  # type: ignore
+        delete_stmt: Delete = self._statements.get(
+            ("auth_sessions_delete_for_users",),
+            lambda: delete(AuthSession).where(
+                auth_sessions_table.c.user_id
+                == any_(
+                    bindparam(
+                        "user_ids",
+                        type_=ARRAY(auth_sessions_table.c.user_id.type),
+                    ),
+                ),
+            ),
         )
 
         try:
-            await self._session.execute(delete_stmt)
+            await self._session.execute(
+                delete_stmt,
+                {"user_ids": [user_id.value for user_id in user_ids]},
+            )
 
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
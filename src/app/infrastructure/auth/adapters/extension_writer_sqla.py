@@ -0,0 +1,121 @@
+import asyncio
+import contextlib
+import logging
+from datetime import datetime
+from itertools import batched
+
+from sqlalchemy import DateTime, String, column, update, values
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.auth.session.config import AuthSessionExtensionWriterConfig
+from app.infrastructure.auth.session.constants import (
+    AUTH_SESSION_EXTENSION_FLUSH_FAILED,
+)
+from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.ports.extension_writer import (
+    AuthSessionExtensionWriter,
+)
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_sessions_table,
+)
+
+log = logging.getLogger(__name__)
+
+
+class SqlaAuthSessionExtensionWriter(AuthSessionExtensionWriter):
+    """
+    Write-behind buffer of session extensions, keyed by session ID.
+    Flushed on an interval with one `UPDATE ... FROM (VALUES ...)`
+    per batch, all batches sharing a single transaction.
+
+    Expirations only move forward, so a late flush can't shorten a session
+    extended elsewhere, and deleted sessions are never resurrected.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        config: AuthSessionExtensionWriterConfig,
+    ):
+        self._engine = engine
+        self._flush_interval_sec = config.flush_interval.total_seconds()
+        self._max_batch_size = config.max_batch_size
+        self._pending: dict[str, datetime] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def schedule(self, auth_session: AuthSession) -> None:
+        self._enqueue(auth_session.id_, auth_session.expiration)
+
+    async def flush(self) -> None:
+        """
+        :raises SQLAlchemyError:
+        """
+        if not self._pending:
+            return
+
+        extensions, self._pending = self._pending, {}
+        table = auth_sessions_table
+        try:
+            async with self._engine.begin() as connection:
+                for batch in batched(extensions.items(), self._max_batch_size):
+                    batch_values = values(
+                        column("id", String),
+                        column("expiration", DateTime(timezone=True)),
+                        name="extensions",
+                    ).data(list(batch))
+                    update_stmt = (
+                        update(table)
+                        .where(
+                            table.c.id == batch_values.c.id,
+                            table.c.expiration < batch_values.c.expiration,
+                        )
+                        .values(expiration=batch_values.c.expiration)
+                    )
+                    await connection.execute(update_stmt)
+
+        except SQLAlchemyError:
+            for auth_session_id, expiration in extensions.items():
+                self._enqueue(auth_session_id, expiration)
+            raise
+
+        log.debug("Auth session extensions flushed: %d.", len(extensions))
+
+    def start(self) -> None:
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+
+        try:
+            await self.flush()
+
+        except SQLAlchemyError as error:
+            log.error(
+                "%s Extensions lost: %d. Error: '%s'",
+                AUTH_SESSION_EXTENSION_FLUSH_FAILED,
+                len(self._pending),
+                error,
+            )
+
+    def _enqueue(self, auth_session_id: str, expiration: datetime) -> None:
+        pending_expiration = self._pending.get(auth_session_id)
+        if pending_expiration is None or pending_expiration < expiration:
+            self._pending[auth_session_id] = expiration
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_sec)
+            try:
+                await self.flush()
+
+            except SQLAlchemyError as error:
+                log.warning("%s: '%s'", AUTH_SESSION_EXTENSION_FLUSH_FAILED, error)
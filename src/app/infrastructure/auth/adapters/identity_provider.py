@@ -1,4 +1,5 @@
 from app.application.common.ports.identity_provider import IdentityProvider
+from app.domain.entities.user import User
 from app.domain.value_objects.user_id import UserId
 from app.infrastructure.auth.session.service import AuthSessionService
 
@@ -15,3 +16,6 @@ class AuthSessionIdentityProvider(IdentityProvider):
         :raises AuthenticationError:
         """
         return await self._auth_session_service.get_authenticated_user_id()
+
+    def get_loaded_current_user(self) -> User | None:
+        return self._auth_session_service.get_loaded_user()
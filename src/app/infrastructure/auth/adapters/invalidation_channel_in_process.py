@@ -0,0 +1,27 @@
+from collections.abc import Sequence
+
+from app.domain.value_objects.user_id import UserId
+from app.infrastructure.auth.session.cache import AuthSessionCache
+from app.infrastructure.auth.session.ports.invalidation_channel import (
+    AuthSessionInvalidationChannel,
+)
+
+
+class InProcessAuthSessionInvalidationChannel(AuthSessionInvalidationChannel):
+    """
+    Stand-in for single-worker deployments and tests:
+    invalidations only reach the cache of the current process.
+    """
+
+    def __init__(self, auth_session_cache: AuthSessionCache):
+        self._auth_session_cache = auth_session_cache
+
+    async def publish_session(self, auth_session_id: str) -> None:
+        self._auth_session_cache.evict(auth_session_id)
+
+    async def publish_user(self, user_id: UserId) -> None:
+        self._auth_session_cache.evict_user(user_id)
+
+    async def publish_users(self, user_ids: Sequence[UserId]) -> None:
+        for user_id in user_ids:
+            self._auth_session_cache.evict_user(user_id)
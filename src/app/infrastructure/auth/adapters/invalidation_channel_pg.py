@@ -0,0 +1,148 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Sequence
+from typing import Final
+from uuid import UUID
+
+import psycopg
+from psycopg import sql
+from sqlalchemy import String, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.domain.value_objects.user_id import UserId
+from app.infrastructure.auth.session.cache import AuthSessionCache
+from app.infrastructure.auth.session.constants import (
+    AUTH_SESSION_INVALIDATION_LISTENER_FAILED,
+    AUTH_SESSION_INVALIDATION_MALFORMED,
+    AUTH_SESSION_INVALIDATION_PUBLISH_FAILED,
+)
+from app.infrastructure.auth.session.ports.invalidation_channel import (
+    AuthSessionInvalidationChannel,
+)
+from app.infrastructure.persistence_sqla.config import PostgresDsn
+
+log = logging.getLogger(__name__)
+
+PG_CHANNEL_NAME: Final[str] = "auth_session_invalidation"
+PAYLOAD_KIND_SESSION: Final[str] = "session"
+PAYLOAD_KIND_USER: Final[str] = "user"
+LISTENER_RECONNECT_DELAY_SEC: Final[float] = 1.0
+
+
+class PgNotifyAuthSessionInvalidationChannel(AuthSessionInvalidationChannel):
+    """
+    Cluster-wide channel based on Postgres `LISTEN/NOTIFY`.
+    Each worker keeps one dedicated listening connection outside the pool,
+    on the direct DSN, as `LISTEN` doesn't survive a transaction-mode pooler;
+    notifications are published through the regular engine pool.
+
+    Notifications missed while the listener is disconnected can't be replayed,
+    so the local cache is cleared on every (re)connect.
+    """
+
+    def __init__(
+        self,
+        dsn: PostgresDsn,
+        engine: AsyncEngine,
+        auth_session_cache: AuthSessionCache,
+    ):
+        self._conninfo = (
+            make_url(dsn)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        self._engine = engine
+        self._auth_session_cache = auth_session_cache
+        self._listener_task: asyncio.Task[None] | None = None
+
+    async def publish_session(self, auth_session_id: str) -> None:
+        self._auth_session_cache.evict(auth_session_id)
+        await self._notify(f"{PAYLOAD_KIND_SESSION}:{auth_session_id}")
+
+    async def publish_user(self, user_id: UserId) -> None:
+        self._auth_session_cache.evict_user(user_id)
+        await self._notify(f"{PAYLOAD_KIND_USER}:{user_id.value}")
+
+    async def publish_users(self, user_ids: Sequence[UserId]) -> None:
+        for user_id in user_ids:
+            self._auth_session_cache.evict_user(user_id)
+        await self._notify(
+            *(f"{PAYLOAD_KIND_USER}:{user_id.value}" for user_id in user_ids),
+        )
+
+    def start(self) -> None:
+        if self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener_task is None:
+            return
+
+        self._listener_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._listener_task
+        self._listener_task = None
+
+    async def _notify(self, *payloads: str) -> None:
+        """
+        Any number of payloads is sent with one statement.
+        """
+        payload_rows = func.unnest(
+            bindparam("payloads", type_=ARRAY(String)),
+        ).table_valued("payload")
+        notify_stmt = select(
+            func.pg_notify(PG_CHANNEL_NAME, payload_rows.c.payload),
+        ).select_from(payload_rows)
+
+        try:
+            async with self._engine.connect() as connection:
+                await connection.execute(notify_stmt, {"payloads": list(payloads)})
+                await connection.commit()
+
+        except SQLAlchemyError as error:
+            log.warning("%s: '%s'", AUTH_SESSION_INVALIDATION_PUBLISH_FAILED, error)
+
+    async def _listen(self) -> None:
+        listen_stmt = sql.SQL("LISTEN {}").format(sql.Identifier(PG_CHANNEL_NAME))
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    self._conninfo,
+                    autocommit=True,
+                ) as connection:
+                    await connection.execute(listen_stmt)
+                    self._auth_session_cache.clear()
+                    log.debug("Listening for auth session invalidations.")
+
+                    async for notify in connection.notifies():
+                        self._handle(notify.payload)
+
+            except psycopg.Error as error:
+                log.warning(
+                    "%s: '%s'",
+                    AUTH_SESSION_INVALIDATION_LISTENER_FAILED,
+                    error,
+                )
+                await asyncio.sleep(LISTENER_RECONNECT_DELAY_SEC)
+
+    def _handle(self, payload: str) -> None:
+        kind, _, value = payload.partition(":")
+
+        if kind == PAYLOAD_KIND_SESSION and value:
+            self._auth_session_cache.evict(value)
+            return
+
+        if kind == PAYLOAD_KIND_USER:
+            try:
+                user_id = UserId(UUID(value))
+            except ValueError:
+                log.warning("%s: '%s'", AUTH_SESSION_INVALIDATION_MALFORMED, payload)
+                return
+            self._auth_session_cache.evict_user(user_id)
+            return
+
+        log.warning("%s: '%s'", AUTH_SESSION_INVALIDATION_MALFORMED, payload)
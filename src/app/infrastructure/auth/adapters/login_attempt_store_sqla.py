@@ -0,0 +1,125 @@
+import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Final
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.auth.throttle.config import LoginThrottleConfig
+from app.infrastructure.auth.throttle.constants import LOGIN_ATTEMPT_STORE_FAILED
+from app.infrastructure.auth.throttle.ports.attempt_store import LoginAttemptStore
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    login_attempt_counters_table,
+)
+
+log = logging.getLogger(__name__)
+
+# Expired windows are deleted by every N-th recorded attempt of a worker.
+CLEANUP_EVERY_N_ATTEMPTS: Final[int] = 1_000
+
+
+class SqlaLoginAttemptStore(LoginAttemptStore):
+    """
+    Shared by all workers. Attempts are counted per fixed window,
+    and the sliding window is estimated from the current window's count
+    plus the previous one's, weighted by how much of it still overlaps.
+    Two rows per key at most, one upsert per attempt.
+
+    Store failures allow the attempt:
+    an unavailable throttle must not lock every user out.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        config: LoginThrottleConfig,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._engine = engine
+        self._window_sec = config.window.total_seconds()
+        self._clock = clock
+        self._n_recorded = 0
+
+    async def try_acquire(self, key: str, limit: int) -> timedelta | None:
+        window_id, offset_sec = divmod(self._clock(), self._window_sec)
+        current_window_id = int(window_id)
+        table = login_attempt_counters_table
+
+        select_stmt = select(table.c.window_id, table.c.attempts).where(
+            table.c.key == key,
+            table.c.window_id.in_((current_window_id - 1, current_window_id)),
+        )
+        upsert_stmt = insert(table).values(
+            key=key,
+            window_id=current_window_id,
+            attempts=1,
+        )
+        upsert_stmt = upsert_stmt.on_conflict_do_update(
+            index_elements=[table.c.key, table.c.window_id],
+            set_={"attempts": table.c.attempts + 1},
+        )
+
+        try:
+            async with self._engine.begin() as connection:
+                counts: dict[int, int] = dict(
+                    (await connection.execute(select_stmt)).tuples().all(),
+                )
+                previous = counts.get(current_window_id - 1, 0)
+                current = counts.get(current_window_id, 0)
+                retry_after_sec = self._retry_after_sec(
+                    previous,
+                    current,
+                    offset_sec,
+                    limit,
+                )
+                if retry_after_sec is not None:
+                    return timedelta(seconds=retry_after_sec)
+
+                await connection.execute(upsert_stmt)
+                self._n_recorded += 1
+                if self._n_recorded % CLEANUP_EVERY_N_ATTEMPTS == 0:
+                    await connection.execute(
+                        delete(table).where(
+                            table.c.window_id < current_window_id - 1,
+                        ),
+                    )
+
+        except SQLAlchemyError as error:
+            log.warning("%s: '%s'", LOGIN_ATTEMPT_STORE_FAILED, error)
+
+        return None
+
+    async def reset(self, key: str) -> None:
+        table = login_attempt_counters_table
+        try:
+            async with self._engine.begin() as connection:
+                await connection.execute(delete(table).where(table.c.key == key))
+
+        except SQLAlchemyError as error:
+            log.warning("%s: '%s'", LOGIN_ATTEMPT_STORE_FAILED, error)
+
+    def _retry_after_sec(
+        self,
+        previous: int,
+        current: int,
+        offset_sec: float,
+        limit: int,
+    ) -> float | None:
+        """
+        :returns: `None` if the estimate is under `limit`,
+        otherwise the time until it drops under `limit` with no new attempts.
+        """
+        window_sec = self._window_sec
+        if previous * (1 - offset_sec / window_sec) + current < limit:
+            return None
+
+        if current < limit:
+            # The previous window's weight decays first.
+            return window_sec * (1 - (limit - current) / previous) - offset_sec
+
+        # The current window becomes the previous one and decays in turn.
+        return window_sec - offset_sec + window_sec * (1 - limit / current)
@@ -0,0 +1,141 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from typing import Final
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.infrastructure.auth.session.config import AuthSessionReaperConfig
+from app.infrastructure.auth.session.constants import AUTH_SESSION_REAPING_FAILED
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_sessions_table,
+)
+
+log = logging.getLogger(__name__)
+
+# Transaction-level advisory lock shared by all workers; ASCII "authreap".
+REAPER_ADVISORY_LOCK_KEY: Final[int] = 0x6175_7468_7265_6170
+
+
+class SqlaAuthSessionReaper:
+    """
+    Periodically deletes expired auth sessions in bounded batches,
+    each committed on its own so row locks are held only briefly.
+    Rows locked by concurrent requests are skipped until the next run.
+
+    Each batch transaction first takes the reaper advisory lock,
+    so only one worker deletes at a time; the others skip the run.
+    The lock is transaction-level: the commit or rollback ending the batch
+    releases it on whichever server connection it was taken,
+    so a failed run or a transaction-mode pooler can't leak it.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        config: AuthSessionReaperConfig,
+        metrics: MetricsRegistry,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self._engine = engine
+        self._interval_sec = config.interval.total_seconds()
+        self._batch_size = config.batch_size
+        self._clock = clock
+        self._reap_task: asyncio.Task[None] | None = None
+
+        self._runs = metrics.counter(
+            "auth_session_reaper_runs_total",
+            "Reaper runs by outcome.",
+            label_names=("outcome",),
+        )
+        self._rows_reaped = metrics.counter(
+            "auth_session_reaper_rows_reaped_total",
+            "Expired auth sessions deleted by the reaper.",
+        )
+        self._batch_duration = metrics.histogram(
+            "auth_session_reaper_batch_duration_seconds",
+            "Time spent deleting one batch of expired auth sessions.",
+        )
+
+        table = auth_sessions_table
+        expired_ids = (
+            select(table.c.id)
+            .where(table.c.expiration < func.now())
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        self._delete_stmt = delete(table).where(table.c.id.in_(expired_ids))
+        self._lock_stmt = select(
+            func.pg_try_advisory_xact_lock(REAPER_ADVISORY_LOCK_KEY),
+        )
+
+    async def reap(self) -> int | None:
+        """
+        :returns: number of deleted sessions,
+        or `None` if another worker holds the reaper lock.
+        :raises SQLAlchemyError:
+        """
+        async with self._engine.connect() as connection:
+            n_reaped = await self._reap_batches(connection)
+
+        if n_reaped is None:
+            self._runs.inc(outcome="skipped")
+            return None
+
+        self._runs.inc(outcome="completed")
+        if n_reaped:
+            log.info("Expired auth sessions reaped: %d.", n_reaped)
+        return n_reaped
+
+    def start(self) -> None:
+        if self._reap_task is None:
+            self._reap_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._reap_task is None:
+            return
+
+        self._reap_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._reap_task
+        self._reap_task = None
+
+    async def _reap_batches(self, connection: AsyncConnection) -> int | None:
+        """
+        :returns: number of deleted sessions,
+        or `None` if the lock was held elsewhere before the first batch.
+        :raises SQLAlchemyError:
+        """
+        n_reaped: int | None = None
+        while True:
+            started_at = self._clock()
+            is_locked = (await connection.execute(self._lock_stmt)).scalar_one()
+            if not is_locked:
+                await connection.rollback()
+                return n_reaped
+
+            result = await connection.execute(self._delete_stmt)
+            await connection.commit()
+            self._batch_duration.observe(self._clock() - started_at)
+
+            n_deleted = result.rowcount
+            n_reaped = (n_reaped or 0) + n_deleted
+            self._rows_reaped.inc(n_deleted)
+            if n_deleted < self._batch_size:
+                return n_reaped
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.reap()
+
+            except SQLAlchemyError as error:
+                self._runs.inc(outcome="failed")
+                log.warning("%s: '%s'", AUTH_SESSION_REAPING_FAILED, error)
+
+            await asyncio.sleep(self._interval_sec)
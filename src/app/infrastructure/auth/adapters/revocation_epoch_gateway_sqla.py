@@ -0,0 +1,76 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import bindparam, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.domain.value_objects.user_id import UserId
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.auth.adapters.types import AuthAsyncSession
+from app.infrastructure.auth.session.ports.revocation_epoch_gateway import (
+    AuthRevocationEpochGateway,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_revocation_epochs_table,
+)
+
+
+class SqlaAuthRevocationEpochGateway(AuthRevocationEpochGateway):
+    def __init__(self, session: AuthAsyncSession):
+        self._session = session
+
+    async def bump(self, user_id: UserId) -> int:
+        """
+        :raises DataMapperError:
+        """
+        table = auth_revocation_epochs_table
+        upsert_stmt = (
+            insert(table)
+            .values(user_id=user_id.value, epoch=1, updated_at=func.now())
+            .on_conflict_do_update(
+                index_elements=[table.c.user_id],
+                set_={"epoch": table.c.epoch + 1, "updated_at": func.now()},
+            )
+            .returning(table.c.epoch)
+        )
+
+        try:
+            epoch: int = (await self._session.execute(upsert_stmt)).scalar_one()
+            return epoch
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def bump_many(self, user_ids: Sequence[UserId]) -> dict[UUID, int]:
+        """
+        :raises DataMapperError:
+        """
+        if not user_ids:
+            return {}
+
+        table = auth_revocation_epochs_table
+        # Ids are bound as one array, so any number of users fits one parameter.
+        user_ids_param = bindparam("user_ids", type_=ARRAY(table.c.user_id.type))
+        upsert_stmt = (
+            insert(table)
+            .from_select(
+                ["user_id", "epoch", "updated_at"],
+                select(func.unnest(user_ids_param), literal(1), func.now()),
+            )
+            .on_conflict_do_update(
+                index_elements=[table.c.user_id],
+                set_={"epoch": table.c.epoch + 1, "updated_at": func.now()},
+            )
+            .returning(table.c.user_id, table.c.epoch)
+        )
+        params = {"user_ids": [user_id.value for user_id in user_ids]}
+
+        try:
+            return dict(
+                (await self._session.execute(upsert_stmt, params)).tuples().all()
+            )
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
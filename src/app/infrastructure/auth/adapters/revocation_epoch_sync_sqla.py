@@ -0,0 +1,88 @@
+import asyncio
+import contextlib
+import logging
+from datetime import datetime, timedelta
+from typing import Final
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.auth.session.config import AuthSessionStatelessConfig
+from app.infrastructure.auth.session.constants import (
+    AUTH_REVOCATION_EPOCH_SYNC_FAILED,
+)
+from app.infrastructure.auth.session.revocation_epochs import AuthRevocationEpochs
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_revocation_epochs_table,
+)
+
+log = logging.getLogger(__name__)
+
+# `updated_at` is the bumping transaction's start time,
+# so rows may become visible slightly after their timestamp.
+SYNC_WATERMARK_OVERLAP: Final[timedelta] = timedelta(seconds=60)
+
+
+class SqlaAuthRevocationEpochSynchronizer:
+    """
+    Periodically pulls revocation epochs changed since the previous sync
+    into `AuthRevocationEpochs`. The first sync loads the whole table.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        revocation_epochs: AuthRevocationEpochs,
+        config: AuthSessionStatelessConfig,
+    ):
+        self._engine = engine
+        self._revocation_epochs = revocation_epochs
+        self._sync_interval_sec = config.epoch_sync_interval.total_seconds()
+        self._watermark: datetime | None = None
+        self._sync_task: asyncio.Task[None] | None = None
+
+    async def sync(self) -> None:
+        """
+        :raises SQLAlchemyError:
+        """
+        table = auth_revocation_epochs_table
+        select_stmt = select(table.c.user_id, table.c.epoch, table.c.updated_at)
+        if self._watermark is not None:
+            select_stmt = select_stmt.where(
+                table.c.updated_at >= self._watermark - SYNC_WATERMARK_OVERLAP,
+            )
+
+        async with self._engine.connect() as connection:
+            rows = (await connection.execute(select_stmt)).all()
+
+        self._revocation_epochs.apply_sync((row.user_id, row.epoch) for row in rows)
+        if rows:
+            latest = max(row.updated_at for row in rows)
+            if self._watermark is None or latest > self._watermark:
+                self._watermark = latest
+
+        log.debug("Revocation epochs synced. Changed: %d.", len(rows))
+
+    def start(self) -> None:
+        if self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._sync_task is None:
+            return
+
+        self._sync_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._sync_task
+        self._sync_task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sync()
+
+            except SQLAlchemyError as error:
+                log.warning("%s: '%s'", AUTH_REVOCATION_EPOCH_SYNC_FAILED, error)
+
+            await asyncio.sleep(self._sync_interval_sec)
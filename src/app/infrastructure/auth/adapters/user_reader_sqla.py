@@ -0,0 +1,65 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.domain.entities.user import User
+from app.domain.value_objects.user_id import UserId
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.ports.user_reader import (
+    AuthSessionUserReader,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_sessions_table,
+)
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+
+
+class SqlaAuthSessionUserReader(AuthSessionUserReader):
+    """
+    Reads a session and its user with one joined SELECT.
+
+    Runs in the main unit of work, so the user lands in its identity map
+    and can be modified and committed by the handler like any other.
+    The session is read as plain columns and built detached,
+    since only the auth unit of work may track it.
+    """
+
+    def __init__(self, session: MainAsyncSession):
+        self._session = session
+
+    async def read_by_id_with_user(
+        self,
+        auth_session_id: str,
+    ) -> tuple[AuthSession, User | None] | None:
+        """
+        :raises DataMapperError:
+        """
+        table = auth_sessions_table
+        select_stmt: Select[tuple[UUID, datetime, User | None]] = (
+            select(table.c.user_id, table.c.expiration, User)
+            .select_from(table)
+            .outerjoin(User, users_table.c.id == table.c.user_id)
+            .where(table.c.id == auth_session_id)
+        )
+
+        try:
+            row = (await self._session.execute(select_stmt)).one_or_none()
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+        if row is None:
+            return None
+
+        user_id, expiration, user = row
+        auth_session = AuthSession(
+            id_=auth_session_id,
+            user_id=UserId(user_id),
+            expiration=expiration,
+        )
+        return auth_session, user
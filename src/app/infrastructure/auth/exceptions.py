@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from app.infrastructure.exceptions.base import InfrastructureError
 
 
@@ -7,3 +9,9 @@ class AuthenticationError(InfrastructureError):
 
 class AlreadyAuthenticatedError(InfrastructureError):
     pass
+
+
+class LoginThrottledError(InfrastructureError):
+    def __init__(self, message: str, *, retry_after: timedelta):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,79 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TypedDict
+
+from app.application.common.services.current_user import CurrentUserService
+from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.service import AuthSessionService
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ListSessionsRequest:
+    limit: int
+
+
+class AuthSessionView(TypedDict):
+    expiration: datetime
+    is_current: bool
+
+
+class ListSessionsResponse(TypedDict):
+    total: int
+    sessions: list[AuthSessionView]
+
+
+class ListSessionsHandler:
+    """
+    - Open to authenticated users.
+    - Retrieves the current user's live sessions, latest-expiring first,
+    along with their total number.
+    - Session IDs are not disclosed.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        auth_session_service: AuthSessionService,
+    ):
+        self._current_user_service = current_user_service
+        self._auth_session_service = auth_session_service
+
+    async def execute(self, request_data: ListSessionsRequest) -> ListSessionsResponse:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        """
+        log.info("List sessions: started for unknown user.")
+
+        current_user = await self._current_user_service.get_current_user()
+
+        log.info("List sessions: user identified. User ID: '%s'.", current_user.id_)
+
+        total = await self._auth_session_service.count_live_sessions_for_user(
+            current_user.id_,
+        )
+        auth_sessions: list[
+            AuthSession
+        ] = await self._auth_session_service.list_live_sessions_for_user(
+            current_user.id_,
+            request_data.limit,
+        )
+        current_session_id = self._auth_session_service.get_current_session_id()
+
+        response = ListSessionsResponse(
+            total=total,
+            sessions=[
+                AuthSessionView(
+                    expiration=auth_session.expiration,
+                    is_current=auth_session.id_ == current_session_id,
+                )
+                for auth_session in auth_sessions
+            ],
+        )
+
+        log.info("List sessions: done. User ID: '%s'.", current_user.id_)
+        return response
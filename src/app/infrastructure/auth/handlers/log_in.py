@@ -1,6 +1,8 @@
 import logging
 from dataclasses import dataclass
 
+from app.application.common.exceptions.concurrency import ConcurrentUpdateError
+from app.application.common.ports.transaction_manager import TransactionManager
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.application.common.services.current_user import CurrentUserService
 from app.domain.entities.user import User
@@ -18,6 +20,9 @@ from app.infrastructure.auth.handlers.constants import (
 )
 from app.infrastructure.auth.session.constants import AUTH_INVALID_PASSWORD
 from app.infrastructure.auth.session.service import AuthSessionService
+from app.infrastructure.auth.throttle.service import LoginThrottle
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
 
 log = logging.getLogger(__name__)
 
@@ -40,6 +45,10 @@ class LogInHandler:
     when accessing protected routes before expiration.
     - If the JWT is invalid, expired, or the session is terminated,
     the user loses authentication.
+    - Repeated attempts per username or client address are throttled
+    before the password is checked.
+    - Passwords hashed with an outdated work factor are rehashed
+    on successful login.
     """
 
     def __init__(
@@ -48,11 +57,15 @@ class LogInHandler:
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         auth_session_service: AuthSessionService,
+        transaction_manager: TransactionManager,
+        login_throttle: LoginThrottle,
     ):
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._auth_session_service = auth_session_service
+        self._transaction_manager = transaction_manager
+        self._login_throttle = login_throttle
 
     async def execute(self, request_data: LogInRequest) -> None:
         """
@@ -60,6 +73,8 @@ class LogInHandler:
         :raises AuthorizationError:
         :raises DataMapperError:
         :raises DomainFieldError:
+        :raises LoginThrottledError:
+        :raises PasswordHasherBusyError:
         :raises UserNotFoundByUsernameError:
         """
         log.info("Log in: started. Username: '%s'.", request_data.username)
@@ -73,17 +88,22 @@ class LogInHandler:
         username = Username(request_data.username)
         password = RawPassword(request_data.password)
 
+        # Rejects before the lookup, so unknown usernames are throttled too
+        # and a rejected attempt costs no hashing.
+        await self._login_throttle.check(username)
+
         user: User | None = await self._user_command_gateway.read_by_username(username)
         if user is None:
             raise UserNotFoundByUsernameError(username)
 
-        if not self._user_service.is_password_valid(user, password):
+        if not await self._user_service.is_password_valid(user, password):
             raise AuthenticationError(AUTH_INVALID_PASSWORD)
 
         if not user.is_active:
             raise AuthenticationError(AUTH_ACCOUNT_INACTIVE)
 
         await self._auth_session_service.create_session(user.id_)
+        await self._login_throttle.reset(username)
 
         log.info(
             "Log in: done. User, ID: '%s', username '%s', role '%s'.",
@@ -91,3 +111,34 @@ class LogInHandler:
             user.username.value,
             user.role.value,
         )
+
+        if self._user_service.needs_password_rehash(user):
+            await self._rehash_password(user, password)
+
+    async def _rehash_password(self, user: User, password: RawPassword) -> None:
+        """
+        Best-effort: a failed rehash never fails the login.
+        The write is optimistic, so a password changed concurrently
+        since the login read it is left alone instead of being overwritten,
+        and isn't retried.
+        """
+        # A conflicting write expires the user, so it's not read afterwards.
+        user_id = user.id_
+        try:
+            async with self._transaction_manager.savepoint():
+                await self._user_service.change_password(user, password)
+            await self._transaction_manager.commit()
+
+        except (
+            ConcurrentUpdateError,
+            DataMapperError,
+            PasswordHasherBusyError,
+        ) as error:
+            log.warning(
+                "Log in: password rehash skipped. User ID: '%s'. Error: '%s'",
+                user_id.value,
+                error,
+            )
+            return
+
+        log.info("Log in: password rehashed. User ID: '%s'.", user_id.value)
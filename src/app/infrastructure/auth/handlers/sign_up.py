@@ -6,6 +6,9 @@ from uuid import UUID
 from app.application.common.ports.flusher import Flusher
 from app.application.common.ports.transaction_manager import TransactionManager
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
 from app.application.common.services.current_user import CurrentUserService
 from app.domain.exceptions.user import UsernameAlreadyExistsError
 from app.domain.services.user import UserService
@@ -47,12 +50,14 @@ class SignUpHandler:
         user_command_gateway: UserCommandGateway,
         flusher: Flusher,
         transaction_manager: TransactionManager,
+        user_listing_invalidator: UserListingInvalidator,
     ):
         self._current_user_service = current_user_service
         self._user_service = user_service
         self._user_command_gateway = user_command_gateway
         self._flusher = flusher
         self._transaction_manager = transaction_manager
+        self._user_listing_invalidator = user_listing_invalidator
 
     async def execute(self, request_data: SignUpRequest) -> SignUpResponse:
         """
@@ -60,6 +65,7 @@ class SignUpHandler:
         :raises AuthorizationError:
         :raises DataMapperError:
         :raises DomainFieldError:
+        :raises PasswordHasherBusyError:
         :raises RoleAssignmentNotPermittedError:
         :raises UsernameAlreadyExistsError:
         """
@@ -74,7 +80,7 @@ class SignUpHandler:
         username = Username(request_data.username)
         password = RawPassword(request_data.password)
 
-        user = self._user_service.create_user(username, password)
+        user = await self._user_service.create_user(username, password)
 
         self._user_command_gateway.add(user)
 
@@ -84,6 +90,7 @@ class SignUpHandler:
             raise
 
         await self._transaction_manager.commit()
+        self._user_listing_invalidator.invalidate()
 
         log.info("Sign up: done. Username: '%s'.", user.username.value)
         return SignUpResponse(id=user.id_.value)
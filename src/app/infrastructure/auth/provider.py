@@ -0,0 +1,145 @@
+import logging
+from collections.abc import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.auth.adapters.extension_writer_sqla import (
+    SqlaAuthSessionExtensionWriter,
+)
+from app.infrastructure.auth.adapters.invalidation_channel_in_process import (
+    InProcessAuthSessionInvalidationChannel,
+)
+from app.infrastructure.auth.adapters.invalidation_channel_pg import (
+    PgNotifyAuthSessionInvalidationChannel,
+)
+from app.infrastructure.auth.adapters.login_attempt_store_sqla import (
+    SqlaLoginAttemptStore,
+)
+from app.infrastructure.auth.adapters.reaper_sqla import SqlaAuthSessionReaper
+from app.infrastructure.auth.adapters.revocation_epoch_sync_sqla import (
+    SqlaAuthRevocationEpochSynchronizer,
+)
+from app.infrastructure.auth.session.cache import AuthSessionCache
+from app.infrastructure.auth.session.config import (
+    AuthSessionCacheConfig,
+    AuthSessionExtensionWriterConfig,
+    AuthSessionReaperConfig,
+    AuthSessionStatelessConfig,
+)
+from app.infrastructure.auth.session.ports.extension_writer import (
+    AuthSessionExtensionWriter,
+)
+from app.infrastructure.auth.session.ports.invalidation_channel import (
+    AuthSessionInvalidationChannel,
+)
+from app.infrastructure.auth.session.revocation_epochs import AuthRevocationEpochs
+from app.infrastructure.auth.throttle.attempt_store_in_memory import (
+    InMemoryLoginAttemptStore,
+)
+from app.infrastructure.auth.throttle.config import LoginThrottleConfig
+from app.infrastructure.auth.throttle.ports.attempt_store import LoginAttemptStore
+from app.infrastructure.metrics import MetricsRegistry
+
+log = logging.getLogger(__name__)
+
+
+def get_auth_session_cache(cache_config: AuthSessionCacheConfig) -> AuthSessionCache:
+    return AuthSessionCache(cache_config)
+
+
+def get_auth_revocation_epochs(
+    stateless_config: AuthSessionStatelessConfig,
+) -> AuthRevocationEpochs:
+    return AuthRevocationEpochs(stateless_config)
+
+
+async def get_auth_session_invalidation_channel(
+    cache_config: AuthSessionCacheConfig,
+    auth_session_cache: AuthSessionCache,
+    engine: AsyncEngine,
+) -> AsyncIterator[AuthSessionInvalidationChannel]:
+    if not cache_config.enabled or cache_config.invalidation_channel == "in_process":
+        log.debug("In-process auth session invalidation channel initialized.")
+        yield InProcessAuthSessionInvalidationChannel(auth_session_cache)
+        return
+
+    channel = PgNotifyAuthSessionInvalidationChannel(
+        cache_config.listener_dsn,
+        engine,
+        auth_session_cache,
+    )
+    channel.start()
+    log.debug("Postgres auth session invalidation channel started.")
+    yield channel
+    log.debug("Stopping Postgres auth session invalidation channel...")
+    await channel.stop()
+    log.debug("Postgres auth session invalidation channel stopped.")
+
+
+async def get_auth_revocation_epoch_synchronizer(
+    stateless_config: AuthSessionStatelessConfig,
+    revocation_epochs: AuthRevocationEpochs,
+    engine: AsyncEngine,
+) -> AsyncIterator[SqlaAuthRevocationEpochSynchronizer]:
+    synchronizer = SqlaAuthRevocationEpochSynchronizer(
+        engine,
+        revocation_epochs,
+        stateless_config,
+    )
+    if not stateless_config.enabled:
+        yield synchronizer
+        return
+
+    synchronizer.start()
+    log.debug("Revocation epoch synchronizer started.")
+    yield synchronizer
+    log.debug("Stopping revocation epoch synchronizer...")
+    await synchronizer.stop()
+    log.debug("Revocation epoch synchronizer stopped.")
+
+
+async def get_auth_session_extension_writer(
+    writer_config: AuthSessionExtensionWriterConfig,
+    engine: AsyncEngine,
+) -> AsyncIterator[AuthSessionExtensionWriter]:
+    writer = SqlaAuthSessionExtensionWriter(engine, writer_config)
+    if not writer_config.enabled:
+        yield writer
+        return
+
+    writer.start()
+    log.debug("Auth session extension writer started.")
+    yield writer
+    log.debug("Stopping auth session extension writer...")
+    await writer.stop()
+    log.debug("Auth session extension writer stopped.")
+
+
+async def get_auth_session_reaper(
+    reaper_config: AuthSessionReaperConfig,
+    engine: AsyncEngine,
+    metrics: MetricsRegistry,
+) -> AsyncIterator[SqlaAuthSessionReaper]:
+    reaper = SqlaAuthSessionReaper(engine, reaper_config, metrics)
+    if not reaper_config.enabled:
+        yield reaper
+        return
+
+    reaper.start()
+    log.debug("Auth session reaper started.")
+    yield reaper
+    log.debug("Stopping auth session reaper...")
+    await reaper.stop()
+    log.debug("Auth session reaper stopped.")
+
+
+def get_login_attempt_store(
+    throttle_config: LoginThrottleConfig,
+    engine: AsyncEngine,
+) -> LoginAttemptStore:
+    if throttle_config.store == "postgres":
+        log.debug("Postgres login attempt store initialized.")
+        return SqlaLoginAttemptStore(engine, throttle_config)
+
+    log.debug("In-memory login attempt store initialized.")
+    return InMemoryLoginAttemptStore(throttle_config)
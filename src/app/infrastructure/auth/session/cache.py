@@ -0,0 +1,119 @@
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.domain.value_objects.user_id import UserId
+from app.infrastructure.auth.session.config import AuthSessionCacheConfig
+from app.infrastructure.auth.session.model import AuthSession
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _CacheEntry:
+    user_id: UserId
+    expiration: datetime
+    stored_at: float
+
+
+class AuthSessionCache:
+    """
+    App-scoped, size-bounded LRU cache of auth sessions with a TTL.
+    Shared by all requests of a worker, so it stores plain snapshots
+    and hands out fresh `AuthSession` copies that are never attached
+    to a request's ORM session.
+
+    Entries are evicted on invalidation (locally or via
+    `AuthSessionInvalidationChannel`), so the TTL only bounds staleness
+    when an invalidation is lost. Each eviction bumps the cache's generation,
+    and a session read under an older one is not stored, so a read racing
+    an invalidation can't put a revoked session back.
+    """
+
+    def __init__(
+        self,
+        config: AuthSessionCacheConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._enabled = config.enabled
+        self._max_size = config.max_size
+        self._ttl_sec = config.ttl.total_seconds()
+        self._clock = clock
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._ids_by_user: dict[UserId, set[str]] = {}
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, auth_session_id: str) -> AuthSession | None:
+        if not self._enabled:
+            return None
+
+        entry = self._entries.get(auth_session_id)
+        if entry is None:
+            return None
+
+        if self._clock() - entry.stored_at >= self._ttl_sec:
+            self._remove(auth_session_id)
+            return None
+
+        self._entries.move_to_end(auth_session_id)
+        return AuthSession(
+            id_=auth_session_id,
+            user_id=entry.user_id,
+            expiration=entry.expiration,
+        )
+
+    def put(self, auth_session: AuthSession, generation: int) -> None:
+        if not self._enabled or generation != self._generation:
+            return
+
+        self._remove(auth_session.id_)
+        self._entries[auth_session.id_] = _CacheEntry(
+            user_id=auth_session.user_id,
+            expiration=auth_session.expiration,
+            stored_at=self._clock(),
+        )
+        self._ids_by_user.setdefault(auth_session.user_id, set()).add(
+            auth_session.id_,
+        )
+
+        while len(self._entries) > self._max_size:
+            oldest_id = next(iter(self._entries))
+            self._remove(oldest_id)
+
+    def evict(self, auth_session_id: str) -> None:
+        self._generation += 1
+        self._remove(auth_session_id)
+
+    def evict_user(self, user_id: UserId) -> None:
+        self._generation += 1
+        for auth_session_id in self._ids_by_user.pop(user_id, set()):
+            self._entries.pop(auth_session_id, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._ids_by_user.clear()
+        log.debug("Auth session cache cleared.")
+
+    def _remove(self, auth_session_id: str) -> None:
+        entry = self._entries.pop(auth_session_id, None)
+        if entry is None:
+            return
+
+        user_session_ids = self._ids_by_user.get(entry.user_id)
+        if user_session_ids is None:
+            return
+
+        user_session_ids.discard(auth_session_id)
+        if not user_session_ids:
+            del self._ids_by_user[entry.user_id]
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Literal
+
+from app.infrastructure.persistence_sqla.config import PostgresDsn
+
+AuthSessionInvalidationChannelKind = Literal["in_process", "pg_notify"]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthSessionCacheConfig:
+    enabled: bool
+    max_size: int
+    ttl: timedelta
+    invalidation_channel: AuthSessionInvalidationChannelKind
+    # `LISTEN` holds session state, so it bypasses any connection pooler.
+    listener_dsn: PostgresDsn
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthSessionStatelessConfig:
+    enabled: bool
+    epoch_sync_interval: timedelta
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthSessionExtensionWriterConfig:
+    enabled: bool
+    flush_interval: timedelta
+    max_batch_size: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthSessionReaperConfig:
+    enabled: bool
+    interval: timedelta
+    batch_size: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthSessionLookupConfig:
+    join_user: bool
@@ -5,7 +5,17 @@ AUTH_IS_UNAVAILABLE: Final[str] = (
     "Authentication is currently unavailable. Please try again later."
 )
 AUTH_NOT_AUTHENTICATED: Final[str] = "Not authenticated."
+AUTH_REVOCATION_EPOCH_SYNC_FAILED: Final[str] = "Revocation epoch sync failed."
 AUTH_SESSION_EXPIRED: Final[str] = "Session expired."
 AUTH_SESSION_EXTENSION_FAILED: Final[str] = "Auth session extension failed."
+AUTH_SESSION_EXTENSION_FLUSH_FAILED: Final[str] = "Auth session extension flush failed."
 AUTH_SESSION_EXTRACTION_FAILED: Final[str] = "Auth session extraction failed."
+AUTH_SESSION_INVALIDATION_LISTENER_FAILED: Final[str] = (
+    "Auth session invalidation listener failed."
+)
+AUTH_SESSION_INVALIDATION_MALFORMED: Final[str] = "Malformed auth session invalidation."
+AUTH_SESSION_INVALIDATION_PUBLISH_FAILED: Final[str] = (
+    "Auth session invalidation publishing failed."
+)
 AUTH_SESSION_NOT_FOUND: Final[str] = "Session not found."
+AUTH_SESSION_REAPING_FAILED: Final[str] = "Expired auth session reaping failed."
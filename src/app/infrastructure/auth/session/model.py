@@ -17,3 +17,17 @@ class AuthSession:
     id_: str
     user_id: UserId
     expiration: datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthSessionClaims:
+    """
+    Self-contained view of an auth session, as carried by a signed transport.
+    Allows the session to be trusted without a storage read while
+    `revocation_epoch` matches the user's current one.
+    """
+
+    auth_session_id: str
+    user_id: UserId
+    expiration: datetime
+    revocation_epoch: int
@@ -0,0 +1,15 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from app.infrastructure.auth.session.model import AuthSession
+
+
+class AuthSessionExtensionWriter(Protocol):
+    """
+    Persists sliding session extensions outside the request's transaction.
+    Extensions of the same session are coalesced, only the latest
+    expiration is written.
+    """
+
+    @abstractmethod
+    def schedule(self, auth_session: AuthSession) -> None: ...
@@ -1,4 +1,6 @@
 from abc import abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Protocol
 
 from app.domain.value_objects.user_id import UserId
@@ -23,6 +25,23 @@ class AuthSessionGateway(Protocol):
         :raises DataMapperError:
         """
 
+    @abstractmethod
+    async def read_live_for_user(
+        self,
+        user_id: UserId,
+        now: datetime,
+        limit: int,
+    ) -> list[AuthSession]:
+        """
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def count_live_for_user(self, user_id: UserId, now: datetime) -> int:
+        """
+        :raises DataMapperError:
+        """
+
     @abstractmethod
     async def update(self, auth_session: AuthSession) -> None:
         """
@@ -40,3 +59,9 @@ class AuthSessionGateway(Protocol):
         """
         :raises DataMapperError:
         """
+
+    @abstractmethod
+    async def delete_all_for_users(self, user_ids: Sequence[UserId]) -> None:
+        """
+        :raises DataMapperError:
+        """
@@ -0,0 +1,24 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
+
+from app.domain.value_objects.user_id import UserId
+
+
+class AuthSessionInvalidationChannel(Protocol):
+    """
+    Propagates auth session invalidations to the `AuthSessionCache`
+    of every worker, including the current one.
+
+    Publishing is best-effort: a lost message is bounded by the cache TTL,
+    so implementations log failures instead of raising.
+    """
+
+    @abstractmethod
+    async def publish_session(self, auth_session_id: str) -> None: ...
+
+    @abstractmethod
+    async def publish_user(self, user_id: UserId) -> None: ...
+
+    @abstractmethod
+    async def publish_users(self, user_ids: Sequence[UserId]) -> None: ...
@@ -0,0 +1,31 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.value_objects.user_id import UserId
+
+
+class AuthRevocationEpochGateway(Protocol):
+    """
+    Defined to allow easier mocking and swapping
+    of implementations in the same layer.
+    """
+
+    @abstractmethod
+    async def bump(self, user_id: UserId) -> int:
+        """
+        Increments the user's revocation epoch within the current transaction
+        and returns the new value.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def bump_many(self, user_ids: Sequence[UserId]) -> dict[UUID, int]:
+        """
+        `bump` for several users in one statement.
+
+        :returns: The new value by user id.
+        :raises DataMapperError:
+        """
@@ -1,15 +1,18 @@
 from abc import abstractmethod
 from typing import Protocol
 
-from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.model import AuthSession, AuthSessionClaims
 
 
 class AuthSessionTransport(Protocol):
     @abstractmethod
-    def deliver(self, auth_session: AuthSession) -> None: ...
+    def deliver(self, auth_session: AuthSession, revocation_epoch: int) -> None: ...
 
     @abstractmethod
     def extract_id(self) -> str | None: ...
 
+    @abstractmethod
+    def extract_claims(self) -> AuthSessionClaims | None: ...
+
     @abstractmethod
     def remove_current(self) -> None: ...
@@ -0,0 +1,19 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from app.domain.entities.user import User
+from app.infrastructure.auth.session.model import AuthSession
+
+
+class AuthSessionUserReader(Protocol):
+    @abstractmethod
+    async def read_by_id_with_user(
+        self,
+        auth_session_id: str,
+    ) -> tuple[AuthSession, User | None] | None:
+        """
+        Returns `None` if the session doesn't exist,
+        and no user if the session's user doesn't.
+
+        :raises DataMapperError:
+        """
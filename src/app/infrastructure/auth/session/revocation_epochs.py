@@ -0,0 +1,57 @@
+import time
+from collections.abc import Callable, Iterable
+from typing import Final
+from uuid import UUID
+
+from app.domain.value_objects.user_id import UserId
+from app.infrastructure.auth.session.config import AuthSessionStatelessConfig
+
+STALENESS_SYNC_INTERVALS: Final[int] = 3
+
+
+class AuthRevocationEpochs:
+    """
+    App-scoped map of per-user revocation epochs.
+    Only users whose sessions have ever been revoked are stored,
+    everyone else implicitly has epoch 0.
+
+    The map is considered fresh for a few sync intervals after the last
+    successful sync. A stale map must not be trusted, otherwise revocations
+    made by other workers would go unnoticed for an unbounded time.
+    """
+
+    def __init__(
+        self,
+        config: AuthSessionStatelessConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_staleness_sec = (
+            config.epoch_sync_interval.total_seconds() * STALENESS_SYNC_INTERVALS
+        )
+        self._clock = clock
+        self._epochs: dict[UUID, int] = {}
+        self._synced_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._epochs)
+
+    @property
+    def is_fresh(self) -> bool:
+        if self._synced_at is None:
+            return False
+        return self._clock() - self._synced_at <= self._max_staleness_sec
+
+    def get(self, user_id: UserId) -> int:
+        return self._epochs.get(user_id.value, 0)
+
+    def advance(self, user_id: UUID, epoch: int) -> None:
+        """
+        Epochs never go backwards, so out-of-order updates are harmless.
+        """
+        if epoch > self._epochs.get(user_id, 0):
+            self._epochs[user_id] = epoch
+
+    def apply_sync(self, epochs: Iterable[tuple[UUID, int]]) -> None:
+        for user_id, epoch in epochs:
+            self.advance(user_id, epoch)
+        self._synced_at = self._clock()
@@ -1,8 +1,17 @@
 import logging
+from collections.abc import Sequence
+from dataclasses import replace
 from datetime import datetime
 
+from app.domain.entities.user import User
 from app.domain.value_objects.user_id import UserId
 from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.auth.session.cache import AuthSessionCache
+from app.infrastructure.auth.session.config import (
+    AuthSessionExtensionWriterConfig,
+    AuthSessionLookupConfig,
+    AuthSessionStatelessConfig,
+)
 from app.infrastructure.auth.session.constants import (
     AUTH_IS_UNAVAILABLE,
     AUTH_NOT_AUTHENTICATED,
@@ -14,14 +23,27 @@ from app.infrastructure.auth.session.constants import (
 from app.infrastructure.auth.session.id_generator_str import (
     StrAuthSessionIdGenerator,
 )
-from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.model import AuthSession, AuthSessionClaims
+from app.infrastructure.auth.session.ports.extension_writer import (
+    AuthSessionExtensionWriter,
+)
 from app.infrastructure.auth.session.ports.gateway import (
     AuthSessionGateway,
 )
+from app.infrastructure.auth.session.ports.invalidation_channel import (
+    AuthSessionInvalidationChannel,
+)
+from app.infrastructure.auth.session.ports.revocation_epoch_gateway import (
+    AuthRevocationEpochGateway,
+)
 from app.infrastructure.auth.session.ports.transaction_manager import (
     AuthSessionTransactionManager,
 )
 from app.infrastructure.auth.session.ports.transport import AuthSessionTransport
+from app.infrastructure.auth.session.ports.user_reader import (
+    AuthSessionUserReader,
+)
+from app.infrastructure.auth.session.revocation_epochs import AuthRevocationEpochs
 from app.infrastructure.auth.session.timer_utc import UtcAuthSessionTimer
 from app.infrastructure.exceptions.gateway import DataMapperError
 
@@ -36,13 +58,34 @@ class AuthSessionService:
         auth_transaction_manager: AuthSessionTransactionManager,
         auth_session_id_generator: StrAuthSessionIdGenerator,
         auth_session_timer: UtcAuthSessionTimer,
+        auth_session_cache: AuthSessionCache,
+        auth_session_invalidation_channel: AuthSessionInvalidationChannel,
+        auth_revocation_epoch_gateway: AuthRevocationEpochGateway,
+        auth_revocation_epochs: AuthRevocationEpochs,
+        auth_session_stateless_config: AuthSessionStatelessConfig,
+        auth_session_extension_writer: AuthSessionExtensionWriter,
+        auth_session_extension_writer_config: AuthSessionExtensionWriterConfig,
+        auth_session_user_reader: AuthSessionUserReader,
+        auth_session_lookup_config: AuthSessionLookupConfig,
     ):
         self._auth_session_gateway = auth_session_gateway
         self._auth_session_transport = auth_session_transport
         self._auth_transaction_manager = auth_transaction_manager
         self._auth_session_id_generator = auth_session_id_generator
         self._auth_session_timer = auth_session_timer
+        self._auth_session_cache = auth_session_cache
+        self._auth_session_invalidation_channel = auth_session_invalidation_channel
+        self._auth_revocation_epoch_gateway = auth_revocation_epoch_gateway
+        self._auth_revocation_epochs = auth_revocation_epochs
+        self._is_stateless_enabled = auth_session_stateless_config.enabled
+        self._auth_session_extension_writer = auth_session_extension_writer
+        self._is_write_behind_enabled = auth_session_extension_writer_config.enabled
+        self._auth_session_user_reader = auth_session_user_reader
+        self._is_user_join_enabled = auth_session_lookup_config.join_user
         self._cached_auth_session: AuthSession | None = None
+        # The shared cache's generation when the current session was read.
+        self._cache_generation = auth_session_cache.generation
+        self._loaded_user: User | None = None
 
     async def create_session(self, user_id: UserId) -> None:
         """
@@ -57,6 +100,7 @@ class AuthSessionService:
             user_id=user_id,
             expiration=expiration,
         )
+        cache_generation = self._auth_session_cache.generation
 
         try:
             self._auth_session_gateway.add(auth_session)
@@ -65,7 +109,11 @@ class AuthSessionService:
         except DataMapperError as error:
             raise AuthenticationError(AUTH_IS_UNAVAILABLE) from error
 
-        self._auth_session_transport.deliver(auth_session)
+        self._auth_session_cache.put(auth_session, cache_generation)
+        self._auth_session_transport.deliver(
+            auth_session,
+            self._auth_revocation_epochs.get(user_id),
+        )
 
         log.debug(
             "Create auth session: done. User ID: '%s', Auth session id: '%s'.",
@@ -79,6 +127,11 @@ class AuthSessionService:
         """
         log.debug("Get authenticated user ID: started.")
 
+        if self._is_stateless_enabled:
+            stateless_user_id = self._verify_stateless()
+            if stateless_user_id is not None:
+                return stateless_user_id
+
         raw_auth_session = await self._load_current_session()
         valid_auth_session = await self._validate_and_extend_session(raw_auth_session)
 
@@ -89,6 +142,38 @@ class AuthSessionService:
         )
         return valid_auth_session.user_id
 
+    def get_loaded_user(self) -> User | None:
+        """
+        Returns the authenticated user if it was read together with the session.
+        """
+        return self._loaded_user
+
+    def get_current_session_id(self) -> str | None:
+        return self._auth_session_transport.extract_id()
+
+    async def list_live_sessions_for_user(
+        self,
+        user_id: UserId,
+        limit: int,
+    ) -> list[AuthSession]:
+        """
+        :raises DataMapperError:
+        """
+        return await self._auth_session_gateway.read_live_for_user(
+            user_id,
+            self._auth_session_timer.current_time,
+            limit,
+        )
+
+    async def count_live_sessions_for_user(self, user_id: UserId) -> int:
+        """
+        :raises DataMapperError:
+        """
+        return await self._auth_session_gateway.count_live_for_user(
+            user_id,
+            self._auth_session_timer.current_time,
+        )
+
     async def invalidate_current_session(self) -> None:
         log.debug("Invalidate current session: started. Auth session ID: unknown.")
 
@@ -116,6 +201,7 @@ class AuthSessionService:
             log.error("%s: '%s'", AUTH_SESSION_EXTRACTION_FAILED, error)
 
         if auth_session is None:
+            self._auth_session_cache.evict(auth_session_id)
             log.warning(
                 "Invalidate current session failed: partially failed. "
                 "Session ID was removed from transport, "
@@ -125,6 +211,7 @@ class AuthSessionService:
 
         try:
             await self._auth_session_gateway.delete(auth_session.id_)
+            revocation_epoch = await self._bump_revocation_epoch(auth_session.user_id)
             await self._auth_transaction_manager.commit()
 
         except DataMapperError:
@@ -137,6 +224,12 @@ class AuthSessionService:
                 ),
                 auth_session.id_,
             )
+            return
+
+        self._advance_revocation_epoch(auth_session.user_id, revocation_epoch)
+        await self._auth_session_invalidation_channel.publish_session(
+            auth_session.id_,
+        )
 
     async def invalidate_all_sessions_for_user(self, user_id: UserId) -> None:
         """
@@ -148,13 +241,45 @@ class AuthSessionService:
         )
 
         await self._auth_session_gateway.delete_all_for_user(user_id)
+        revocation_epoch = await self._bump_revocation_epoch(user_id)
         await self._auth_transaction_manager.commit()
+        self._advance_revocation_epoch(user_id, revocation_epoch)
+        await self._auth_session_invalidation_channel.publish_user(user_id)
 
         log.debug(
             "Invalidate all sessions for user: done. User id: '%s'.",
             user_id.value,
         )
 
+    async def invalidate_all_sessions_for_users(
+        self,
+        user_ids: Sequence[UserId],
+    ) -> None:
+        """
+        `invalidate_all_sessions_for_user` for many users at once,
+        with one statement per step instead of one per user.
+
+        :raises DataMapperError:
+        """
+        log.debug(
+            "Invalidate all sessions for users: started. Users: %d.",
+            len(user_ids),
+        )
+
+        await self._auth_session_gateway.delete_all_for_users(user_ids)
+        revocation_epochs = await self._auth_revocation_epoch_gateway.bump_many(
+            user_ids,
+        )
+        await self._auth_transaction_manager.commit()
+        for user_id, revocation_epoch in revocation_epochs.items():
+            self._auth_revocation_epochs.advance(user_id, revocation_epoch)
+        await self._auth_session_invalidation_channel.publish_users(user_ids)
+
+        log.debug(
+            "Invalidate all sessions for users: done. Users: %d.",
+            len(user_ids),
+        )
+
     async def _load_current_session(self) -> AuthSession:
         """
         :raises AuthenticationError:
@@ -178,12 +303,22 @@ class AuthSessionService:
             auth_session_id,
         )
 
-        try:
-            auth_session: (
-                AuthSession | None
-            ) = await self._auth_session_gateway.read_by_id(
-                auth_session_id,
+        shared_auth_session = self._auth_session_cache.get(auth_session_id)
+        if shared_auth_session is not None and not self._needs_extension(
+            shared_auth_session,
+        ):
+            self._cached_auth_session = shared_auth_session
+            log.debug(
+                "Load current auth session: done (from shared cache). "
+                "Auth session id: %s.",
+                shared_auth_session.id_,
             )
+            return shared_auth_session
+
+        self._cache_generation = self._auth_session_cache.generation
+        try:
+            auth_session = await self._read_session(auth_session_id)
+
         except DataMapperError as error:
             log.error("%s: '%s'", AUTH_SESSION_EXTRACTION_FAILED, error)
             raise AuthenticationError(AUTH_NOT_AUTHENTICATED) from error
@@ -193,6 +328,7 @@ class AuthSessionService:
             raise AuthenticationError(AUTH_NOT_AUTHENTICATED)
 
         self._cached_auth_session = auth_session
+        self._auth_session_cache.put(auth_session, self._cache_generation)
 
         log.debug(
             "Load current auth session: done. Auth session id: %s.",
@@ -200,6 +336,25 @@ class AuthSessionService:
         )
         return auth_session
 
+    async def _read_session(self, auth_session_id: str) -> AuthSession | None:
+        """
+        Sessions and users share a database by default, so the user is read
+        in the same round trip instead of by a second query afterwards.
+
+        :raises DataMapperError:
+        """
+        if not self._is_user_join_enabled:
+            return await self._auth_session_gateway.read_by_id(auth_session_id)
+
+        result = await self._auth_session_user_reader.read_by_id_with_user(
+            auth_session_id,
+        )
+        if result is None:
+            return None
+
+        auth_session, self._loaded_user = result
+        return auth_session
+
     async def _validate_and_extend_session(
         self,
         auth_session: AuthSession,
@@ -217,10 +372,7 @@ class AuthSessionService:
             log.debug(AUTH_SESSION_EXPIRED)
             raise AuthenticationError(AUTH_NOT_AUTHENTICATED)
 
-        if (
-            auth_session.expiration - now
-            > self._auth_session_timer.refresh_trigger_interval
-        ):
+        if not self._needs_extension(auth_session):
             log.debug(
                 "Validate and extend auth session: validated without extension. "
                 "Auth session id: %s.",
@@ -228,24 +380,96 @@ class AuthSessionService:
             )
             return auth_session
 
-        original_expiration = auth_session.expiration
-        auth_session.expiration = self._auth_session_timer.auth_session_expiration
+        # A copy: the read session may be tracked by the request's ORM session,
+        # which would otherwise flush the new expiration on its next commit.
+        extended_auth_session = replace(
+            auth_session,
+            expiration=self._auth_session_timer.auth_session_expiration,
+        )
+
+        if self._is_write_behind_enabled:
+            self._auth_session_extension_writer.schedule(extended_auth_session)
 
-        try:
-            await self._auth_session_gateway.update(auth_session)
-            await self._auth_transaction_manager.commit()
+        else:
+            try:
+                await self._auth_session_gateway.update(extended_auth_session)
+                await self._auth_transaction_manager.commit()
 
-        except DataMapperError as error:
-            log.error("%s: '%s'", AUTH_SESSION_EXTENSION_FAILED, error)
-            auth_session.expiration = original_expiration
-            return auth_session
+            except DataMapperError as error:
+                log.error("%s: '%s'", AUTH_SESSION_EXTENSION_FAILED, error)
+                return auth_session
 
-        self._auth_session_transport.deliver(auth_session)
+        self._auth_session_cache.put(extended_auth_session, self._cache_generation)
+        self._auth_session_transport.deliver(
+            extended_auth_session,
+            self._auth_revocation_epochs.get(extended_auth_session.user_id),
+        )
 
-        self._cached_auth_session = auth_session
+        self._cached_auth_session = extended_auth_session
 
         log.debug(
             "Validate and extend auth session: done. Auth session id: %s.",
-            auth_session.id_,
+            extended_auth_session.id_,
         )
-        return auth_session
+        return extended_auth_session
+
+    def _needs_extension(self, auth_session: AuthSession) -> bool:
+        """
+        Sessions about to be extended are never served from the shared cache:
+        another worker may have extended them already, and a stale copy
+        could be seen as expired.
+        """
+        now = self._auth_session_timer.current_time
+        return (
+            auth_session.expiration - now
+            <= self._auth_session_timer.refresh_trigger_interval
+        )
+
+    def _verify_stateless(self) -> UserId | None:
+        """
+        Trusts the transport's signed claims without a storage read
+        while the user's revocation epoch is unchanged and the session
+        doesn't need extension yet. Returns `None` to fall back
+        to the stateful path, which also reissues the claims.
+        """
+        if not self._auth_revocation_epochs.is_fresh:
+            log.debug("Stateless verification skipped: revocation epochs are stale.")
+            return None
+
+        claims: AuthSessionClaims | None = self._auth_session_transport.extract_claims()
+        if claims is None:
+            return None
+
+        if claims.revocation_epoch != self._auth_revocation_epochs.get(
+            claims.user_id,
+        ):
+            log.debug(
+                "Stateless verification skipped: revocation epoch changed. "
+                "Auth session id: %s.",
+                claims.auth_session_id,
+            )
+            return None
+
+        now = self._auth_session_timer.current_time
+        if claims.expiration - now <= self._auth_session_timer.refresh_trigger_interval:
+            return None
+
+        log.debug(
+            "Get authenticated user ID: done (stateless). "
+            "Auth session ID: %s. User ID: %s.",
+            claims.auth_session_id,
+            claims.user_id.value,
+        )
+        return claims.user_id
+
+    async def _bump_revocation_epoch(self, user_id: UserId) -> int:
+        """
+        Bumped even while stateless verification is off: tokens revoked
+        meanwhile must not pass it once it's turned on.
+
+        :raises DataMapperError:
+        """
+        return await self._auth_revocation_epoch_gateway.bump(user_id)
+
+    def _advance_revocation_epoch(self, user_id: UserId, revocation_epoch: int) -> None:
+        self._auth_revocation_epochs.advance(user_id.value, revocation_epoch)
@@ -0,0 +1,68 @@
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from datetime import timedelta
+
+from app.infrastructure.auth.throttle.config import LoginThrottleConfig
+from app.infrastructure.auth.throttle.ports.attempt_store import LoginAttemptStore
+
+
+class InMemoryLoginAttemptStore(LoginAttemptStore):
+    """
+    Per-worker sliding-window log.
+
+    Attempts are appended in clock order, so each key's deque stays sorted
+    and expired attempts are popped from its left end. Keys are kept in
+    last-attempt order, so idle keys are swept from the front of a single
+    ordered dict. Every attempt is pushed and popped once,
+    which makes the bookkeeping O(1) amortized.
+    """
+
+    def __init__(
+        self,
+        config: LoginThrottleConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._window_sec = config.window.total_seconds()
+        self._max_keys = config.max_tracked_keys
+        self._clock = clock
+        self._attempts: OrderedDict[str, deque[float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._attempts)
+
+    async def try_acquire(self, key: str, limit: int) -> timedelta | None:
+        now = self._clock()
+        self._sweep_idle_keys(now)
+
+        attempts = self._attempts.get(key)
+        if attempts is None:
+            attempts = deque()
+        else:
+            self._expire(attempts, now)
+
+        if len(attempts) >= limit:
+            return timedelta(seconds=attempts[0] + self._window_sec - now)
+
+        attempts.append(now)
+        self._attempts[key] = attempts
+        self._attempts.move_to_end(key)
+        if len(self._attempts) > self._max_keys:
+            self._attempts.popitem(last=False)
+        return None
+
+    async def reset(self, key: str) -> None:
+        self._attempts.pop(key, None)
+
+    def _expire(self, attempts: deque[float], now: float) -> None:
+        threshold = now - self._window_sec
+        while attempts and attempts[0] <= threshold:
+            attempts.popleft()
+
+    def _sweep_idle_keys(self, now: float) -> None:
+        threshold = now - self._window_sec
+        while self._attempts:
+            key, attempts = next(iter(self._attempts.items()))
+            if attempts and attempts[-1] > threshold:
+                return
+            del self._attempts[key]
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Literal
+
+LoginAttemptStoreKind = Literal["in_memory", "postgres"]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LoginThrottleConfig:
+    enabled: bool
+    store: LoginAttemptStoreKind
+    window: timedelta
+    max_attempts_per_username: int
+    max_attempts_per_address: int
+    max_tracked_keys: int
@@ -0,0 +1,4 @@
+from typing import Final
+
+LOGIN_ATTEMPT_STORE_FAILED: Final[str] = "Login attempt store failed, attempt allowed."
+LOGIN_THROTTLED: Final[str] = "Too many login attempts. Please try again later."
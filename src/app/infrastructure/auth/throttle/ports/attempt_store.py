@@ -0,0 +1,21 @@
+from abc import abstractmethod
+from datetime import timedelta
+from typing import Protocol
+
+
+class LoginAttemptStore(Protocol):
+    """
+    Sliding-window attempt counter keyed by an arbitrary string.
+    Rejected attempts are not recorded.
+    """
+
+    @abstractmethod
+    async def try_acquire(self, key: str, limit: int) -> timedelta | None:
+        """
+        Records an attempt unless `limit` attempts were already made
+        within the window. Returns `None` when the attempt is allowed,
+        otherwise how long to wait before the next one can be.
+        """
+
+    @abstractmethod
+    async def reset(self, key: str) -> None: ...
@@ -0,0 +1,85 @@
+import logging
+from typing import Literal
+
+from app.domain.value_objects.username.username import Username
+from app.infrastructure.auth.exceptions import LoginThrottledError
+from app.infrastructure.auth.throttle.config import LoginThrottleConfig
+from app.infrastructure.auth.throttle.constants import LOGIN_THROTTLED
+from app.infrastructure.auth.throttle.ports.attempt_store import LoginAttemptStore
+from app.infrastructure.auth.throttle.ports.client_address import (
+    ClientAddressProvider,
+)
+from app.infrastructure.metrics import MetricsRegistry
+
+log = logging.getLogger(__name__)
+
+ThrottleScope = Literal["address", "username"]
+
+
+class LoginThrottle:
+    """
+    Limits login attempts per client address and per username,
+    so repeated guessing is rejected before any password is verified.
+    """
+
+    def __init__(
+        self,
+        config: LoginThrottleConfig,
+        login_attempt_store: LoginAttemptStore,
+        client_address_provider: ClientAddressProvider,
+        metrics: MetricsRegistry,
+    ):
+        self._enabled = config.enabled
+        self._max_attempts_per_username = config.max_attempts_per_username
+        self._max_attempts_per_address = config.max_attempts_per_address
+        self._login_attempt_store = login_attempt_store
+        self._client_address_provider = client_address_provider
+        self._decisions = metrics.counter(
+            "login_throttle_decisions_total",
+            "Login throttle decisions by scope and outcome.",
+            label_names=("scope", "decision"),
+        )
+
+    async def check(self, username: Username) -> None:
+        """
+        Counts the attempt against the address first,
+        so a rejected address doesn't consume the username's budget.
+
+        :raises LoginThrottledError:
+        """
+        if not self._enabled:
+            return
+
+        client_address = self._client_address_provider.get_client_address()
+        if client_address is not None:
+            await self._acquire(
+                "address",
+                f"address:{client_address}",
+                self._max_attempts_per_address,
+            )
+        await self._acquire(
+            "username",
+            f"username:{username.value}",
+            self._max_attempts_per_username,
+        )
+
+    async def reset(self, username: Username) -> None:
+        """
+        Clears the username's attempts after a successful login.
+        Address attempts are kept, a shared address may host an attacker.
+        """
+        if self._enabled:
+            await self._login_attempt_store.reset(f"username:{username.value}")
+
+    async def _acquire(self, scope: ThrottleScope, key: str, limit: int) -> None:
+        """
+        :raises LoginThrottledError:
+        """
+        retry_after = await self._login_attempt_store.try_acquire(key, limit)
+        if retry_after is None:
+            self._decisions.inc(scope=scope, decision="allowed")
+            return
+
+        self._decisions.inc(scope=scope, decision="rejected")
+        log.info("Login throttled by %s. Retry after: %s.", scope, retry_after)
+        raise LoginThrottledError(LOGIN_THROTTLED, retry_after=retry_after)
@@ -0,0 +1,48 @@
+"""auth revocation epochs
+
+Revision ID: bb5e9a537557
+Revises: e325187c1eeb
+Create Date: 2026-10-17 10:12:41.204518
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "bb5e9a537557"
+down_revision: Union[str, None] = "e325187c1eeb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "auth_revocation_epochs",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("epoch", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("user_id", name=op.f("pk_auth_revocation_epochs")),
+    )
+    op.create_index(
+        op.f("ix_auth_revocation_epochs_updated_at"),
+        "auth_revocation_epochs",
+        ["updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_auth_revocation_epochs_updated_at"),
+        table_name="auth_revocation_epochs",
+    )
+    op.drop_table("auth_revocation_epochs")
@@ -0,0 +1,41 @@
+"""auth sessions expiration index
+
+Revision ID: 4f0c2d9a7e13
+Revises: bb5e9a537557
+Create Date: 2026-10-17 11:40:08.531902
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4f0c2d9a7e13"
+down_revision: Union[str, None] = "bb5e9a537557"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so logins keep writing sessions during the migration.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_auth_sessions_expiration"),
+            "auth_sessions",
+            ["expiration"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_auth_sessions_expiration"),
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,43 @@
+"""auth sessions user id expiration index
+
+Revision ID: 9d3b71c0a5e8
+Revises: 4f0c2d9a7e13
+Create Date: 2026-10-17 12:15:27.904133
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3b71c0a5e8"
+down_revision: Union[str, None] = "4f0c2d9a7e13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # `id` is included so bulk revocation and the live session listing
+    # are answered from the index alone, without visiting the table.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_auth_sessions_user_id_expiration",
+            "auth_sessions",
+            ["user_id", "expiration"],
+            unique=False,
+            postgresql_include=["id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_auth_sessions_user_id_expiration",
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,48 @@
+"""login attempt counters
+
+Revision ID: c7e2a4f91b36
+Revises: 9d3b71c0a5e8
+Create Date: 2026-10-17 13:05:12.581904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e2a4f91b36"
+down_revision: Union[str, None] = "9d3b71c0a5e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "login_attempt_counters",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("window_id", sa.BigInteger(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "key",
+            "window_id",
+            name=op.f("pk_login_attempt_counters"),
+        ),
+        prefixes=["UNLOGGED"],
+    )
+    op.create_index(
+        "ix_login_attempt_counters_window_id",
+        "login_attempt_counters",
+        ["window_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_login_attempt_counters_window_id",
+        table_name="login_attempt_counters",
+    )
+    op.drop_table("login_attempt_counters")
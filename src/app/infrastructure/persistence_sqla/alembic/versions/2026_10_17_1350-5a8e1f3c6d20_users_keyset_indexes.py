@@ -0,0 +1,54 @@
+"""users keyset indexes
+
+Revision ID: 5a8e1f3c6d20
+Revises: c7e2a4f91b36
+Create Date: 2026-10-17 13:50:44.117203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5a8e1f3c6d20"
+down_revision: Union[str, None] = "c7e2a4f91b36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_role_id",
+            "users",
+            ["role", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_users_is_active_id",
+            "users",
+            ["is_active", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_is_active_id",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_users_role_id",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
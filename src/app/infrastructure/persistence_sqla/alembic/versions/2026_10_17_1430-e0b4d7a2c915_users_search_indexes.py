@@ -0,0 +1,60 @@
+"""users search indexes
+
+Revision ID: e0b4d7a2c915
+Revises: 5a8e1f3c6d20
+Create Date: 2026-10-17 14:30:08.662371
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e0b4d7a2c915"
+down_revision: Union[str, None] = "5a8e1f3c6d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_username_trgm",
+            "users",
+            ["username"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_users_username_id_active",
+            "users",
+            ["username", "id"],
+            unique=False,
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    # The extension is left installed: other objects may depend on it.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_username_id_active",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_users_username_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
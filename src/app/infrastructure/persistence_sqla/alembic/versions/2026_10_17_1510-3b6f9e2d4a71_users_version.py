@@ -0,0 +1,35 @@
+"""users version
+
+Revision ID: 3b6f9e2d4a71
+Revises: e0b4d7a2c915
+Create Date: 2026-10-17 15:10:42.318406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b6f9e2d4a71"
+down_revision: Union[str, None] = "e0b4d7a2c915"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column(
+            "version",
+            sa.Integer(),
+            server_default=sa.text("1"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "version")
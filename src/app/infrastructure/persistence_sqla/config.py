@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import NewType
 
 PostgresDsn = NewType("PostgresDsn", str)
@@ -10,3 +11,26 @@ class SqlaEngineConfig:
     echo_pool: bool
     pool_size: int
     max_overflow: int
+    share_request_session: bool
+    # `None` disables server-side prepared statements.
+    prepare_threshold: int | None
+    pool_recycle: timedelta
+    ping_after_error: timedelta
+    # Without it, `max_overflow` is a fixed limit.
+    adaptive_overflow: bool
+    min_overflow: int
+    target_checkout_wait: timedelta
+    overflow_adjust_interval: timedelta
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SqlaWarmUpConfig:
+    connections: int
+    statements: bool
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SqlaReplicaConfig:
+    dsn: PostgresDsn | None
+    max_lag: timedelta
+    lag_check_interval: timedelta
@@ -0,0 +1,93 @@
+import logging
+from enum import StrEnum
+from typing import Any, Final
+from uuid import UUID, uuid4
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.persistence_sqla.config import SqlaEngineConfig
+
+log = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT_SEC: Final[int] = 5
+
+
+class PostgresDriver(StrEnum):
+    PSYCOPG = "psycopg"
+    ASYNCPG = "asyncpg"
+
+    @classmethod
+    def from_dsn(cls, dsn: str) -> "PostgresDriver":
+        """
+        :raises ValueError:
+        """
+        return cls(make_url(dsn).get_driver_name())
+
+
+def get_connect_args(
+    driver: PostgresDriver,
+    engine_config: SqlaEngineConfig,
+) -> dict[str, Any]:
+    """
+    psycopg prepares a statement once it has run `prepare_threshold` times.
+    asyncpg prepares every statement and caches it per connection,
+    so a threshold only tells whether the caches are on.
+    Without preparation, asyncpg statements get unique names,
+    as a pooler may route them to a connection holding the same name.
+    """
+    if driver == PostgresDriver.PSYCOPG:
+        return {
+            "connect_timeout": CONNECT_TIMEOUT_SEC,
+            "prepare_threshold": engine_config.prepare_threshold,
+        }
+
+    if engine_config.prepare_threshold is not None:
+        return {"timeout": CONNECT_TIMEOUT_SEC}
+    return {
+        "timeout": CONNECT_TIMEOUT_SEC,
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": _unique_statement_name,
+    }
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def install_type_codecs(engine: AsyncEngine, driver: PostgresDriver) -> None:
+    """
+    asyncpg decodes `uuid` columns into its own `UUID` subclass,
+    which SQLAlchemy passes through as is. It would then reach
+    the domain and the responses, where it isn't serialized as a `UUID`,
+    so it's decoded into the standard one instead.
+
+    `userrole` needs no codec: enum labels travel as text with both drivers,
+    and SQLAlchemy maps them to `UserRole` members.
+    """
+    if driver != PostgresDriver.ASYNCPG:
+        return
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_uuid_codec(dbapi_connection: Any, _connection_record: Any) -> None:
+        dbapi_connection.run_async(
+            lambda connection: connection.set_type_codec(
+                "uuid",
+                schema="pg_catalog",
+                encoder=_encode_uuid,
+                decoder=_decode_uuid,
+                format="binary",
+            ),
+        )
+
+    log.debug("asyncpg type codecs installed.")
+
+
+def _encode_uuid(value: UUID | str) -> bytes:
+    return (value if isinstance(value, UUID) else UUID(value)).bytes
+
+
+def _decode_uuid(data: bytes) -> UUID:
+    return UUID(bytes=data)
@@ -1,4 +1,14 @@
-from sqlalchemy import UUID, Column, DateTime, String, Table
+from sqlalchemy import (
+    UUID,
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Table,
+    func,
+)
 from sqlalchemy.orm import composite
 
 from app.domain.value_objects.user_id import UserId
@@ -10,7 +20,41 @@ auth_sessions_table = Table(
     mapping_registry.metadata,
     Column("id", String, primary_key=True),
     Column("user_id", UUID(as_uuid=True), nullable=False),
-    Column("expiration", DateTime(timezone=True), nullable=False),
+    Column("expiration", DateTime(timezone=True), nullable=False, index=True),
+    # Covers per-user lookups and deletes; `id` is included for index-only scans.
+    Index(
+        "ix_auth_sessions_user_id_expiration",
+        "user_id",
+        "expiration",
+        postgresql_include=["id"],
+    ),
+)
+
+# Not mapped to a class: read and written with Core statements only.
+auth_revocation_epochs_table = Table(
+    "auth_revocation_epochs",
+    mapping_registry.metadata,
+    Column("user_id", UUID(as_uuid=True), primary_key=True),
+    Column("epoch", BigInteger, nullable=False),
+    Column(
+        "updated_at",
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    ),
+)
+
+# Not mapped to a class. Unlogged: losing recent login attempts on a crash
+# is acceptable, and skipping the WAL keeps the per-login upsert cheap.
+login_attempt_counters_table = Table(
+    "login_attempt_counters",
+    mapping_registry.metadata,
+    Column("key", String, primary_key=True),
+    Column("window_id", BigInteger, primary_key=True),
+    Column("attempts", Integer, nullable=False),
+    Index("ix_login_attempt_counters_window_id", "window_id"),
+    prefixes=["UNLOGGED"],
 )
 
 
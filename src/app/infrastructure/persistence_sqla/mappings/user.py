@@ -1,4 +1,15 @@
-from sqlalchemy import UUID, Boolean, Column, Enum, LargeBinary, String, Table
+from sqlalchemy import (
+    UUID,
+    Boolean,
+    Column,
+    Enum,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Table,
+    text,
+)
 from sqlalchemy.orm import composite
 
 from app.domain.entities.user import User
@@ -22,6 +33,26 @@ users_table = Table(
         nullable=False,
     ),
     Column("is_active", Boolean, default=True, nullable=False),
+    # Optimistic concurrency: updates match the version they read and bump it.
+    Column("version", Integer, nullable=False, server_default=text("1")),
+    # Keyset pagination orders by the sorting field with `id` as a tiebreaker;
+    # `id` and the unique `username` are covered by their own indexes.
+    Index("ix_users_role_id", "role", "id"),
+    Index("ix_users_is_active_id", "is_active", "id"),
+    # Username prefix and substring search (`ILIKE`); requires `pg_trgm`.
+    Index(
+        "ix_users_username_trgm",
+        "username",
+        postgresql_using="gin",
+        postgresql_ops={"username": "gin_trgm_ops"},
+    ),
+    # The default admin view: active users ordered by username.
+    Index(
+        "ix_users_username_id_active",
+        "username",
+        "id",
+        postgresql_where=text("is_active"),
+    ),
 )
 
 
@@ -37,4 +68,5 @@ def map_users_table() -> None:
             "is_active": users_table.c.is_active,
         },
         column_prefix="_",
+        version_id_col=users_table.c.version,
     )
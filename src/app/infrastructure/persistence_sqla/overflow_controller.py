@@ -0,0 +1,116 @@
+import logging
+import math
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.pool_telemetry import TimedQueuePool
+
+log = logging.getLogger(__name__)
+
+
+class SqlaOverflowController:
+    """
+    Adjusts how many connections a pool may open beyond its size,
+    between `min_overflow` and `max_overflow`, from the checkout waits
+    seen over each `adjust_interval`. Starts at `max_overflow`.
+
+    A checkout timeout or a mean wait above `target_wait` raises the limit
+    by a quarter of the range at once. Otherwise, if the overflow
+    wasn't fully used, it's lowered by one connection, so a replica
+    gives back connections it doesn't need without flapping.
+    Adjustments are made on checkout; an idle pool keeps its limit.
+    """
+
+    def __init__(
+        self,
+        min_overflow: int,
+        max_overflow: int,
+        target_wait: timedelta,
+        adjust_interval: timedelta,
+        metrics: MetricsRegistry,
+        pool_name: str,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._min_overflow = min_overflow
+        self._max_overflow = max_overflow
+        self._step = max(1, math.ceil((max_overflow - min_overflow) / 4))
+        self._target_wait_sec = target_wait.total_seconds()
+        self._adjust_interval_sec = adjust_interval.total_seconds()
+        self._pool_name = pool_name
+        self._clock = clock
+
+        self._window_started_at = clock()
+        self._n_checkouts = 0
+        self._total_wait_sec = 0.0
+        self._n_timeouts = 0
+        self._peak_overflow_in_use = 0
+
+        self._limit = metrics.gauge(
+            "sqla_pool_overflow_limit",
+            "Connections the pool may open beyond its size, by pool.",
+            label_names=("pool",),
+        )
+
+    def install(self, engine: AsyncEngine) -> None:
+        pool = engine.sync_engine.pool
+        if not isinstance(pool, TimedQueuePool):
+            log.warning(
+                "Pool '%s' isn't a TimedQueuePool, its overflow isn't adjusted.",
+                self._pool_name,
+            )
+            return
+
+        pool.max_overflow = self._max_overflow
+        self._limit.set(self._max_overflow, pool=self._pool_name)
+        pool.wait_listeners.append(self.record_wait)
+
+    def record_wait(
+        self,
+        pool: TimedQueuePool,
+        wait_sec: float,
+        timed_out: bool,
+    ) -> None:
+        self._n_checkouts += 1
+        self._total_wait_sec += wait_sec
+        if timed_out:
+            self._n_timeouts += 1
+        else:
+            self._peak_overflow_in_use = max(
+                self._peak_overflow_in_use,
+                pool.checkedout() - pool.size(),
+            )
+
+        if self._clock() - self._window_started_at >= self._adjust_interval_sec:
+            self._adjust(pool)
+
+    def _adjust(self, pool: TimedQueuePool) -> None:
+        limit = pool.max_overflow
+        mean_wait_sec = self._total_wait_sec / self._n_checkouts
+        if self._n_timeouts or mean_wait_sec > self._target_wait_sec:
+            new_limit = min(self._max_overflow, limit + self._step)
+        elif self._peak_overflow_in_use < limit:
+            new_limit = max(self._min_overflow, limit - 1)
+        else:
+            new_limit = limit
+
+        self._window_started_at = self._clock()
+        self._n_checkouts = 0
+        self._total_wait_sec = 0.0
+        self._n_timeouts = 0
+        self._peak_overflow_in_use = 0
+
+        if new_limit == limit:
+            return
+        pool.max_overflow = new_limit
+        self._limit.set(new_limit, pool=self._pool_name)
+        log.info(
+            "Pool '%s' overflow limit: %d -> %d (mean checkout wait %.1f ms).",
+            self._pool_name,
+            limit,
+            new_limit,
+            mean_wait_sec * 1_000,
+        )
@@ -0,0 +1,207 @@
+import logging
+import time
+from collections.abc import Callable
+from typing import Any, Final
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    Pool,
+    PoolProxiedConnection,
+    QueuePool,
+)
+
+from app.infrastructure.metrics import MetricsRegistry
+
+log = logging.getLogger(__name__)
+
+CHECKOUT_WAIT_BUCKETS: Final[tuple[float, ...]] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# Called with the pool, the checkout's wait in seconds and whether it timed out.
+CheckoutWaitListener = Callable[["TimedQueuePool", float, bool], None]
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Pool events fire once a connection is handed out, so they can't tell
+    how long a checkout waited for one. The wait is measured around
+    getting a connection from the queue instead, including opening one
+    when the pool isn't full yet, and reported to `wait_listeners`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.wait_listeners: list[CheckoutWaitListener] = []
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        try:
+            record = super()._do_get()
+
+        except PoolTimeoutError:
+            self._notify_wait(time.perf_counter() - started_at, timed_out=True)
+            raise
+
+        self._notify_wait(time.perf_counter() - started_at, timed_out=False)
+        return record
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        if isinstance(pool, TimedQueuePool):
+            pool.wait_listeners = self.wait_listeners
+        return pool
+
+    @property
+    def max_overflow(self) -> int:
+        return self._max_overflow
+
+    @max_overflow.setter
+    def max_overflow(self, value: int) -> None:
+        """
+        Takes effect on the next checkout. Overflow connections above
+        a lowered limit are closed as they're checked in to a full pool.
+        """
+        self._max_overflow = value
+
+    def _notify_wait(self, wait_sec: float, *, timed_out: bool) -> None:
+        for listener in self.wait_listeners:
+            listener(self, wait_sec, timed_out)
+
+
+class SqlaPoolTelemetry:
+    """
+    Exposes a pool's checkout waits, saturation and connection churn.
+    Gauges are updated on every checkout and checkin.
+    """
+
+    def __init__(self, metrics: MetricsRegistry, pool_name: str):
+        self._pool_name = pool_name
+
+        self._checkout_wait = metrics.histogram(
+            "sqla_pool_checkout_wait_seconds",
+            "Time a checkout waited for a pooled connection, by pool.",
+            label_names=("pool",),
+            buckets=CHECKOUT_WAIT_BUCKETS,
+        )
+        self._checkout_timeouts = metrics.counter(
+            "sqla_pool_checkout_timeouts_total",
+            "Checkouts that found no connection within the pool timeout, by pool.",
+            label_names=("pool",),
+        )
+        self._in_use = metrics.gauge(
+            "sqla_pool_connections_in_use",
+            "Connections checked out of the pool, by pool.",
+            label_names=("pool",),
+        )
+        self._overflow = metrics.gauge(
+            "sqla_pool_overflow_connections",
+            "Open connections beyond the pool size, by pool.",
+            label_names=("pool",),
+        )
+        self._opened = metrics.counter(
+            "sqla_pool_connections_opened_total",
+            "Connections opened by the pool, by pool.",
+            label_names=("pool",),
+        )
+        self._closed = metrics.counter(
+            "sqla_pool_connections_closed_total",
+            "Connections closed by the pool, by pool.",
+            label_names=("pool",),
+        )
+        self._invalidations = metrics.counter(
+            "sqla_pool_invalidations_total",
+            "Connections invalidated, by pool and kind (hard or soft).",
+            label_names=("pool", "kind"),
+        )
+
+    def install(self, engine: AsyncEngine) -> None:
+        sync_engine = engine.sync_engine
+        pool = sync_engine.pool
+        if isinstance(pool, TimedQueuePool):
+            pool.wait_listeners.append(self.record_wait)
+        else:
+            log.warning(
+                "Pool '%s' isn't a TimedQueuePool, its checkout waits aren't measured.",
+                self._pool_name,
+            )
+
+        @event.listens_for(sync_engine, "checkout")
+        def record_checkout(
+            _dbapi_connection: Any,
+            _connection_record: ConnectionPoolEntry,
+            _connection_proxy: PoolProxiedConnection,
+        ) -> None:
+            self._update_gauges(sync_engine.pool, returning=0)
+
+        @event.listens_for(sync_engine, "checkin")
+        def record_checkin(
+            _dbapi_connection: Any,
+            _connection_record: ConnectionPoolEntry,
+        ) -> None:
+            # Fires before the connection is returned to the pool.
+            self._update_gauges(sync_engine.pool, returning=1)
+
+        @event.listens_for(sync_engine, "connect")
+        def record_connect(
+            _dbapi_connection: Any,
+            _connection_record: ConnectionPoolEntry,
+        ) -> None:
+            self._opened.inc(pool=self._pool_name)
+
+        @event.listens_for(sync_engine, "close")
+        def record_close(
+            _dbapi_connection: Any,
+            _connection_record: ConnectionPoolEntry,
+        ) -> None:
+            self._closed.inc(pool=self._pool_name)
+
+        @event.listens_for(sync_engine, "invalidate")
+        def record_invalidate(
+            _dbapi_connection: Any,
+            _connection_record: ConnectionPoolEntry,
+            _exception: BaseException | None,
+        ) -> None:
+            self._invalidations.inc(pool=self._pool_name, kind="hard")
+
+        @event.listens_for(sync_engine, "soft_invalidate")
+        def record_soft_invalidate(
+            _dbapi_connection: Any,
+            _connection_record: ConnectionPoolEntry,
+            _exception: BaseException | None,
+        ) -> None:
+            self._invalidations.inc(pool=self._pool_name, kind="soft")
+
+    def record_wait(
+        self,
+        _pool: TimedQueuePool,
+        wait_sec: float,
+        timed_out: bool,
+    ) -> None:
+        self._checkout_wait.observe(wait_sec, pool=self._pool_name)
+        if timed_out:
+            self._checkout_timeouts.inc(pool=self._pool_name)
+
+    def _update_gauges(self, pool: Pool, *, returning: int) -> None:
+        if not isinstance(pool, QueuePool):
+            return
+        self._in_use.set(pool.checkedout() - returning, pool=self._pool_name)
+        self._overflow.set(max(0, pool.overflow()), pool=self._pool_name)
@@ -11,9 +11,32 @@ from sqlalchemy.ext.asyncio import (
 
 from app.infrastructure.adapters.types import (
     MainAsyncSession,
+    ReaderAsyncSession,
 )
 from app.infrastructure.auth.adapters.types import AuthAsyncSession
-from app.infrastructure.persistence_sqla.config import PostgresDsn, SqlaEngineConfig
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.config import (
+    PostgresDsn,
+    SqlaEngineConfig,
+    SqlaReplicaConfig,
+)
+from app.infrastructure.persistence_sqla.drivers import (
+    PostgresDriver,
+    get_connect_args,
+    install_type_codecs,
+)
+from app.infrastructure.persistence_sqla.overflow_controller import (
+    SqlaOverflowController,
+)
+from app.infrastructure.persistence_sqla.pool_telemetry import (
+    SqlaPoolTelemetry,
+    TimedQueuePool,
+)
+from app.infrastructure.persistence_sqla.read_router import SqlaReadRouter
+from app.infrastructure.persistence_sqla.staleness_check import SqlaStalenessCheck
+from app.infrastructure.persistence_sqla.statement_registry import (
+    instrument_compiled_cache,
+)
 
 log = logging.getLogger(__name__)
 
@@ -21,21 +44,76 @@ log = logging.getLogger(__name__)
 async def get_async_engine(
     dsn: PostgresDsn,
     engine_config: SqlaEngineConfig,
+    metrics: MetricsRegistry,
 ) -> AsyncIterator[AsyncEngine]:
+    async_engine = _create_async_engine(dsn, engine_config, metrics, "primary")
+    instrument_compiled_cache(async_engine, metrics)
+    log.debug("Async engine created with DSN: %s", dsn)
+    yield async_engine
+    log.debug("Disposing async engine...")
+    await async_engine.dispose()
+    log.debug("Engine is disposed.")
+
+
+async def get_read_router(
+    replica_config: SqlaReplicaConfig,
+    engine_config: SqlaEngineConfig,
+    engine: AsyncEngine,
+    metrics: MetricsRegistry,
+) -> AsyncIterator[SqlaReadRouter]:
+    if replica_config.dsn is None:
+        log.debug("No read replica configured, reads go to the primary.")
+        yield SqlaReadRouter(engine, None, replica_config, metrics)
+        return
+
+    replica_engine = _create_async_engine(
+        replica_config.dsn,
+        engine_config,
+        metrics,
+        "replica",
+    )
+    instrument_compiled_cache(replica_engine, metrics)
+    log.debug("Replica async engine created with DSN: %s", replica_config.dsn)
+    read_router = SqlaReadRouter(engine, replica_engine, replica_config, metrics)
+    await read_router.check_lag()
+    read_router.start()
+    yield read_router
+    await read_router.stop()
+    log.debug("Disposing replica async engine...")
+    await replica_engine.dispose()
+    log.debug("Replica engine is disposed.")
+
+
+def _create_async_engine(
+    dsn: str,
+    engine_config: SqlaEngineConfig,
+    metrics: MetricsRegistry,
+    pool_name: str,
+) -> AsyncEngine:
+    driver = PostgresDriver.from_dsn(dsn)
     async_engine = create_async_engine(
         url=dsn,
         echo=engine_config.echo,
         echo_pool=engine_config.echo_pool,
+        poolclass=TimedQueuePool,
         pool_size=engine_config.pool_size,
         max_overflow=engine_config.max_overflow,
-        connect_args={"connect_timeout": 5},
-        pool_pre_ping=True,
+        connect_args=get_connect_args(driver, engine_config),
+        pool_recycle=int(engine_config.pool_recycle.total_seconds()),
     )
-    log.debug("Async engine created with DSN: %s", dsn)
-    yield async_engine
-    log.debug("Disposing async engine...")
-    await async_engine.dispose()
-    log.debug("Engine is disposed.")
+    install_type_codecs(async_engine, driver)
+    SqlaStalenessCheck(engine_config.ping_after_error, metrics).install(async_engine)
+    SqlaPoolTelemetry(metrics, pool_name).install(async_engine)
+    if engine_config.adaptive_overflow:
+        SqlaOverflowController(
+            engine_config.min_overflow,
+            engine_config.max_overflow,
+            engine_config.target_checkout_wait,
+            engine_config.overflow_adjust_interval,
+            metrics,
+            pool_name,
+        ).install(async_engine)
+    return async_engine
 
 
 def get_async_session_factory(
@@ -63,10 +141,35 @@ async def get_main_async_session(
     log.debug("Main async session closed.")
 
 
+async def get_reader_async_session(
+    async_session_factory: async_sessionmaker[AsyncSession],
+    read_router: SqlaReadRouter,
+) -> AsyncIterator[ReaderAsyncSession]:
+    """Provides a read-only AsyncSession for query gateways."""
+    log.debug("Starting Reader async session...")
+    async with async_session_factory(bind=read_router.engine) as session:
+        log.debug("Reader async session started.")
+        yield cast(ReaderAsyncSession, session)
+        log.debug("Closing async session.")
+    log.debug("Reader async session closed.")
+
+
 async def get_auth_async_session(
+    engine_config: SqlaEngineConfig,
     async_session_factory: async_sessionmaker[AsyncSession],
+    main_session: MainAsyncSession,
 ) -> AsyncIterator[AuthAsyncSession]:
-    """Provides UoW (AsyncSession) for the auth context."""
+    """
+    Provides UoW (AsyncSession) for the auth context.
+    With a shared request session, it's the main context's one:
+    both transaction managers commit the same transaction on a single
+    pooled connection, instead of each holding its own.
+    """
+    if engine_config.share_request_session:
+        log.debug("Auth shares the Main async session.")
+        yield cast(AuthAsyncSession, main_session)
+        return
+
     log.debug("Starting Auth async session...")
     async with async_session_factory() as session:
         log.debug("Async session started for Auth.")
@@ -0,0 +1,131 @@
+import asyncio
+import contextlib
+import logging
+
+from sqlalchemy import Float, case, cast, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.adapters.constants import DB_REPLICA_LAG_CHECK_FAILED
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.config import SqlaReplicaConfig
+
+log = logging.getLogger(__name__)
+
+
+class SqlaReadRouter:
+    """
+    Chooses the engine read-only sessions are bound to.
+    Both engines open connections in read-only mode,
+    so a gateway writing by mistake fails on either of them.
+
+    Without a replica, reads go to the primary. With one, its replay lag
+    is checked periodically, and reads fall back to the primary
+    while the lag exceeds the limit or can't be checked.
+    """
+
+    def __init__(
+        self,
+        primary_engine: AsyncEngine,
+        replica_engine: AsyncEngine | None,
+        config: SqlaReplicaConfig,
+        metrics: MetricsRegistry,
+    ):
+        self._primary_engine = primary_engine.execution_options(
+            postgresql_readonly=True,
+        )
+        self._replica_engine = (
+            None
+            if replica_engine is None
+            else replica_engine.execution_options(postgresql_readonly=True)
+        )
+        self._max_lag_sec = config.max_lag.total_seconds()
+        self._check_interval_sec = config.lag_check_interval.total_seconds()
+        self._is_replica_usable = False
+        self._check_task: asyncio.Task[None] | None = None
+
+        self._replica_lag = metrics.gauge(
+            "db_replica_lag_seconds",
+            "Replay lag of the read replica at the last check.",
+        )
+        self._reader_sessions = metrics.counter(
+            "db_reader_sessions_total",
+            "Read-only sessions by the database they were bound to.",
+            label_names=("target",),
+        )
+
+        # An idle primary sends no WAL, so the last replayed transaction
+        # ages without the replica falling behind: a fully replayed
+        # replica has no lag. Not being a standby at all also means no lag.
+        self._lag_stmt = select(
+            func.coalesce(
+                case(
+                    (
+                        func.pg_last_wal_receive_lsn() == func.pg_last_wal_replay_lsn(),
+                        0.0,
+                    ),
+                    else_=cast(
+                        func.extract(
+                            "epoch",
+                            func.now() - func.pg_last_xact_replay_timestamp(),
+                        ),
+                        Float,
+                    ),
+                ),
+                0.0,
+            ),
+        )
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._replica_engine is not None and self._is_replica_usable:
+            self._reader_sessions.inc(target="replica")
+            return self._replica_engine
+
+        self._reader_sessions.inc(target="primary")
+        return self._primary_engine
+
+    async def check_lag(self) -> None:
+        """
+        Never raises: a failed check marks the replica unusable.
+        """
+        if self._replica_engine is None:
+            return
+
+        try:
+            async with self._replica_engine.connect() as connection:
+                lag_sec: float = (await connection.execute(self._lag_stmt)).scalar_one()
+
+        except SQLAlchemyError as error:
+            self._set_replica_usable(is_usable=False)
+            log.warning("%s: '%s'", DB_REPLICA_LAG_CHECK_FAILED, error)
+            return
+
+        self._replica_lag.set(lag_sec)
+        self._set_replica_usable(is_usable=lag_sec <= self._max_lag_sec)
+
+    def start(self) -> None:
+        if self._replica_engine is not None and self._check_task is None:
+            self._check_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._check_task is None:
+            return
+
+        self._check_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._check_task
+        self._check_task = None
+
+    def _set_replica_usable(self, *, is_usable: bool) -> None:
+        if is_usable != self._is_replica_usable:
+            log.info(
+                "Reads routed to the %s.",
+                "replica" if is_usable else "primary",
+            )
+        self._is_replica_usable = is_usable
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._check_interval_sec)
+            await self.check_lag()
@@ -0,0 +1,84 @@
+import logging
+import math
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import DisconnectionError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
+
+from app.infrastructure.metrics import MetricsRegistry
+
+log = logging.getLogger(__name__)
+
+
+class SqlaStalenessCheck:
+    """
+    Replaces `pool_pre_ping`, which costs a round trip on every checkout.
+    Connections are retired by age through `pool_recycle`,
+    and checkouts are pinged only for `ping_after_error` after a connection
+    error, while the pool's other connections are likely stale too
+    (server restart, failover, pooler reset).
+    A connection failing the ping is replaced before it's handed out.
+
+    SQLAlchemy also invalidates the whole pool on an error it recognizes
+    as a disconnect; the ping window covers the ones it doesn't.
+    """
+
+    def __init__(
+        self,
+        ping_after_error: timedelta,
+        metrics: MetricsRegistry,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ping_after_error_sec = ping_after_error.total_seconds()
+        self._clock = clock
+        self._last_error_at = -math.inf
+
+        self._pings = metrics.counter(
+            "sqla_pool_checkout_pings_total",
+            "Checkout pings after a connection error, by result.",
+            label_names=("result",),
+        )
+
+    def install(self, engine: AsyncEngine) -> None:
+        sync_engine = engine.sync_engine
+        dialect = sync_engine.dialect
+
+        @event.listens_for(sync_engine, "handle_error")
+        def record_connection_error(context: ExceptionContext) -> None:
+            if context.is_disconnect or isinstance(
+                context.sqlalchemy_exception,
+                OperationalError,
+            ):
+                self.record_error()
+
+        @event.listens_for(sync_engine, "checkout")
+        def ping_if_recent_error(
+            dbapi_connection: Any,
+            _connection_record: ConnectionPoolEntry,
+            _connection_proxy: PoolProxiedConnection,
+        ) -> None:
+            if not self.should_ping():
+                return
+
+            try:
+                dialect.do_ping(dbapi_connection)
+
+            except dialect.loaded_dbapi.Error as error:
+                self._pings.inc(result="stale")
+                log.debug("Stale connection replaced on checkout.")
+                # The pool discards the connection and checks out another one.
+                raise DisconnectionError from error
+
+            self._pings.inc(result="alive")
+
+    def record_error(self) -> None:
+        self._last_error_at = self._clock()
+
+    def should_ping(self) -> bool:
+        return self._clock() - self._last_error_at < self._ping_after_error_sec
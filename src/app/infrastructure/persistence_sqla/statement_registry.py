@@ -0,0 +1,63 @@
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine.default import DefaultExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.metrics import MetricsRegistry
+
+
+class SqlaStatementRegistry:
+    """
+    App-scoped statements, built once per shape and reused by every request.
+    Values are passed as bound parameters at execution,
+    so a shape always maps to the same SQL and its compiled form
+    is served from the engine's compiled cache.
+
+    Shapes must be drawn from a finite set (fields, orders,
+    which filters are present), never from values.
+    """
+
+    def __init__(self, metrics: MetricsRegistry):
+        self._statements: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+        self._lookups = metrics.counter(
+            "sqla_statement_registry_lookups_total",
+            "Statement registry lookups by result.",
+            label_names=("result",),
+        )
+
+    def get[S](self, shape: Hashable, build: Callable[[], S]) -> S:
+        statement: S | None = self._statements.get(shape)
+        if statement is not None:
+            self._lookups.inc(result="hit")
+            return statement
+
+        self._lookups.inc(result="miss")
+        with self._lock:
+            return self._statements.setdefault(shape, build())  # type: ignore[no-any-return]
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+
+def instrument_compiled_cache(engine: AsyncEngine, metrics: MetricsRegistry) -> None:
+    """
+    Counts how each statement executed on `engine`
+    was served by SQLAlchemy's compiled cache.
+    """
+    lookups = metrics.counter(
+        "sqla_compiled_cache_lookups_total",
+        "Statement executions by SQLAlchemy compiled cache result.",
+        label_names=("result",),
+    )
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute", named=True)
+    def count_compiled_cache_lookup(**kw: Any) -> None:
+        context = kw["context"]
+        if isinstance(context, DefaultExecutionContext):
+            # `cache_hit` is a `CacheStats` member: `CACHE_HIT`, `CACHE_MISS`...
+            lookups.inc(result=context.cache_hit.name.lower())
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+from typing import Final
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_query_gateway import UserQueryGateway
+from app.application.common.query_params.pagination import Pagination
+from app.application.common.query_params.sorting import SortingOrder
+from app.application.common.query_params.user import (
+    UserListParams,
+    UserListSorting,
+)
+from app.domain.value_objects.user_id import UserId
+from app.domain.value_objects.username.username import Username
+from app.infrastructure.auth.session.ports.user_reader import AuthSessionUserReader
+
+log = logging.getLogger(__name__)
+
+# Lookups match no rows: only the statements and their compilation matter.
+WARM_UP_AUTH_SESSION_ID: Final[str] = "warm-up"
+WARM_UP_USER_ID: Final[UserId] = UserId(UUID(int=0))
+WARM_UP_USERNAME: Final[str] = "warmup"
+# The list users endpoint's defaults.
+WARM_UP_USER_LIST_PARAMS: Final[UserListParams] = UserListParams(
+    pagination=Pagination(limit=20, offset=0),
+    sorting=UserListSorting(
+        sorting_field="username",
+        sorting_order=SortingOrder.ASC,
+    ),
+)
+
+
+async def open_pool_connections(engine: AsyncEngine, n_connections: int) -> None:
+    """
+    Opens connections concurrently and returns them to the pool,
+    which keeps up to its size of them open for the first requests.
+
+    :raises SQLAlchemyError:
+    """
+    connections = [engine.connect() for _ in range(n_connections)]
+    results = await asyncio.gather(
+        *(connection.start() for connection in connections),
+        return_exceptions=True,
+    )
+    # A connection that failed to start can't be closed.
+    for connection, result in zip(connections, results, strict=True):
+        if not isinstance(result, BaseException):
+            await connection.close()
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+class SqlaStatementWarmUp:
+    """
+    Runs the statements behind the hottest requests once, through the same
+    gateways, so their SQL is built and compiled into the engine's caches
+    before the first request rather than during it.
+    """
+
+    def __init__(
+        self,
+        auth_session_user_reader: AuthSessionUserReader,
+        user_command_gateway: UserCommandGateway,
+        user_query_gateway: UserQueryGateway,
+    ):
+        self._auth_session_user_reader = auth_session_user_reader
+        self._user_command_gateway = user_command_gateway
+        self._user_query_gateway = user_query_gateway
+
+    async def run(self) -> None:
+        """
+        :raises DataMapperError:
+        :raises ReaderError:
+        """
+        await self._auth_session_user_reader.read_by_id_with_user(
+            WARM_UP_AUTH_SESSION_ID,
+        )
+        await self._user_command_gateway.read_by_id(WARM_UP_USER_ID)
+        await self._user_command_gateway.read_by_username(Username(WARM_UP_USERNAME))
+        await self._user_query_gateway.read_all(WARM_UP_USER_LIST_PARAMS)
+        await self._user_query_gateway.count_all(WARM_UP_USER_LIST_PARAMS.filters)
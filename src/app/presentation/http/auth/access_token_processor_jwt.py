@@ -1,13 +1,17 @@
 import logging
+from datetime import UTC, datetime
 from typing import Any, Literal, NewType, TypedDict, cast
+from uuid import UUID
 
 import jwt
 
-from app.infrastructure.auth.session.model import AuthSession
+from app.domain.value_objects.user_id import UserId
+from app.infrastructure.auth.session.model import AuthSession, AuthSessionClaims
 from app.presentation.http.auth.constants import (
     ACCESS_TOKEN_INVALID_OR_EXPIRED,
     ACCESS_TOKEN_PAYLOAD_MISSING,
     ACCESS_TOKEN_PAYLOAD_OF_INTEREST,
+    ACCESS_TOKEN_STATELESS_CLAIMS_MISSING,
 )
 
 log = logging.getLogger(__name__)
@@ -19,6 +23,8 @@ JwtAlgorithm = Literal["HS256", "HS384", "HS512", "RS256", "RS384", "RS512"]
 class JwtPayload(TypedDict):
     auth_session_id: str
     exp: int
+    user_id: str
+    epoch: int
 
 
 class JwtAccessTokenProcessor:
@@ -26,10 +32,12 @@ class JwtAccessTokenProcessor:
         self._secret = secret
         self._algorithm = algorithm
 
-    def encode(self, auth_session: AuthSession) -> str:
+    def encode(self, auth_session: AuthSession, revocation_epoch: int) -> str:
         payload = JwtPayload(
             auth_session_id=auth_session.id_,
             exp=int(auth_session.expiration.timestamp()),
+            user_id=str(auth_session.user_id.value),
+            epoch=revocation_epoch,
         )
         return jwt.encode(
             cast(dict[str, Any], payload),
@@ -38,15 +46,8 @@ class JwtAccessTokenProcessor:
         )
 
     def decode_auth_session_id(self, token: str) -> str | None:
-        try:
-            payload = jwt.decode(
-                token,
-                key=self._secret,
-                algorithms=[self._algorithm],
-            )
-
-        except jwt.PyJWTError as error:
-            log.debug("%s %s", ACCESS_TOKEN_INVALID_OR_EXPIRED, error)
+        payload = self._decode(token)
+        if payload is None:
             return None
 
         auth_session_id: str | None = payload.get(ACCESS_TOKEN_PAYLOAD_OF_INTEREST)
@@ -59,3 +60,38 @@ class JwtAccessTokenProcessor:
             return None
 
         return auth_session_id
+
+    def decode_claims(self, token: str) -> AuthSessionClaims | None:
+        """
+        Tokens issued before stateless verification was introduced
+        don't carry all the claims and are reported as `None`.
+        """
+        payload = self._decode(token)
+        if payload is None:
+            return None
+
+        try:
+            return AuthSessionClaims(
+                auth_session_id=payload[ACCESS_TOKEN_PAYLOAD_OF_INTEREST],
+                user_id=UserId(UUID(payload["user_id"])),
+                expiration=datetime.fromtimestamp(payload["exp"], tz=UTC),
+                revocation_epoch=int(payload["epoch"]),
+            )
+
+        except (KeyError, TypeError, ValueError):
+            log.debug("%s", ACCESS_TOKEN_STATELESS_CLAIMS_MISSING)
+            return None
+
+    def _decode(self, token: str) -> dict[str, Any] | None:
+        try:
+            payload: dict[str, Any] = jwt.decode(
+                token,
+                key=self._secret,
+                algorithms=[self._algorithm],
+            )
+
+        except jwt.PyJWTError as error:
+            log.debug("%s %s", ACCESS_TOKEN_INVALID_OR_EXPIRED, error)
+            return None
+
+        return payload
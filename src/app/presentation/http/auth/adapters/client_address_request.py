@@ -0,0 +1,19 @@
+from starlette.requests import Request
+
+from app.infrastructure.auth.throttle.ports.client_address import (
+    ClientAddressProvider,
+)
+
+
+class RequestClientAddressProvider(ClientAddressProvider):
+    """
+    Uses the peer address of the connection. Behind a reverse proxy,
+    run the server with trusted forwarded headers so it is the client's.
+    """
+
+    def __init__(self, request: Request):
+        self._request = request
+
+    def get_client_address(self) -> str | None:
+        client = self._request.client
+        return None if client is None else client.host
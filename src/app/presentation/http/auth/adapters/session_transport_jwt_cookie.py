@@ -2,7 +2,7 @@ import logging
 
 from starlette.requests import Request
 
-from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.model import AuthSession, AuthSessionClaims
 from app.infrastructure.auth.session.ports.transport import AuthSessionTransport
 from app.presentation.http.auth.access_token_processor_jwt import (
     JwtAccessTokenProcessor,
@@ -32,8 +32,11 @@ class JwtCookieAuthSessionTransport(AuthSessionTransport):
         self._access_token_processor = access_token_processor
         self._cookie_params = cookie_params
 
-    def deliver(self, auth_session: AuthSession) -> None:
-        access_token = self._access_token_processor.encode(auth_session)
+    def deliver(self, auth_session: AuthSession, revocation_epoch: int) -> None:
+        access_token = self._access_token_processor.encode(
+            auth_session,
+            revocation_epoch,
+        )
         setattr(self._request.state, REQUEST_STATE_NEW_ACCESS_TOKEN_KEY, access_token)
         setattr(
             self._request.state,
@@ -55,6 +58,14 @@ class JwtCookieAuthSessionTransport(AuthSessionTransport):
 
         return self._access_token_processor.decode_auth_session_id(access_token)
 
+    def extract_claims(self) -> AuthSessionClaims | None:
+        access_token = self._request.cookies.get(COOKIE_ACCESS_TOKEN_NAME)
+        if access_token is None:
+            log.debug("%s", ACCESS_TOKEN_NOT_FOUND_IN_COOKIE)
+            return None
+
+        return self._access_token_processor.decode_claims(access_token)
+
     def remove_current(self) -> None:
         setattr(self._request.state, REQUEST_STATE_DELETE_ACCESS_TOKEN_KEY, True)
 
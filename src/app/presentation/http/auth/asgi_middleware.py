@@ -1,4 +1,6 @@
 import logging
+import math
+from datetime import timedelta
 from http.cookies import SimpleCookie
 from typing import Literal
 
@@ -11,6 +13,7 @@ from app.presentation.http.auth.constants import (
     REQUEST_STATE_COOKIE_PARAMS_KEY,
     REQUEST_STATE_DELETE_ACCESS_TOKEN_KEY,
     REQUEST_STATE_NEW_ACCESS_TOKEN_KEY,
+    REQUEST_STATE_RETRY_AFTER_KEY,
 )
 from app.presentation.http.auth.cookie_params import (
     CookieParams,
@@ -34,6 +37,7 @@ class ASGIAuthMiddleware:
                 headers = MutableHeaders(scope=message)
                 self._maybe_set_cookie(request, headers)
                 self._maybe_delete_cookie(request, headers)
+                self._maybe_set_retry_after(request, headers)
             await send(message)
 
         return await self.app(scope, receive, send_wrapper)
@@ -78,6 +82,21 @@ class ASGIAuthMiddleware:
         headers.append("Set-Cookie", cookie_header)
         log.debug("Cookie was deleted.")
 
+    def _maybe_set_retry_after(
+        self,
+        request: Request,
+        headers: MutableHeaders,
+    ) -> None:
+        retry_after: timedelta | None = getattr(
+            request.state,
+            REQUEST_STATE_RETRY_AFTER_KEY,
+            None,
+        )
+        if retry_after is None:
+            return
+
+        headers["Retry-After"] = str(max(1, math.ceil(retry_after.total_seconds())))
+
     def _make_cookie_header(
         self,
         *,
@@ -0,0 +1,55 @@
+from inspect import getdoc
+from typing import Annotated
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Query, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.auth.handlers.list_sessions import (
+    ListSessionsHandler,
+    ListSessionsRequest,
+    ListSessionsResponse,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.presentation.http.auth.fastapi_openapi_markers import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+from app.presentation.http.responses import QueryJSONResponse
+
+
+def create_list_sessions_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.get(
+        "/sessions",
+        description=getdoc(ListSessionsHandler),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        response_model=ListSessionsResponse,
+        response_class=QueryJSONResponse,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def list_sessions(
+        handler: FromDishka[ListSessionsHandler],
+        limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    ) -> QueryJSONResponse:
+        return QueryJSONResponse(
+            await handler.execute(ListSessionsRequest(limit=limit)),
+        )
+
+    return router
@@ -2,18 +2,24 @@ from inspect import getdoc
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 from fastapi_error_map import ErrorAwareRouter, rule
 
 from app.application.common.exceptions.authorization import AuthorizationError
 from app.domain.exceptions.base import DomainFieldError
 from app.domain.exceptions.user import UserNotFoundByUsernameError
-from app.infrastructure.auth.exceptions import AlreadyAuthenticatedError
+from app.infrastructure.auth.exceptions import (
+    AlreadyAuthenticatedError,
+    LoginThrottledError,
+)
 from app.infrastructure.auth.handlers.log_in import LogInHandler, LogInRequest
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+from app.presentation.http.auth.constants import REQUEST_STATE_RETRY_AFTER_KEY
 from app.presentation.http.errors.callbacks import log_error, log_info
 from app.presentation.http.errors.translators import (
     ServiceUnavailableTranslator,
+    TooManyRequestsTranslator,
 )
 
 
@@ -31,6 +37,14 @@ def create_log_in_router() -> APIRouter:
                 translator=ServiceUnavailableTranslator(),
                 on_error=log_error,
             ),
+            PasswordHasherBusyError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+            ),
+            LoginThrottledError: rule(
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+                translator=TooManyRequestsTranslator(),
+            ),
             DomainFieldError: status.HTTP_400_BAD_REQUEST,
             UserNotFoundByUsernameError: status.HTTP_404_NOT_FOUND,
         },
@@ -39,9 +53,15 @@ def create_log_in_router() -> APIRouter:
     )
     @inject
     async def login(
+        request: Request,
         request_data: LogInRequest,
         handler: FromDishka[LogInHandler],
     ) -> None:
-        await handler.execute(request_data)
+        try:
+            await handler.execute(request_data)
+        except LoginThrottledError as error:
+            # Error map rules can't set headers; the auth middleware adds it.
+            setattr(request.state, REQUEST_STATE_RETRY_AFTER_KEY, error.retry_after)
+            raise
 
     return router
@@ -1,5 +1,8 @@
 from fastapi import APIRouter
 
+from app.presentation.http.controllers.account.list_sessions import (
+    create_list_sessions_router,
+)
 from app.presentation.http.controllers.account.log_in import create_log_in_router
 from app.presentation.http.controllers.account.log_out import (
     create_log_out_router,
@@ -19,6 +22,7 @@ def create_account_router() -> APIRouter:
         create_sign_up_router(),
         create_log_in_router(),
         create_log_out_router(),
+        create_list_sessions_router(),
     )
 
     for sub_router in sub_routers:
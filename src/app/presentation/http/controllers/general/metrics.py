@@ -0,0 +1,28 @@
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.infrastructure.metrics import MetricsRegistry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def create_metrics_router() -> APIRouter:
+    router = APIRouter()
+
+    @router.get("/metrics", include_in_schema=False)
+    @inject
+    async def metrics(
+        registry: FromDishka[MetricsRegistry],
+    ) -> PlainTextResponse:
+        """
+        - Open to everyone, expected to be reachable by the scraper only.
+        - Returns in-process metrics in the Prometheus text format.
+        """
+        return PlainTextResponse(
+            registry.render(),
+            media_type=PROMETHEUS_CONTENT_TYPE,
+        )
+
+    return router
@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from app.presentation.http.controllers.general.healthcheck import (
     create_healthcheck_router,
 )
+from app.presentation.http.controllers.general.metrics import create_metrics_router
 
 
 def create_general_router() -> APIRouter:
@@ -10,7 +11,10 @@ def create_general_router() -> APIRouter:
         tags=["General"],
     )
 
-    sub_routers = (create_healthcheck_router(),)
+    sub_routers = (
+        create_healthcheck_router(),
+        create_metrics_router(),
+    )
 
     for sub_router in sub_routers:
         router.include_router(sub_router)
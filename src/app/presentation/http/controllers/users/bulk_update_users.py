@@ -0,0 +1,93 @@
+from inspect import getdoc
+from typing import Annotated, Final
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.application.commands.bulk_update_users import (
+    BulkUpdateUsersInteractor,
+    BulkUpdateUsersRequest,
+    BulkUpdateUsersResponse,
+    UserBulkAction,
+)
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.bulk import EmptySelectionError
+from app.domain.enums.user_type import UserRole
+from app.domain.exceptions.base import DomainFieldError
+from app.domain.value_objects.username.constants import USERNAME_MAX_LEN
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.presentation.http.auth.fastapi_openapi_markers import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+BULK_MAX_USERNAMES: Final[int] = 10_000
+
+
+class BulkUpdateUsersRequestPydantic(BaseModel):
+    """
+    Using a Pydantic model here is generally unnecessary.
+    It's only implemented to render a specific Swagger UI (OpenAPI) schema.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    action: UserBulkAction
+    usernames: Annotated[
+        list[str] | None,
+        Field(min_length=1, max_length=BULK_MAX_USERNAMES),
+    ] = None
+    role: UserRole | None = None
+    is_active: bool | None = None
+    username_prefix: Annotated[
+        str | None,
+        Field(min_length=1, max_length=USERNAME_MAX_LEN),
+    ] = None
+    username_contains: Annotated[
+        str | None,
+        Field(min_length=1, max_length=USERNAME_MAX_LEN),
+    ] = None
+
+
+def create_bulk_update_users_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.patch(
+        "/bulk",
+        description=getdoc(BulkUpdateUsersInteractor),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            DomainFieldError: status.HTTP_400_BAD_REQUEST,
+            EmptySelectionError: status.HTTP_400_BAD_REQUEST,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def bulk_update_users(
+        request_data_pydantic: BulkUpdateUsersRequestPydantic,
+        interactor: FromDishka[BulkUpdateUsersInteractor],
+    ) -> BulkUpdateUsersResponse:
+        request_data = BulkUpdateUsersRequest(
+            action=request_data_pydantic.action,
+            usernames=request_data_pydantic.usernames,
+            role=request_data_pydantic.role,
+            is_active=request_data_pydantic.is_active,
+            username_prefix=request_data_pydantic.username_prefix,
+            username_contains=request_data_pydantic.username_contains,
+        )
+        return await interactor.execute(request_data)
+
+    return router
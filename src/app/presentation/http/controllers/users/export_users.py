@@ -0,0 +1,99 @@
+from inspect import getdoc
+from typing import Annotated, Final
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, Security, status
+from fastapi.responses import StreamingResponse
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.query_params.user import UserExportFormat
+from app.application.queries.export_users import (
+    ExportUsersQueryService,
+    ExportUsersRequest,
+)
+from app.domain.enums.user_type import UserRole
+from app.domain.value_objects.username.constants import USERNAME_MAX_LEN
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.presentation.http.auth.fastapi_openapi_markers import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+EXPORT_MEDIA_TYPES: Final[dict[UserExportFormat, str]] = {
+    UserExportFormat.NDJSON: "application/x-ndjson",
+    UserExportFormat.CSV: "text/csv",
+}
+
+
+class ExportUsersRequestPydantic(BaseModel):
+    """
+    Using a Pydantic model here is generally unnecessary.
+    It's only implemented to render a specific Swagger UI (OpenAPI) schema.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    format: Annotated[UserExportFormat, Field()] = UserExportFormat.NDJSON
+    role: Annotated[UserRole | None, Field()] = None
+    is_active: Annotated[bool | None, Field()] = None
+    username_prefix: Annotated[
+        str | None,
+        Field(min_length=1, max_length=USERNAME_MAX_LEN),
+    ] = None
+    username_contains: Annotated[
+        str | None,
+        Field(min_length=1, max_length=USERNAME_MAX_LEN),
+    ] = None
+
+
+def create_export_users_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.get(
+        "/export",
+        description=getdoc(ExportUsersQueryService),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        response_class=StreamingResponse,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def export_users(
+        request_data_pydantic: Annotated[ExportUsersRequestPydantic, Depends()],
+        interactor: FromDishka[ExportUsersQueryService],
+    ) -> StreamingResponse:
+        export_format = request_data_pydantic.format
+        request_data = ExportUsersRequest(
+            export_format=export_format,
+            role=request_data_pydantic.role,
+            is_active=request_data_pydantic.is_active,
+            username_prefix=request_data_pydantic.username_prefix,
+            username_contains=request_data_pydantic.username_contains,
+        )
+        # Once the body has started, a failed read can only cut the stream short.
+        chunks = await interactor.execute(request_data)
+        return StreamingResponse(
+            chunks,
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers={
+                "Content-Disposition": (
+                    f'attachment; filename="users.{export_format.value}"'
+                ),
+            },
+        )
+
+    return router
@@ -0,0 +1,157 @@
+import codecs
+import csv
+from collections.abc import AsyncIterable, AsyncIterator
+from enum import StrEnum
+from inspect import getdoc
+from typing import Annotated
+
+import orjson
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Query, Request, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+
+from app.application.commands.import_users import (
+    ImportUsersInteractor,
+    ImportUsersResponse,
+    UserImportRow,
+)
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.user_import import UserImportTooLargeError
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+from app.presentation.http.auth.fastapi_openapi_markers import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+
+class UserImportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+async def _read_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, str]]:
+    """
+    Yields non-blank lines with their 1-based numbers,
+    decoding UTF-8 across chunk boundaries.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    line_number = 0
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield line_number, line.removesuffix("\r")
+
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        yield line_number + 1, pending.removesuffix("\r")
+
+
+async def _read_ndjson_rows(
+    chunks: AsyncIterable[bytes],
+) -> AsyncIterator[UserImportRow]:
+    """
+    One object per line, with `username`, `password` and an optional `role`.
+    """
+    async for line_number, line in _read_lines(chunks):
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            yield UserImportRow(line=line_number, error="Invalid JSON.")
+            continue
+
+        if not isinstance(record, dict) or not all(
+            isinstance(record.get(field, ""), str)
+            for field in ("username", "password", "role")
+        ):
+            yield UserImportRow(
+                line=line_number,
+                error="Expected an object with string fields.",
+            )
+            continue
+
+        yield UserImportRow(
+            line=line_number,
+            username=record.get("username", ""),
+            password=record.get("password", ""),
+            role=record.get("role") or None,
+        )
+
+
+async def _read_csv_rows(chunks: AsyncIterable[bytes]) -> AsyncIterator[UserImportRow]:
+    """
+    A header line naming the `username`, `password` and optional `role` columns,
+    then one record per line.
+    """
+    header: list[str] | None = None
+    async for line_number, line in _read_lines(chunks):
+        fields = next(csv.reader([line]))
+        if header is None:
+            header = [field.strip() for field in fields]
+            continue
+
+        if len(fields) != len(header):
+            yield UserImportRow(
+                line=line_number,
+                error=f"Expected {len(header)} fields, got {len(fields)}.",
+            )
+            continue
+
+        record = dict(zip(header, fields, strict=True))
+        yield UserImportRow(
+            line=line_number,
+            username=record.get("username", ""),
+            password=record.get("password", ""),
+            role=record.get("role") or None,
+        )
+
+
+def create_import_users_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.post(
+        "/import",
+        description=getdoc(ImportUsersInteractor),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            PasswordHasherBusyError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            UserImportTooLargeError: status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def import_users(
+        request: Request,
+        interactor: FromDishka[ImportUsersInteractor],
+        import_format: Annotated[
+            UserImportFormat,
+            Query(alias="format"),
+        ] = UserImportFormat.NDJSON,
+    ) -> ImportUsersResponse:
+        # The body is decoded as it's received, never read whole.
+        read_rows = (
+            _read_csv_rows
+            if import_format == UserImportFormat.CSV
+            else _read_ndjson_rows
+        )
+        return await interactor.execute(read_rows(request.stream()))
+
+    return router
@@ -15,6 +15,8 @@ from app.application.queries.list_users import (
     ListUsersRequest,
     ListUsersResponse,
 )
+from app.domain.enums.user_type import UserRole
+from app.domain.value_objects.username.constants import USERNAME_MAX_LEN
 from app.infrastructure.auth.exceptions import AuthenticationError
 from app.infrastructure.exceptions.gateway import DataMapperError, ReaderError
 from app.presentation.http.auth.fastapi_openapi_markers import cookie_scheme
@@ -22,6 +24,7 @@ from app.presentation.http.errors.callbacks import log_error, log_info
 from app.presentation.http.errors.translators import (
     ServiceUnavailableTranslator,
 )
+from app.presentation.http.responses import QueryJSONResponse
 
 
 class ListUsersRequestPydantic(BaseModel):
@@ -36,6 +39,17 @@ class ListUsersRequestPydantic(BaseModel):
     offset: Annotated[int, Field(ge=0)] = 0
     sorting_field: Annotated[str, Field()] = "username"
     sorting_order: Annotated[SortingOrder, Field()] = SortingOrder.ASC
+    cursor: Annotated[str | None, Field()] = None
+    role: Annotated[UserRole | None, Field()] = None
+    is_active: Annotated[bool | None, Field()] = None
+    username_prefix: Annotated[
+        str | None,
+        Field(min_length=1, max_length=USERNAME_MAX_LEN),
+    ] = None
+    username_contains: Annotated[
+        str | None,
+        Field(min_length=1, max_length=USERNAME_MAX_LEN),
+    ] = None
 
 
 def create_list_users_router() -> APIRouter:
@@ -62,19 +76,26 @@ def create_list_users_router() -> APIRouter:
         },
         default_on_error=log_info,
         status_code=status.HTTP_200_OK,
+        response_model=ListUsersResponse,
+        response_class=QueryJSONResponse,
         dependencies=[Security(cookie_scheme)],
     )
     @inject
     async def list_users(
         request_data_pydantic: Annotated[ListUsersRequestPydantic, Depends()],
         interactor: FromDishka[ListUsersQueryService],
-    ) -> ListUsersResponse:
+    ) -> QueryJSONResponse:
         request_data = ListUsersRequest(
             limit=request_data_pydantic.limit,
             offset=request_data_pydantic.offset,
             sorting_field=request_data_pydantic.sorting_field,
             sorting_order=request_data_pydantic.sorting_order,
+            cursor=request_data_pydantic.cursor,
+            role=request_data_pydantic.role,
+            is_active=request_data_pydantic.is_active,
+            username_prefix=request_data_pydantic.username_prefix,
+            username_contains=request_data_pydantic.username_contains,
         )
-        return await interactor.execute(request_data)
+        return QueryJSONResponse(await interactor.execute(request_data))
 
     return router
@@ -11,6 +11,7 @@ from app.application.commands.revoke_admin import (
     RevokeAdminRequest,
 )
 from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.concurrency import ConcurrentUpdateError
 from app.domain.exceptions.base import DomainFieldError
 from app.domain.exceptions.user import (
     RoleChangeNotPermittedError,
@@ -41,6 +42,7 @@ def create_revoke_admin_router() -> APIRouter:
             AuthorizationError: status.HTTP_403_FORBIDDEN,
             DomainFieldError: status.HTTP_400_BAD_REQUEST,
             UserNotFoundByUsernameError: status.HTTP_404_NOT_FOUND,
+            ConcurrentUpdateError: status.HTTP_409_CONFLICT,
             RoleChangeNotPermittedError: status.HTTP_403_FORBIDDEN,
         },
         default_on_error=log_info,
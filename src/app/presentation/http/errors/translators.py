@@ -10,3 +10,12 @@ class ServiceUnavailableTranslator(ErrorTranslator[SimpleErrorResponseModel]):
         return SimpleErrorResponseModel(
             error="Service temporarily unavailable. Please try again later."
         )
+
+
+class TooManyRequestsTranslator(ErrorTranslator[SimpleErrorResponseModel]):
+    @property
+    def error_response_model_cls(self) -> type[SimpleErrorResponseModel]:
+        return SimpleErrorResponseModel
+
+    def from_error(self, err: Exception) -> SimpleErrorResponseModel:
+        return SimpleErrorResponseModel(error=str(err))
@@ -0,0 +1,21 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class QueryJSONResponse(ORJSONResponse):
+    """
+    Query results are serialized straight to bytes with `orjson`.
+    Returned from an endpoint, it skips FastAPI's response model validation
+    and `jsonable_encoder` pass, while the endpoint's `response_model`
+    still documents the body in the OpenAPI schema.
+
+    Meant for results the application layer already shapes as the response
+    model: plain dicts, lists and dataclasses of JSON-native values,
+    UUIDs, enums and datetimes. The output matches the validated path,
+    including the `Z` suffix of UTC datetimes.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
@@ -1,16 +1,40 @@
+import logging
+import time
 from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
 
 from dishka import AsyncContainer, Provider, make_async_container
 from fastapi import APIRouter, FastAPI
 from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import configure_mappers
 
+from app.infrastructure.adapters.password_hasher_bcrypt_cost import BcryptRounds
+from app.infrastructure.auth.adapters.reaper_sqla import SqlaAuthSessionReaper
+from app.infrastructure.auth.adapters.revocation_epoch_sync_sqla import (
+    SqlaAuthRevocationEpochSynchronizer,
+)
+from app.infrastructure.auth.session.ports.extension_writer import (
+    AuthSessionExtensionWriter,
+)
+from app.infrastructure.auth.session.ports.invalidation_channel import (
+    AuthSessionInvalidationChannel,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError, ReaderError
+from app.infrastructure.persistence_sqla.config import SqlaWarmUpConfig
 from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.infrastructure.persistence_sqla.warm_up import (
+    SqlaStatementWarmUp,
+    open_pool_connections,
+)
 from app.presentation.http.auth.asgi_middleware import (
     ASGIAuthMiddleware,
 )
 from app.setup.config.settings import AppSettings
 
+log = logging.getLogger(__name__)
+
 
 def create_app() -> FastAPI:
     return FastAPI(
@@ -22,11 +46,50 @@ def create_app() -> FastAPI:
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     map_tables()
+    # Resolve mapper relationships now rather than on the first query
+    configure_mappers()
+    container: AsyncContainer = app.state.dishka_container
+    # Calibrate the password hashing cost before the first login
+    await container.get(BcryptRounds)
+    # Start background auth tasks before serving the first request
+    await container.get(AuthSessionInvalidationChannel)
+    await container.get(SqlaAuthRevocationEpochSynchronizer)
+    await container.get(AuthSessionExtensionWriter)
+    await container.get(SqlaAuthSessionReaper)
+    # Open pooled connections and compile the hottest queries
+    await warm_up_persistence(container)
     yield None
-    await app.state.dishka_container.close()
+    await container.close()
     # https://dishka.readthedocs.io/en/stable/integrations/fastapi.html
 
 
+async def warm_up_persistence(container: AsyncContainer) -> None:
+    """
+    Never raises: if the database isn't reachable at startup,
+    the app starts anyway and the first requests run cold.
+    """
+    config = await container.get(SqlaWarmUpConfig)
+    engine = await container.get(AsyncEngine)
+    started_at = time.perf_counter()
+    try:
+        await open_pool_connections(engine, config.connections)
+        if config.statements:
+            async with container() as request_container:
+                statement_warm_up = await request_container.get(SqlaStatementWarmUp)
+                await statement_warm_up.run()
+
+    except (SQLAlchemyError, DataMapperError, ReaderError) as error:
+        log.warning("Persistence warm-up failed: '%s'", error)
+        return
+
+    log.info(
+        "Persistence warm-up done in %.0f ms: %d connections opened, statements %s.",
+        (time.perf_counter() - started_at) * 1_000,
+        config.connections,
+        "compiled" if config.statements else "skipped",
+    )
+
+
 def configure_app(
     app: FastAPI,
     root_router: APIRouter,
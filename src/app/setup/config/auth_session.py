@@ -0,0 +1,107 @@
+from datetime import timedelta
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class AuthSessionCacheSettings(BaseModel):
+    enabled: bool = Field(alias="ENABLED")
+    max_size: int = Field(alias="MAX_SIZE")
+    ttl_sec: timedelta = Field(alias="TTL_SEC")
+    invalidation_channel: Literal["in_process", "pg_notify"] = Field(
+        alias="INVALIDATION_CHANNEL",
+    )
+
+    @field_validator("max_size")
+    @classmethod
+    def validate_max_size(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("MAX_SIZE must be at least 1.")
+        return v
+
+    @field_validator("ttl_sec", mode="before")
+    @classmethod
+    def convert_ttl_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError("TTL_SEC must be a number (n of seconds, n > 0).")
+        if v <= 0:
+            raise ValueError("TTL_SEC must be greater than 0 (n of seconds).")
+        return timedelta(seconds=v)
+
+
+class AuthSessionStatelessSettings(BaseModel):
+    enabled: bool = Field(alias="ENABLED")
+    epoch_sync_interval_sec: timedelta = Field(alias="EPOCH_SYNC_INTERVAL_SEC")
+
+    @field_validator("epoch_sync_interval_sec", mode="before")
+    @classmethod
+    def convert_epoch_sync_interval_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError(
+                "EPOCH_SYNC_INTERVAL_SEC must be a number (n of seconds, n > 0).",
+            )
+        if v <= 0:
+            raise ValueError(
+                "EPOCH_SYNC_INTERVAL_SEC must be greater than 0 (n of seconds).",
+            )
+        return timedelta(seconds=v)
+
+
+class AuthSessionExtensionWriterSettings(BaseModel):
+    enabled: bool = Field(alias="ENABLED")
+    flush_interval_sec: timedelta = Field(alias="FLUSH_INTERVAL_SEC")
+    max_batch_size: int = Field(alias="MAX_BATCH_SIZE")
+
+    @field_validator("flush_interval_sec", mode="before")
+    @classmethod
+    def convert_flush_interval_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError(
+                "FLUSH_INTERVAL_SEC must be a number (n of seconds, n > 0).",
+            )
+        if v <= 0:
+            raise ValueError(
+                "FLUSH_INTERVAL_SEC must be greater than 0 (n of seconds).",
+            )
+        return timedelta(seconds=v)
+
+    @field_validator("max_batch_size")
+    @classmethod
+    def validate_max_batch_size(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("MAX_BATCH_SIZE must be at least 1.")
+        return v
+
+
+class AuthSessionReaperSettings(BaseModel):
+    enabled: bool = Field(alias="ENABLED")
+    interval_sec: timedelta = Field(alias="INTERVAL_SEC")
+    batch_size: int = Field(alias="BATCH_SIZE")
+
+    @field_validator("interval_sec", mode="before")
+    @classmethod
+    def convert_interval_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError("INTERVAL_SEC must be a number (n of seconds, n > 0).")
+        if v <= 0:
+            raise ValueError("INTERVAL_SEC must be greater than 0 (n of seconds).")
+        return timedelta(seconds=v)
+
+    @field_validator("batch_size")
+    @classmethod
+    def validate_batch_size(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("BATCH_SIZE must be at least 1.")
+        return v
+
+
+class AuthSessionLookupSettings(BaseModel):
+    join_user: bool = Field(alias="JOIN_USER")
+
+
+class AuthSessionSettings(BaseModel):
+    cache: AuthSessionCacheSettings
+    stateless: AuthSessionStatelessSettings
+    extension_writer: AuthSessionExtensionWriterSettings
+    reaper: AuthSessionReaperSettings
+    lookup: AuthSessionLookupSettings
@@ -1,7 +1,8 @@
 import os
-from typing import Final
+from datetime import timedelta
+from typing import Any, Final, Self
 
-from pydantic import BaseModel, Field, PostgresDsn, field_validator
+from pydantic import BaseModel, Field, PostgresDsn, field_validator, model_validator
 
 PORT_MIN: Final[int] = 1
 PORT_MAX: Final[int] = 65535
@@ -14,6 +15,10 @@ class PostgresSettings(BaseModel):
     host: str = Field(alias="HOST")
     port: int = Field(alias="PORT")
     driver: str = Field(alias="DRIVER")
+    replica_host: str | None = Field(default=None, alias="REPLICA_HOST")
+    replica_port: int | None = Field(default=None, alias="REPLICA_PORT")
+    direct_host: str | None = Field(default=None, alias="DIRECT_HOST")
+    direct_port: int | None = Field(default=None, alias="DIRECT_PORT")
 
     @field_validator("host")
     @classmethod
@@ -23,22 +28,63 @@ class PostgresSettings(BaseModel):
             return postgres_host_env
         return v
 
-    @field_validator("port")
+    @field_validator("replica_host")
     @classmethod
-    def validate_port_range(cls, v: int) -> int:
-        if not PORT_MIN <= v <= PORT_MAX:
+    def override_replica_host_from_env(cls, v: str | None) -> str | None:
+        replica_host_env = os.environ.get("POSTGRES_REPLICA_HOST")
+        if replica_host_env:
+            return replica_host_env
+        return v
+
+    @field_validator("direct_host")
+    @classmethod
+    def override_direct_host_from_env(cls, v: str | None) -> str | None:
+        direct_host_env = os.environ.get("POSTGRES_DIRECT_HOST")
+        if direct_host_env:
+            return direct_host_env
+        return v
+
+    @field_validator("port", "replica_port", "direct_port")
+    @classmethod
+    def validate_port_range(cls, v: int | None) -> int | None:
+        if v is not None and not PORT_MIN <= v <= PORT_MAX:
             raise ValueError(f"Port must be between {PORT_MIN} and {PORT_MAX}")
         return v
 
     @property
     def dsn(self) -> str:
+        return self._build_dsn(self.host, self.port)
+
+    @property
+    def replica_dsn(self) -> str | None:
+        """
+        The replica serves the same database with the same credentials,
+        on `PORT` unless `REPLICA_PORT` is set.
+        """
+        if self.replica_host is None:
+            return None
+        return self._build_dsn(self.replica_host, self.replica_port or self.port)
+
+    @property
+    def direct_dsn(self) -> str:
+        """
+        Reaches Postgres itself rather than a connection pooler,
+        for connections holding session state across transactions.
+        Same database and credentials, on `PORT` unless `DIRECT_PORT` is set;
+        without `DIRECT_HOST`, it's the primary DSN.
+        """
+        if self.direct_host is None:
+            return self.dsn
+        return self._build_dsn(self.direct_host, self.direct_port or self.port)
+
+    def _build_dsn(self, host: str, port: int) -> str:
         return str(
             PostgresDsn.build(
                 scheme=f"postgresql+{self.driver}",
                 username=self.user,
                 password=self.password,
-                host=self.host,
-                port=self.port,
+                host=host,
+                port=port,
                 path=self.db,
             ),
         )
@@ -49,3 +95,130 @@ class SqlaEngineSettings(BaseModel):
     echo_pool: bool = Field(alias="ECHO_POOL")
     pool_size: int = Field(alias="POOL_SIZE")
     max_overflow: int = Field(alias="MAX_OVERFLOW")
+    adaptive_overflow: bool = Field(alias="ADAPTIVE_OVERFLOW")
+    min_overflow: int = Field(alias="MIN_OVERFLOW")
+    target_checkout_wait_ms: timedelta = Field(alias="TARGET_CHECKOUT_WAIT_MS")
+    overflow_adjust_interval_sec: timedelta = Field(
+        alias="OVERFLOW_ADJUST_INTERVAL_SEC",
+    )
+    share_request_session: bool = Field(alias="SHARE_REQUEST_SESSION")
+    prepare_threshold: int = Field(alias="PREPARE_THRESHOLD")
+    pgbouncer_transaction_mode: bool = Field(alias="PGBOUNCER_TRANSACTION_MODE")
+    pool_recycle_sec: timedelta = Field(alias="POOL_RECYCLE_SEC")
+    ping_after_error_sec: timedelta = Field(alias="PING_AFTER_ERROR_SEC")
+    warm_up_connections: int = Field(alias="WARM_UP_CONNECTIONS")
+    warm_up_statements: bool = Field(alias="WARM_UP_STATEMENTS")
+    replica_max_lag_sec: timedelta = Field(alias="REPLICA_MAX_LAG_SEC")
+    replica_lag_check_interval_sec: timedelta = Field(
+        alias="REPLICA_LAG_CHECK_INTERVAL_SEC",
+    )
+
+    @field_validator("max_overflow", "min_overflow")
+    @classmethod
+    def validate_overflow(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("MIN_OVERFLOW and MAX_OVERFLOW must be at least 0.")
+        return v
+
+    @field_validator("target_checkout_wait_ms", mode="before")
+    @classmethod
+    def convert_target_checkout_wait_ms(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError(
+                "TARGET_CHECKOUT_WAIT_MS must be a number (n of milliseconds, n > 0).",
+            )
+        if v <= 0:
+            raise ValueError(
+                "TARGET_CHECKOUT_WAIT_MS must be greater than 0 (n of milliseconds).",
+            )
+        return timedelta(milliseconds=v)
+
+    @field_validator("overflow_adjust_interval_sec", mode="before")
+    @classmethod
+    def convert_overflow_adjust_interval_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError(
+                "OVERFLOW_ADJUST_INTERVAL_SEC must be a number (n of seconds, n > 0).",
+            )
+        if v <= 0:
+            raise ValueError(
+                "OVERFLOW_ADJUST_INTERVAL_SEC must be greater than 0 (n of seconds).",
+            )
+        return timedelta(seconds=v)
+
+    @model_validator(mode="after")
+    def validate_min_max_overflow(self) -> Self:
+        if self.min_overflow > self.max_overflow:
+            raise ValueError("MIN_OVERFLOW must not exceed MAX_OVERFLOW.")
+        return self
+
+    @model_validator(mode="after")
+    def validate_warm_up_connections(self) -> Self:
+        if not 0 <= self.warm_up_connections <= self.pool_size:
+            raise ValueError("WARM_UP_CONNECTIONS must be between 0 and POOL_SIZE.")
+        return self
+
+    @field_validator("prepare_threshold")
+    @classmethod
+    def validate_prepare_threshold(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("PREPARE_THRESHOLD must be at least 0.")
+        return v
+
+    @field_validator("pool_recycle_sec", mode="before")
+    @classmethod
+    def convert_pool_recycle_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError(
+                "POOL_RECYCLE_SEC must be a number (n of seconds, n > 0).",
+            )
+        if v <= 0:
+            raise ValueError("POOL_RECYCLE_SEC must be greater than 0 (n of seconds).")
+        return timedelta(seconds=v)
+
+    @field_validator("ping_after_error_sec", mode="before")
+    @classmethod
+    def convert_ping_after_error_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError(
+                "PING_AFTER_ERROR_SEC must be a number (n of seconds, n >= 0).",
+            )
+        if v < 0:
+            raise ValueError("PING_AFTER_ERROR_SEC must be at least 0 (n of seconds).")
+        return timedelta(seconds=v)
+
+    @property
+    def effective_prepare_threshold(self) -> int | None:
+        """
+        PgBouncer in transaction mode may run each transaction
+        on a different server connection, where statements prepared
+        on another one don't exist, so preparation is disabled.
+        """
+        if self.pgbouncer_transaction_mode:
+            return None
+        return self.prepare_threshold
+
+    @field_validator("replica_max_lag_sec", mode="before")
+    @classmethod
+    def convert_replica_max_lag_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError(
+                "REPLICA_MAX_LAG_SEC must be a number (n of seconds, n >= 0).",
+            )
+        if v < 0:
+            raise ValueError("REPLICA_MAX_LAG_SEC must be at least 0 (n of seconds).")
+        return timedelta(seconds=v)
+
+    @field_validator("replica_lag_check_interval_sec", mode="before")
+    @classmethod
+    def convert_replica_lag_check_interval_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError(
+                "REPLICA_LAG_CHECK_INTERVAL_SEC must be a number "
+                "(n of seconds, n > 0).",
+            )
+        if v <= 0:
+            raise ValueError(
+                "REPLICA_LAG_CHECK_INTERVAL_SEC must be greater than 0 (n of seconds).",
+            )
+        return timedelta(seconds=v)
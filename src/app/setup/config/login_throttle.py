@@ -0,0 +1,36 @@
+from datetime import timedelta
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class LoginThrottleSettings(BaseModel):
+    enabled: bool = Field(alias="ENABLED")
+    store: Literal["in_memory", "postgres"] = Field(alias="STORE")
+    window_sec: timedelta = Field(alias="WINDOW_SEC")
+    max_attempts_per_username: int = Field(alias="MAX_ATTEMPTS_PER_USERNAME")
+    max_attempts_per_address: int = Field(alias="MAX_ATTEMPTS_PER_ADDRESS")
+    max_tracked_keys: int = Field(alias="MAX_TRACKED_KEYS")
+
+    @field_validator("window_sec", mode="before")
+    @classmethod
+    def convert_window_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError("WINDOW_SEC must be a number (n of seconds, n > 0).")
+        if v <= 0:
+            raise ValueError("WINDOW_SEC must be greater than 0 (n of seconds).")
+        return timedelta(seconds=v)
+
+    @field_validator("max_attempts_per_username", "max_attempts_per_address")
+    @classmethod
+    def validate_max_attempts(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("Max login attempts must be at least 1.")
+        return v
+
+    @field_validator("max_tracked_keys")
+    @classmethod
+    def validate_max_tracked_keys(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("MAX_TRACKED_KEYS must be at least 1.")
+        return v
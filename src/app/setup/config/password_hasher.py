@@ -0,0 +1,69 @@
+from datetime import timedelta
+from typing import Any, Final, Literal, Self
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+BCRYPT_MIN_ROUNDS: Final[int] = 4
+BCRYPT_MAX_ROUNDS: Final[int] = 31
+
+
+class PasswordHasherSettings(BaseModel):
+    executor: Literal["thread", "process"] = Field(alias="EXECUTOR")
+    max_workers: int = Field(alias="MAX_WORKERS")
+    max_pending: int = Field(alias="MAX_PENDING")
+    rounds: int | None = Field(alias="ROUNDS")
+    target_hash_time_ms: timedelta = Field(alias="TARGET_HASH_TIME_MS")
+    min_rounds: int = Field(alias="MIN_ROUNDS")
+    max_rounds: int = Field(alias="MAX_ROUNDS")
+
+    @field_validator("max_workers")
+    @classmethod
+    def validate_max_workers(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("MAX_WORKERS must be at least 1.")
+        return v
+
+    @field_validator("max_pending")
+    @classmethod
+    def validate_max_pending(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("MAX_PENDING must be at least 0.")
+        return v
+
+    @field_validator("rounds", mode="before")
+    @classmethod
+    def convert_rounds(cls, v: Any) -> int | None:
+        if v == "auto":
+            return None
+        if not isinstance(v, int) or isinstance(v, bool):
+            raise ValueError('ROUNDS must be an integer or "auto".')
+        return v
+
+    @field_validator("rounds", "min_rounds", "max_rounds")
+    @classmethod
+    def validate_rounds_range(cls, v: int | None) -> int | None:
+        if v is not None and not BCRYPT_MIN_ROUNDS <= v <= BCRYPT_MAX_ROUNDS:
+            raise ValueError(
+                f"Bcrypt rounds must be between {BCRYPT_MIN_ROUNDS} "
+                f"and {BCRYPT_MAX_ROUNDS}, inclusive.",
+            )
+        return v
+
+    @field_validator("target_hash_time_ms", mode="before")
+    @classmethod
+    def convert_target_hash_time_ms(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError(
+                "TARGET_HASH_TIME_MS must be a number (n of milliseconds, n > 0).",
+            )
+        if v <= 0:
+            raise ValueError(
+                "TARGET_HASH_TIME_MS must be greater than 0 (n of milliseconds).",
+            )
+        return timedelta(milliseconds=v)
+
+    @model_validator(mode="after")
+    def validate_min_max_rounds(self) -> Self:
+        if self.min_rounds > self.max_rounds:
+            raise ValueError("MIN_ROUNDS must not exceed MAX_ROUNDS.")
+        return self
@@ -1,19 +1,65 @@
+from typing import Self
+
 from pydantic import (
     BaseModel,
+    model_validator,
 )
 
+from app.setup.config.auth_session import (
+    AuthSessionCacheSettings,
+    AuthSessionSettings,
+)
 from app.setup.config.database import PostgresSettings, SqlaEngineSettings
 from app.setup.config.loader import ValidEnvs, get_current_env, load_full_config
+from app.setup.config.login_throttle import LoginThrottleSettings
 from app.setup.config.logs import LoggingSettings
+from app.setup.config.password_hasher import PasswordHasherSettings
 from app.setup.config.security import SecuritySettings
+from app.setup.config.user_listing import UserListingSettings
 
 
 class AppSettings(BaseModel):
     postgres: PostgresSettings
     sqla: SqlaEngineSettings
     security: SecuritySettings
+    password_hasher: PasswordHasherSettings
+    auth_session: AuthSessionSettings
+    login_throttle: LoginThrottleSettings
+    user_listing: UserListingSettings
     logs: LoggingSettings
 
+    @model_validator(mode="after")
+    def validate_listener_behind_pgbouncer(self) -> Self:
+        validate_listener_connection(
+            self.postgres,
+            self.sqla,
+            self.auth_session.cache,
+        )
+        return self
+
+
+def validate_listener_connection(
+    postgres: PostgresSettings,
+    sqla: SqlaEngineSettings,
+    cache: AuthSessionCacheSettings,
+) -> None:
+    """
+    PgBouncer in transaction mode hands each transaction to any server
+    connection, so a `LISTEN` through it stops receiving notifications.
+
+    :raises ValueError:
+    """
+    if (
+        sqla.pgbouncer_transaction_mode
+        and cache.enabled
+        and cache.invalidation_channel == "pg_notify"
+        and postgres.direct_host is None
+    ):
+        raise ValueError(
+            'INVALIDATION_CHANNEL "pg_notify" with PGBOUNCER_TRANSACTION_MODE '
+            "requires DIRECT_HOST.",
+        )
+
 
 def load_settings(env: ValidEnvs | None = None) -> AppSettings:
     if env is None:
@@ -0,0 +1,51 @@
+from datetime import timedelta
+from typing import Any
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class UserListingSettings(BaseModel):
+    exact_count_threshold: int = Field(alias="EXACT_COUNT_THRESHOLD")
+    count_cache_ttl_sec: timedelta = Field(alias="COUNT_CACHE_TTL_SEC")
+    page_cache_ttl_sec: timedelta = Field(alias="PAGE_CACHE_TTL_SEC")
+    page_cache_max_entries: int = Field(alias="PAGE_CACHE_MAX_ENTRIES")
+
+    @field_validator("exact_count_threshold")
+    @classmethod
+    def validate_exact_count_threshold(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("EXACT_COUNT_THRESHOLD must be at least 0.")
+        return v
+
+    @field_validator("page_cache_max_entries")
+    @classmethod
+    def validate_page_cache_max_entries(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("PAGE_CACHE_MAX_ENTRIES must be at least 0.")
+        return v
+
+    @field_validator("count_cache_ttl_sec", mode="before")
+    @classmethod
+    def convert_count_cache_ttl_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError(
+                "COUNT_CACHE_TTL_SEC must be a number (n of seconds, n > 0).",
+            )
+        if v <= 0:
+            raise ValueError(
+                "COUNT_CACHE_TTL_SEC must be greater than 0 (n of seconds).",
+            )
+        return timedelta(seconds=v)
+
+    @field_validator("page_cache_ttl_sec", mode="before")
+    @classmethod
+    def convert_page_cache_ttl_sec(cls, v: Any) -> timedelta:
+        if not isinstance(v, (int, float)):
+            raise ValueError(
+                "PAGE_CACHE_TTL_SEC must be a number (n of seconds, n > 0).",
+            )
+        if v <= 0:
+            raise ValueError(
+                "PAGE_CACHE_TTL_SEC must be greater than 0 (n of seconds).",
+            )
+        return timedelta(seconds=v)
@@ -1,10 +1,12 @@
-from dishka import Provider, Scope, provide, provide_all
+from dishka import Provider, Scope, alias, provide, provide_all
 
 from app.application.commands.activate_user import ActivateUserInteractor
+from app.application.commands.bulk_update_users import BulkUpdateUsersInteractor
 from app.application.commands.change_password import ChangePasswordInteractor
 from app.application.commands.create_user import CreateUserInteractor
 from app.application.commands.deactivate_user import DeactivateUserInteractor
 from app.application.commands.grant_admin import GrantAdminInteractor
+from app.application.commands.import_users import ImportUsersInteractor
 from app.application.commands.revoke_admin import RevokeAdminInteractor
 from app.application.common.ports.access_revoker import AccessRevoker
 from app.application.common.ports.flusher import Flusher
@@ -13,8 +15,13 @@ from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_importer import UserImporter
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
 from app.application.common.ports.user_query_gateway import UserQueryGateway
 from app.application.common.services.current_user import CurrentUserService
+from app.application.queries.export_users import ExportUsersQueryService
 from app.application.queries.list_users import ListUsersQueryService
 from app.infrastructure.adapters.main_flusher_sqla import SqlaMainFlusher
 from app.infrastructure.adapters.main_transaction_manager_sqla import (
@@ -23,6 +30,8 @@ from app.infrastructure.adapters.main_transaction_manager_sqla import (
 from app.infrastructure.adapters.user_data_mapper_sqla import (
     SqlaUserDataMapper,
 )
+from app.infrastructure.adapters.user_importer_sqla import SqlaUserImporter
+from app.infrastructure.adapters.user_listing_cache import UserListingGeneration
 from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
 from app.infrastructure.auth.adapters.access_revoker import (
     AuthSessionAccessRevoker,
@@ -67,18 +76,29 @@ class ApplicationProvider(Provider):
         source=SqlaUserReader,
         provides=UserQueryGateway,
     )
+    user_importer = provide(
+        source=SqlaUserImporter,
+        provides=UserImporter,
+    )
+    user_listing_invalidator = alias(
+        source=UserListingGeneration,
+        provides=UserListingInvalidator,
+    )
 
     # Commands
     commands = provide_all(
         ActivateUserInteractor,
+        BulkUpdateUsersInteractor,
         ChangePasswordInteractor,
         CreateUserInteractor,
         DeactivateUserInteractor,
         GrantAdminInteractor,
+        ImportUsersInteractor,
         RevokeAdminInteractor,
     )
 
     # Queries
     query_services = provide_all(
         ListUsersQueryService,
+        ExportUsersQueryService,
     )
@@ -3,9 +3,16 @@ from dishka import Provider, Scope, provide, provide_all
 from app.infrastructure.adapters.main_transaction_manager_sqla import (
     SqlaMainTransactionManager,
 )
+from app.infrastructure.adapters.provider import (
+    get_bcrypt_rounds,
+    get_password_hasher_executor,
+    get_user_count_cache,
+    get_user_page_cache,
+)
 from app.infrastructure.adapters.user_data_mapper_sqla import (
     SqlaUserDataMapper,
 )
+from app.infrastructure.adapters.user_listing_cache import UserListingGeneration
 from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
 from app.infrastructure.auth.adapters.data_mapper_sqla import (
     SqlaAuthSessionDataMapper,
@@ -13,27 +20,63 @@ from app.infrastructure.auth.adapters.data_mapper_sqla import (
 from app.infrastructure.auth.adapters.identity_provider import (
     AuthSessionIdentityProvider,
 )
+from app.infrastructure.auth.adapters.revocation_epoch_gateway_sqla import (
+    SqlaAuthRevocationEpochGateway,
+)
 from app.infrastructure.auth.adapters.transaction_manager_sqla import (
     SqlaAuthSessionTransactionManager,
 )
+from app.infrastructure.auth.adapters.user_reader_sqla import (
+    SqlaAuthSessionUserReader,
+)
+from app.infrastructure.auth.handlers.list_sessions import ListSessionsHandler
 from app.infrastructure.auth.handlers.log_in import LogInHandler
 from app.infrastructure.auth.handlers.log_out import LogOutHandler
 from app.infrastructure.auth.handlers.sign_up import SignUpHandler
+from app.infrastructure.auth.provider import (
+    get_auth_revocation_epoch_synchronizer,
+    get_auth_revocation_epochs,
+    get_auth_session_cache,
+    get_auth_session_extension_writer,
+    get_auth_session_invalidation_channel,
+    get_auth_session_reaper,
+    get_login_attempt_store,
+)
 from app.infrastructure.auth.session.id_generator_str import (
     StrAuthSessionIdGenerator,
 )
 from app.infrastructure.auth.session.ports.gateway import AuthSessionGateway
+from app.infrastructure.auth.session.ports.revocation_epoch_gateway import (
+    AuthRevocationEpochGateway,
+)
 from app.infrastructure.auth.session.ports.transaction_manager import (
     AuthSessionTransactionManager,
 )
 from app.infrastructure.auth.session.ports.transport import AuthSessionTransport
+from app.infrastructure.auth.session.ports.user_reader import (
+    AuthSessionUserReader,
+)
 from app.infrastructure.auth.session.service import AuthSessionService
 from app.infrastructure.auth.session.timer_utc import UtcAuthSessionTimer
+from app.infrastructure.auth.throttle.ports.client_address import (
+    ClientAddressProvider,
+)
+from app.infrastructure.auth.throttle.service import LoginThrottle
+from app.infrastructure.metrics import MetricsRegistry
 from app.infrastructure.persistence_sqla.provider import (
     get_async_engine,
     get_async_session_factory,
     get_auth_async_session,
     get_main_async_session,
+    get_read_router,
+    get_reader_async_session,
+)
+from app.infrastructure.persistence_sqla.statement_registry import (
+    SqlaStatementRegistry,
+)
+from app.infrastructure.persistence_sqla.warm_up import SqlaStatementWarmUp
+from app.presentation.http.auth.adapters.client_address_request import (
+    RequestClientAddressProvider,
 )
 from app.presentation.http.auth.adapters.session_transport_jwt_cookie import (
     JwtCookieAuthSessionTransport,
@@ -45,12 +88,21 @@ class InfrastructureProvider(Provider):
 
     # Auth Services
     auth_session_service = provide(source=AuthSessionService)
+    login_throttle = provide(source=LoginThrottle)
 
     # Auth Ports Persistence
     auth_session_gateway = provide(
         source=SqlaAuthSessionDataMapper,
         provides=AuthSessionGateway,
     )
+    auth_revocation_epoch_gateway = provide(
+        source=SqlaAuthRevocationEpochGateway,
+        provides=AuthRevocationEpochGateway,
+    )
+    auth_session_user_reader = provide(
+        source=SqlaAuthSessionUserReader,
+        provides=AuthSessionUserReader,
+    )
     auth_session_tx_manager = provide(
         source=SqlaAuthSessionTransactionManager,
         provides=AuthSessionTransactionManager,
@@ -61,12 +113,17 @@ class InfrastructureProvider(Provider):
         source=JwtCookieAuthSessionTransport,
         provides=AuthSessionTransport,
     )
+    client_address_provider = provide(
+        source=RequestClientAddressProvider,
+        provides=ClientAddressProvider,
+    )
 
     # Infrastructure Handlers
     infra_handlers = provide_all(
         SignUpHandler,
         LogInHandler,
         LogOutHandler,
+        ListSessionsHandler,
     )
 
     # Concrete Objects
@@ -79,12 +136,73 @@ class InfrastructureProvider(Provider):
         SqlaUserDataMapper,
         SqlaUserReader,
         SqlaMainTransactionManager,
+        SqlaStatementWarmUp,
     )
 
 
 def infrastructure_provider() -> InfrastructureProvider:
     provider = InfrastructureProvider()
 
+    # Observability
+    provider.provide(
+        source=MetricsRegistry,
+        scope=Scope.APP,
+    )
+
+    # Password Hashing
+    provider.provide(
+        source=get_password_hasher_executor,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_bcrypt_rounds,
+        scope=Scope.APP,
+    )
+
+    # User Listing
+    provider.provide(
+        source=UserListingGeneration,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_user_count_cache,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_user_page_cache,
+        scope=Scope.APP,
+    )
+
+    # Auth Shared State
+    provider.provide(
+        source=get_auth_session_cache,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_auth_session_invalidation_channel,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_auth_session_extension_writer,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_auth_revocation_epochs,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_auth_revocation_epoch_synchronizer,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_auth_session_reaper,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_login_attempt_store,
+        scope=Scope.APP,
+    )
+
     # SQLA Persistence
     provider.provide(
         source=get_async_engine,
@@ -94,10 +212,22 @@ def infrastructure_provider() -> InfrastructureProvider:
         source=get_async_session_factory,
         scope=Scope.APP,
     )
+    provider.provide(
+        source=get_read_router,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=SqlaStatementRegistry,
+        scope=Scope.APP,
+    )
     provider.provide(
         source=get_main_async_session,
         scope=Scope.REQUEST,
     )
+    provider.provide(
+        source=get_reader_async_session,
+        scope=Scope.REQUEST,
+    )
     provider.provide(
         source=get_auth_async_session,
         scope=Scope.REQUEST,
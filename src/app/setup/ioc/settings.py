@@ -1,11 +1,32 @@
 from dishka import Provider, Scope, from_context, provide
 
 from app.infrastructure.adapters.password_hasher_bcrypt import PasswordPepper
+from app.infrastructure.adapters.password_hasher_bcrypt_cost import BcryptCostConfig
+from app.infrastructure.adapters.password_hasher_executor import (
+    PasswordHasherExecutorConfig,
+)
+from app.infrastructure.adapters.user_listing_cache import (
+    UserCountConfig,
+    UserPageCacheConfig,
+)
+from app.infrastructure.auth.session.config import (
+    AuthSessionCacheConfig,
+    AuthSessionExtensionWriterConfig,
+    AuthSessionLookupConfig,
+    AuthSessionReaperConfig,
+    AuthSessionStatelessConfig,
+)
 from app.infrastructure.auth.session.timer_utc import (
     AuthSessionRefreshThreshold,
     AuthSessionTtlMin,
 )
-from app.infrastructure.persistence_sqla.config import PostgresDsn, SqlaEngineConfig
+from app.infrastructure.auth.throttle.config import LoginThrottleConfig
+from app.infrastructure.persistence_sqla.config import (
+    PostgresDsn,
+    SqlaEngineConfig,
+    SqlaReplicaConfig,
+    SqlaWarmUpConfig,
+)
 from app.presentation.http.auth.access_token_processor_jwt import (
     JwtAlgorithm,
     JwtSecret,
@@ -25,12 +46,64 @@ class SettingsProvider(Provider):
 
     @provide
     def provide_sqla_engine_config(self, settings: AppSettings) -> SqlaEngineConfig:
-        return SqlaEngineConfig(**settings.sqla.model_dump())
+        sqla_settings = settings.sqla
+        return SqlaEngineConfig(
+            echo=sqla_settings.echo,
+            echo_pool=sqla_settings.echo_pool,
+            pool_size=sqla_settings.pool_size,
+            max_overflow=sqla_settings.max_overflow,
+            share_request_session=sqla_settings.share_request_session,
+            prepare_threshold=sqla_settings.effective_prepare_threshold,
+            pool_recycle=sqla_settings.pool_recycle_sec,
+            ping_after_error=sqla_settings.ping_after_error_sec,
+            adaptive_overflow=sqla_settings.adaptive_overflow,
+            min_overflow=sqla_settings.min_overflow,
+            target_checkout_wait=sqla_settings.target_checkout_wait_ms,
+            overflow_adjust_interval=sqla_settings.overflow_adjust_interval_sec,
+        )
+
+    @provide
+    def provide_sqla_warm_up_config(self, settings: AppSettings) -> SqlaWarmUpConfig:
+        return SqlaWarmUpConfig(
+            connections=settings.sqla.warm_up_connections,
+            statements=settings.sqla.warm_up_statements,
+        )
+
+    @provide
+    def provide_sqla_replica_config(self, settings: AppSettings) -> SqlaReplicaConfig:
+        replica_dsn = settings.postgres.replica_dsn
+        return SqlaReplicaConfig(
+            dsn=None if replica_dsn is None else PostgresDsn(replica_dsn),
+            max_lag=settings.sqla.replica_max_lag_sec,
+            lag_check_interval=settings.sqla.replica_lag_check_interval_sec,
+        )
 
     @provide
     def provide_password_pepper(self, settings: AppSettings) -> PasswordPepper:
         return PasswordPepper(settings.security.password.pepper)
 
+    @provide
+    def provide_password_hasher_executor_config(
+        self,
+        settings: AppSettings,
+    ) -> PasswordHasherExecutorConfig:
+        hasher_settings = settings.password_hasher
+        return PasswordHasherExecutorConfig(
+            kind=hasher_settings.executor,
+            max_workers=hasher_settings.max_workers,
+            max_pending=hasher_settings.max_pending,
+        )
+
+    @provide
+    def provide_bcrypt_cost_config(self, settings: AppSettings) -> BcryptCostConfig:
+        hasher_settings = settings.password_hasher
+        return BcryptCostConfig(
+            rounds=hasher_settings.rounds,
+            target_hash_time=hasher_settings.target_hash_time_ms,
+            min_rounds=hasher_settings.min_rounds,
+            max_rounds=hasher_settings.max_rounds,
+        )
+
     @provide
     def provide_jwt_secret(self, settings: AppSettings) -> JwtSecret:
         return JwtSecret(settings.security.auth.jwt_secret)
@@ -52,6 +125,98 @@ class SettingsProvider(Provider):
             settings.security.auth.session_refresh_threshold,
         )
 
+    @provide
+    def provide_auth_session_cache_config(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionCacheConfig:
+        cache_settings = settings.auth_session.cache
+        return AuthSessionCacheConfig(
+            enabled=cache_settings.enabled,
+            max_size=cache_settings.max_size,
+            ttl=cache_settings.ttl_sec,
+            invalidation_channel=cache_settings.invalidation_channel,
+            listener_dsn=PostgresDsn(settings.postgres.direct_dsn),
+        )
+
+    @provide
+    def provide_auth_session_stateless_config(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionStatelessConfig:
+        stateless_settings = settings.auth_session.stateless
+        return AuthSessionStatelessConfig(
+            enabled=stateless_settings.enabled,
+            epoch_sync_interval=stateless_settings.epoch_sync_interval_sec,
+        )
+
+    @provide
+    def provide_auth_session_extension_writer_config(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionExtensionWriterConfig:
+        writer_settings = settings.auth_session.extension_writer
+        return AuthSessionExtensionWriterConfig(
+            enabled=writer_settings.enabled,
+            flush_interval=writer_settings.flush_interval_sec,
+            max_batch_size=writer_settings.max_batch_size,
+        )
+
+    @provide
+    def provide_auth_session_reaper_config(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionReaperConfig:
+        reaper_settings = settings.auth_session.reaper
+        return AuthSessionReaperConfig(
+            enabled=reaper_settings.enabled,
+            interval=reaper_settings.interval_sec,
+            batch_size=reaper_settings.batch_size,
+        )
+
+    @provide
+    def provide_auth_session_lookup_config(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionLookupConfig:
+        return AuthSessionLookupConfig(
+            join_user=settings.auth_session.lookup.join_user,
+        )
+
+    @provide
+    def provide_login_throttle_config(
+        self,
+        settings: AppSettings,
+    ) -> LoginThrottleConfig:
+        throttle_settings = settings.login_throttle
+        return LoginThrottleConfig(
+            enabled=throttle_settings.enabled,
+            store=throttle_settings.store,
+            window=throttle_settings.window_sec,
+            max_attempts_per_username=throttle_settings.max_attempts_per_username,
+            max_attempts_per_address=throttle_settings.max_attempts_per_address,
+            max_tracked_keys=throttle_settings.max_tracked_keys,
+        )
+
+    @provide
+    def provide_user_count_config(self, settings: AppSettings) -> UserCountConfig:
+        listing_settings = settings.user_listing
+        return UserCountConfig(
+            exact_threshold=listing_settings.exact_count_threshold,
+            cache_ttl=listing_settings.count_cache_ttl_sec,
+        )
+
+    @provide
+    def provide_user_page_cache_config(
+        self,
+        settings: AppSettings,
+    ) -> UserPageCacheConfig:
+        listing_settings = settings.user_listing
+        return UserPageCacheConfig(
+            ttl=listing_settings.page_cache_ttl_sec,
+            max_entries=listing_settings.page_cache_max_entries,
+        )
+
     @provide
     def provide_cookie_params(self, settings: AppSettings) -> CookieParams:
         return CookieParams(secure=settings.security.cookies.secure)
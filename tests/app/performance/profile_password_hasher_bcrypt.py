@@ -1,3 +1,17 @@
+"""
+Bcrypt cost-vs-latency benchmark.
+
+Reports the time per hash for each work factor on the current machine,
+the work factor startup calibration would pick for the given target,
+and a line profile of one hash-and-verify round trip through the hasher.
+
+Usage: python -m tests.app.performance.profile_password_hasher_bcrypt
+    [--min-rounds 10] [--max-rounds 15] [--samples 3] [--target-ms 250]
+"""
+
+import argparse
+import asyncio
+
 from line_profiler import LineProfiler
 
 from app.domain.value_objects.raw_password.raw_password import RawPassword
@@ -5,23 +19,67 @@ from app.infrastructure.adapters.password_hasher_bcrypt import (
     BcryptPasswordHasher,
     PasswordPepper,
 )
+from app.infrastructure.adapters.password_hasher_bcrypt_cost import (
+    BcryptRounds,
+    calibrate_rounds,
+    measure_hash_time,
+)
+from app.infrastructure.adapters.password_hasher_executor import (
+    PasswordHasherExecutor,
+    PasswordHasherExecutorConfig,
+)
+from app.infrastructure.metrics import MetricsRegistry
+
+
+def report_cost_curve(
+    min_rounds: int,
+    max_rounds: int,
+    samples: int,
+    target_ms: float,
+) -> None:
+    print(f"{'rounds':>6}  {'ms/hash':>10}  {'hashes/s/core':>13}")
+    for rounds in range(min_rounds, max_rounds + 1):
+        hash_time_sec = measure_hash_time(rounds, samples=samples)
+        marker = "  <= target" if hash_time_sec * 1000 <= target_ms else ""
+        print(
+            f"{rounds:>6}  {hash_time_sec * 1000:>10.1f}  "
+            f"{1 / hash_time_sec:>13.1f}{marker}",
+        )
+
+    calibrated = calibrate_rounds(target_ms / 1000, min_rounds, max_rounds)
+    print(f"\nCalibrated work factor for {target_ms:g} ms: {calibrated} rounds.\n")
 
 
 def profile_password_hashing(hasher: BcryptPasswordHasher) -> None:
-    raw_password = RawPassword("raw_password")
-    hashed = hasher.hash(raw_password)
-    hasher.verify(raw_password=raw_password, hashed_password=hashed)
+    async def hash_and_verify() -> None:
+        raw_password = RawPassword("raw_password")
+        hashed = await hasher.hash(raw_password)
+        await hasher.verify(raw_password=raw_password, hashed_password=hashed)
+
+    asyncio.run(hash_and_verify())
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Bcrypt cost-vs-latency benchmark.")
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=15)
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--target-ms", type=float, default=250)
+    args = parser.parse_args()
+
+    report_cost_curve(args.min_rounds, args.max_rounds, args.samples, args.target_ms)
+
     pepper = PasswordPepper("Cayenne!")
-    hasher = BcryptPasswordHasher(pepper)
+    config = PasswordHasherExecutorConfig(kind="thread", max_workers=1, max_pending=0)
+    executor = PasswordHasherExecutor(config, MetricsRegistry())
+    hasher = BcryptPasswordHasher(pepper, executor, BcryptRounds(args.min_rounds))
 
     profiler = LineProfiler()
     profiler.add_function(profile_password_hashing)
 
     profiler.runcall(profile_password_hashing, hasher)
     profiler.print_stats()
+    executor.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,131 @@
+"""
+Query response serialization benchmark.
+
+Serves the same `GET /users?limit=1000` page from two endpoints
+documented with the same response model: one returns the query result
+for FastAPI to validate and encode, the other returns it as
+`QueryJSONResponse`. Requests are sent straight to the ASGI app,
+so the timings cover routing and serialization, not the network.
+
+Usage: python -m tests.app.performance.profile_query_response
+    [--limit 1000] [--requests 200]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import MutableMapping
+from typing import Any
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from app.application.common.query_models.user import UserQueryModel
+from app.application.queries.list_users import ListUsersResponse
+from app.domain.enums.user_type import UserRole
+from app.presentation.http.responses import QueryJSONResponse
+
+
+def create_page(limit: int) -> ListUsersResponse:
+    return ListUsersResponse(
+        users=[
+            UserQueryModel(
+                id_=uuid4(),
+                username=f"user{i:06d}",
+                role=UserRole.USER,
+                is_active=True,
+            )
+            for i in range(limit)
+        ],
+        next_cursor="eyJzIjoidXNlcm5hbWUifQ",
+        total=1_000_000,
+        is_total_exact=False,
+    )
+
+
+def create_app(page: ListUsersResponse) -> FastAPI:
+    app = FastAPI(default_response_class=ORJSONResponse)
+
+    @app.get("/users", response_model=ListUsersResponse)
+    async def list_users_validated() -> ListUsersResponse:
+        return page
+
+    @app.get(
+        "/users-fast",
+        response_model=ListUsersResponse,
+        response_class=QueryJSONResponse,
+    )
+    async def list_users_fast() -> QueryJSONResponse:
+        return QueryJSONResponse(page)
+
+    return app
+
+
+class BodyCounter:
+    """
+    ASGI `receive` and `send` for a bodyless request,
+    counting the response body bytes.
+    """
+
+    def __init__(self) -> None:
+        self.body_size = 0
+
+    async def receive(self) -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(self, message: MutableMapping[str, Any]) -> None:
+        if message["type"] == "http.response.body":
+            self.body_size += len(message.get("body", b""))
+
+
+async def request(app: FastAPI, path: str, limit: int) -> int:
+    """
+    :returns: The response body size.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": f"limit={limit}".encode(),
+        "root_path": "",
+        "headers": [],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    counter = BodyCounter()
+    await app(scope, counter.receive, counter.send)
+    return counter.body_size
+
+
+async def run(limit: int, n_requests: int) -> None:
+    app = create_app(create_page(limit))
+    variants = {"validated": "/users", "query response": "/users-fast"}
+
+    print(f"{'variant':<16}  {'ms/request':>10}  {'body bytes':>10}")
+    for name, path in variants.items():
+        body_size = await request(app, path, limit)
+        started_at = time.perf_counter()
+        for _ in range(n_requests):
+            await request(app, path, limit)
+        elapsed_ms = (time.perf_counter() - started_at) * 1_000
+        print(f"{name:<16}  {elapsed_ms / n_requests:>10.3f}  {body_size:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Query response serialization benchmark.",
+    )
+    parser.add_argument("--limit", type=int, default=1_000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.limit, args.requests))
+
+
+if __name__ == "__main__":
+    main()
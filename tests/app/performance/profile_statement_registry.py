@@ -0,0 +1,124 @@
+"""
+Statement construction benchmark.
+
+Compares the Python overhead of a user list page query built afresh
+on every call, as `SqlaUserReader` used to, with the same query taken
+from `SqlaStatementRegistry` and given its values as bound parameters.
+Both variants are also executed against an in-memory SQLite database,
+where the compiled cache serves them alike, to show the share
+construction takes of a whole execution.
+
+Usage: python -m tests.app.performance.profile_statement_registry
+    [--iterations 20000]
+"""
+
+import argparse
+import timeit
+from collections.abc import Callable
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    bindparam,
+    create_engine,
+    literal,
+    select,
+    tuple_,
+)
+
+from app.domain.enums.user_type import UserRole
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+from app.infrastructure.persistence_sqla.statement_registry import (
+    SqlaStatementRegistry,
+)
+
+UserRowSelect = Select[tuple[UUID, str, UserRole, bool]]
+
+
+def build_page_stmt(
+    is_active: bool | ColumnElement[bool],
+    after_username: ColumnElement[str],
+    after_id: ColumnElement[UUID],
+    limit: int | ColumnElement[int],
+) -> UserRowSelect:
+    """
+    Active users after a keyset position, ordered by username.
+    Given values, it's the statement built per call; given bound parameters,
+    the one kept in the registry.
+    """
+    sort_key = tuple_(users_table.c.username, users_table.c.id)
+    position = tuple_(after_username, after_id)
+    return (
+        select(
+            users_table.c.id,
+            users_table.c.username,
+            users_table.c.role,
+            users_table.c.is_active,
+        )
+        .where(users_table.c.is_active == is_active, sort_key > position)
+        .order_by(users_table.c.username.asc(), users_table.c.id.asc())
+        .limit(limit)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Statement construction benchmark.")
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    registry = SqlaStatementRegistry(MetricsRegistry())
+    after_id = uuid4()
+    params = {
+        "is_active": True,
+        "after_value": "alice",
+        "after_id": after_id,
+        "limit": 21,
+    }
+
+    def registry_stmt() -> UserRowSelect:
+        return registry.get(
+            ("users_page",),
+            lambda: build_page_stmt(
+                bindparam("is_active"),
+                bindparam("after_value", type_=users_table.c.username.type),
+                bindparam("after_id", type_=users_table.c.id.type),
+                bindparam("limit"),
+            ),
+        )
+
+    def fresh_stmt() -> UserRowSelect:
+        return build_page_stmt(
+            True,
+            literal("alice", users_table.c.username.type),
+            literal(after_id, users_table.c.id.type),
+            21,
+        )
+
+    engine = create_engine("sqlite://")
+    users_table.create(engine)
+    with engine.connect() as connection:
+        variants: dict[str, tuple[Callable[[], object], Callable[[], object]]] = {
+            "fresh construct": (
+                fresh_stmt,
+                lambda: connection.execute(fresh_stmt()).all(),
+            ),
+            "registry": (
+                registry_stmt,
+                lambda: connection.execute(registry_stmt(), params).all(),
+            ),
+        }
+
+        print(f"{'variant':<16}  {'build us/call':>13}  {'execute us/call':>15}")
+        for name, (build, execute) in variants.items():
+            build_sec = timeit.timeit(build, number=args.iterations)
+            execute_sec = timeit.timeit(execute, number=args.iterations)
+            print(
+                f"{name:<16}  {build_sec / args.iterations * 1e6:>13.2f}  "
+                f"{execute_sec / args.iterations * 1e6:>15.2f}",
+            )
+
+
+if __name__ == "__main__":
+    main()
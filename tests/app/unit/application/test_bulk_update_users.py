@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+
+from app.application.commands.bulk_update_users import (
+    BulkUpdateUsersInteractor,
+    BulkUpdateUsersRequest,
+    UserBulkAction,
+)
+from app.application.common.exceptions.bulk import EmptySelectionError
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.enums.user_type import UserRole
+from tests.app.unit.factories.value_objects import create_user_id, create_username
+
+
+def create_user_mock(username: str, role: UserRole) -> MagicMock:
+    return MagicMock(
+        id_=create_user_id(),
+        username=create_username(username),
+        role=role,
+    )
+
+
+def create_interactor(
+    gateway: MagicMock,
+    access_revoker: MagicMock,
+) -> BulkUpdateUsersInteractor:
+    current_user_service = create_autospec(CurrentUserService, instance=True)
+    current_user_service.get_current_user.return_value = MagicMock(
+        role=UserRole.ADMIN,
+    )
+    return BulkUpdateUsersInteractor(
+        current_user_service,
+        gateway,
+        create_autospec(TransactionManager, instance=True),
+        access_revoker,
+        create_autospec(UserListingInvalidator, instance=True),
+    )
+
+
+@pytest.mark.asyncio
+async def test_deactivates_only_subordinates_in_one_update() -> None:
+    user = create_user_mock("alice1", UserRole.USER)
+    admin = create_user_mock("bob123", UserRole.ADMIN)
+    gateway = create_autospec(UserCommandGateway, instance=True)
+    gateway.read_many_for_update.return_value = [user, admin]
+    access_revoker = create_autospec(AccessRevoker, instance=True)
+    sut = create_interactor(gateway, access_revoker)
+
+    response = await sut.execute(
+        BulkUpdateUsersRequest(
+            action=UserBulkAction.DEACTIVATE,
+            usernames=["alice1", "bob123", "carol1"],
+        ),
+    )
+
+    gateway.update_many.assert_awaited_once_with([user.id_], is_active=False)
+    access_revoker.remove_all_users_access.assert_awaited_once_with([user.id_])
+    assert response == {
+        "updated": ["alice1"],
+        "not_permitted": ["bob123"],
+        "not_found": ["carol1"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_rejects_empty_selection() -> None:
+    gateway = create_autospec(UserCommandGateway, instance=True)
+    sut = create_interactor(gateway, create_autospec(AccessRevoker, instance=True))
+
+    with pytest.raises(EmptySelectionError):
+        await sut.execute(BulkUpdateUsersRequest(action=UserBulkAction.ACTIVATE))
+
+    gateway.read_many_for_update.assert_not_awaited()
@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+
+from app.application.commands.change_password import (
+    ChangePasswordInteractor,
+    ChangePasswordRequest,
+)
+from app.application.common.exceptions.concurrency import ConcurrentUpdateError
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.services.user import UserService
+from tests.app.unit.factories.value_objects import (
+    create_password_hash,
+    create_username,
+)
+
+
+@pytest.mark.asyncio
+async def test_hashes_password_once_across_retries() -> None:
+    user = MagicMock(username=create_username("alice1"))
+    current_user_service = create_autospec(CurrentUserService, instance=True)
+    current_user_service.get_current_user.return_value = user
+    gateway = create_autospec(UserCommandGateway, instance=True)
+    gateway.read_by_username.return_value = user
+    user_service = create_autospec(UserService, instance=True)
+    password_hash = create_password_hash()
+    user_service.hash_password.return_value = password_hash
+    transaction_manager = create_autospec(TransactionManager, instance=True)
+    transaction_manager.savepoint.return_value.__aexit__.side_effect = [
+        ConcurrentUpdateError(""),
+        None,
+    ]
+    sut = ChangePasswordInteractor(
+        current_user_service,
+        gateway,
+        user_service,
+        transaction_manager,
+    )
+
+    await sut.execute(
+        ChangePasswordRequest(username=user.username.value, password="new_password"),
+    )
+
+    user_service.hash_password.assert_awaited_once()
+    assert gateway.read_by_username.await_count == 2
+    assert user_service.set_password_hash.call_count == 2
+    user_service.set_password_hash.assert_called_with(user, password_hash)
+    transaction_manager.commit.assert_awaited_once()
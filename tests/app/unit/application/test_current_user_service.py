@@ -0,0 +1,46 @@
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.identity_provider import IdentityProvider
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.entities.user import User
+from tests.app.unit.factories.value_objects import create_user_id
+
+
+def create_identity_provider(loaded_user: User | None) -> MagicMock:
+    identity_provider: MagicMock = create_autospec(IdentityProvider, instance=True)
+    identity_provider.get_current_user_id.return_value = create_user_id()
+    identity_provider.get_loaded_current_user.return_value = loaded_user
+    return identity_provider
+
+
+@pytest.mark.asyncio
+async def test_uses_user_loaded_with_identity() -> None:
+    user = MagicMock(spec=User)
+    gateway = create_autospec(UserCommandGateway, instance=True)
+    sut = CurrentUserService(
+        create_identity_provider(loaded_user=user),
+        gateway,
+        AsyncMock(spec=AccessRevoker),
+    )
+
+    assert await sut.get_current_user() is user
+    gateway.read_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reads_user_by_id_when_not_loaded() -> None:
+    user = MagicMock(spec=User)
+    gateway = create_autospec(UserCommandGateway, instance=True)
+    gateway.read_by_id.return_value = user
+    sut = CurrentUserService(
+        create_identity_provider(loaded_user=None),
+        gateway,
+        AsyncMock(spec=AccessRevoker),
+    )
+
+    assert await sut.get_current_user() is user
+    gateway.read_by_id.assert_awaited_once()
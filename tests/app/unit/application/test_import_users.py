@@ -0,0 +1,90 @@
+from collections.abc import Sequence
+from unittest.mock import MagicMock, create_autospec
+from uuid import uuid4
+
+import pytest
+
+from app.application.commands.import_users import (
+    ImportUsersInteractor,
+    UserImportRow,
+)
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.ports.user_importer import (
+    UserImportConflict,
+    UserImporter,
+)
+from app.application.common.ports.user_listing_invalidator import (
+    UserListingInvalidator,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.enums.user_type import UserRole
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.ports.user_id_generator import UserIdGenerator
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+
+
+def as_stream(rows: list[UserImportRow]) -> MagicMock:
+    stream = MagicMock()
+    stream.__aiter__.return_value = rows
+    return stream
+
+
+def create_interactor(
+    importer: MagicMock,
+    role: UserRole = UserRole.ADMIN,
+) -> ImportUsersInteractor:
+    current_user_service = create_autospec(CurrentUserService, instance=True)
+    current_user_service.get_current_user.return_value = MagicMock(role=role)
+
+    def hash_many(raw_passwords: Sequence[RawPassword]) -> list[bytes]:
+        return [password.value.encode() for password in raw_passwords]
+
+    password_hasher = create_autospec(PasswordHasher, instance=True)
+    password_hasher.hash_many.side_effect = hash_many
+    user_id_generator = create_autospec(UserIdGenerator, instance=True)
+    user_id_generator.side_effect = uuid4
+    return ImportUsersInteractor(
+        current_user_service,
+        user_id_generator,
+        password_hasher,
+        importer,
+        create_autospec(TransactionManager, instance=True),
+        create_autospec(UserListingInvalidator, instance=True),
+    )
+
+
+@pytest.mark.asyncio
+async def test_stages_valid_rows_and_reports_the_rest() -> None:
+    importer = create_autospec(UserImporter, instance=True)
+    importer.merge.return_value = [UserImportConflict(line=4, username="carol")]
+    sut = create_interactor(importer)
+    rows = [
+        UserImportRow(line=1, username="alice", password="password1"),
+        UserImportRow(line=2, username="a", password="password2"),
+        UserImportRow(line=3, username="alice", password="password3"),
+        UserImportRow(line=4, username="carol", password="password4"),
+        UserImportRow(line=5, username="dave", password="password5", role="owner"),
+        UserImportRow(line=6, error="Invalid JSON."),
+    ]
+
+    response = await sut.execute(as_stream(rows))
+
+    staged = importer.stage.await_args.args[0]
+    assert [user.line for user in staged] == [1, 4]
+    assert staged[0].password_hash.value == b"password1"
+    assert response["imported"] == 1
+    assert [issue["line"] for issue in response["rejected"]] == [2, 3, 5, 6]
+    assert [issue["line"] for issue in response["conflicts"]] == [4]
+
+
+@pytest.mark.asyncio
+async def test_admin_cannot_import_admins() -> None:
+    importer = create_autospec(UserImporter, instance=True)
+    sut = create_interactor(importer)
+    rows = [UserImportRow(line=1, username="alice", password="password1", role="admin")]
+
+    with pytest.raises(AuthorizationError):
+        await sut.execute(as_stream(rows))
+
+    importer.merge.assert_not_awaited()
@@ -0,0 +1,119 @@
+from unittest.mock import MagicMock, create_autospec
+from uuid import uuid4
+
+import pytest
+
+from app.application.common.exceptions.query import PaginationError
+from app.application.common.ports.user_query_gateway import UserQueryGateway
+from app.application.common.query_models.user import UserQueryPage
+from app.application.common.query_params.cursor import encode_cursor
+from app.application.common.query_params.pagination import KeysetPosition
+from app.application.common.query_params.sorting import SortingOrder
+from app.application.common.query_params.user import UserListFilters
+from app.application.common.services.current_user import CurrentUserService
+from app.application.queries.list_users import (
+    ListUsersQueryService,
+    ListUsersRequest,
+)
+from app.domain.enums.user_type import UserRole
+
+
+def create_service(gateway: MagicMock) -> ListUsersQueryService:
+    current_user_service = create_autospec(CurrentUserService, instance=True)
+    current_user_service.get_current_user.return_value = MagicMock(
+        role=UserRole.SUPER_ADMIN,
+    )
+    return ListUsersQueryService(current_user_service, gateway)
+
+
+def create_request(
+    cursor: str | None = None,
+    sorting_field: str = "role",
+    sorting_order: SortingOrder = SortingOrder.ASC,
+) -> ListUsersRequest:
+    return ListUsersRequest(
+        limit=20,
+        offset=0,
+        sorting_field=sorting_field,
+        sorting_order=sorting_order,
+        cursor=cursor,
+    )
+
+
+@pytest.mark.asyncio
+async def test_next_cursor_resumes_after_last_position() -> None:
+    position = KeysetPosition(sorting_value=UserRole.ADMIN, id_=uuid4())
+    gateway = create_autospec(UserQueryGateway, instance=True)
+    gateway.read_all.return_value = UserQueryPage(users=[], next_position=position)
+    sut = create_service(gateway)
+
+    first_page = await sut.execute(create_request())
+    await sut.execute(create_request(cursor=first_page["next_cursor"]))
+
+    params = gateway.read_all.await_args.args[0]
+    assert params.pagination.after == position
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_next_cursor() -> None:
+    gateway = create_autospec(UserQueryGateway, instance=True)
+    gateway.read_all.return_value = UserQueryPage(users=[], next_position=None)
+    sut = create_service(gateway)
+
+    response = await sut.execute(create_request())
+
+    assert response["next_cursor"] is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        pytest.param("not-a-cursor", id="garbage"),
+        pytest.param(
+            encode_cursor(
+                KeysetPosition(sorting_value="alice", id_=uuid4()),
+                sorting_field="username",
+                sorting_order=SortingOrder.ASC,
+            ),
+            id="different_sorting",
+        ),
+        pytest.param(
+            encode_cursor(
+                KeysetPosition(sorting_value="emperor", id_=uuid4()),
+                sorting_field="role",
+                sorting_order=SortingOrder.ASC,
+            ),
+            id="tampered_value",
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_rejects_invalid_cursor(cursor: str) -> None:
+    gateway = create_autospec(UserQueryGateway, instance=True)
+    sut = create_service(gateway)
+
+    with pytest.raises(PaginationError):
+        await sut.execute(create_request(cursor=cursor))
+
+    gateway.read_all.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_applies_same_filters_to_page_and_total() -> None:
+    gateway = create_autospec(UserQueryGateway, instance=True)
+    gateway.read_all.return_value = UserQueryPage(users=[], next_position=None)
+    sut = create_service(gateway)
+    request = ListUsersRequest(
+        limit=20,
+        offset=0,
+        sorting_field="username",
+        sorting_order=SortingOrder.ASC,
+        role=UserRole.ADMIN,
+        username_prefix="ali",
+    )
+
+    await sut.execute(request)
+
+    filters = gateway.read_all.await_args.args[0].filters
+    assert filters == UserListFilters(role=UserRole.ADMIN, username_prefix="ali")
+    gateway.count_all.assert_awaited_once_with(filters)
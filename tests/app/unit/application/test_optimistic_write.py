@@ -0,0 +1,37 @@
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from app.application.common.exceptions.concurrency import ConcurrentUpdateError
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.services.optimistic_write import (
+    OPTIMISTIC_WRITE_ATTEMPTS,
+    write_optimistically,
+)
+
+
+@pytest.mark.asyncio
+async def test_retries_operation_after_concurrent_update() -> None:
+    transaction_manager = create_autospec(TransactionManager, instance=True)
+    transaction_manager.savepoint.return_value.__aexit__.side_effect = [
+        ConcurrentUpdateError(""),
+        None,
+    ]
+    operation = AsyncMock(return_value="done")
+
+    result = await write_optimistically(transaction_manager, operation)
+
+    assert result == "done"
+    assert operation.await_count == 2
+    transaction_manager.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_raises_when_attempts_are_exhausted() -> None:
+    transaction_manager = create_autospec(TransactionManager, instance=True)
+    operation = AsyncMock(side_effect=ConcurrentUpdateError(""))
+
+    with pytest.raises(ConcurrentUpdateError):
+        await write_optimistically(transaction_manager, operation)
+
+    assert operation.await_count == OPTIMISTIC_WRITE_ATTEMPTS
@@ -33,7 +33,8 @@ from tests.app.unit.factories.value_objects import (
     "user_type",
     [UserType.VIEWER, UserType.STREAMER],
 )
-def test_creates_active_user_with_hashed_password(
+@pytest.mark.asyncio
+async def test_creates_active_user_with_hashed_password(
     role: UserRole,
     user_type: UserType,
     user_id_generator: MagicMock,
@@ -54,7 +55,7 @@ def test_creates_active_user_with_hashed_password(
     sut = UserService(user_id_generator, password_hasher)
 
     # Act
-    result = sut.create_user(
+    result = await sut.create_user(
         username=username,
         raw_password=raw_password,
         email=expected_email,
@@ -86,7 +87,8 @@ def test_creates_active_user_with_hashed_password(
     "user_type",
     [UserType.VIEWER, UserType.STREAMER],
 )
-def test_creates_locked_user_if_specified(
+@pytest.mark.asyncio
+async def test_creates_locked_user_if_specified(
     role: UserRole,
     user_type: UserType,
     user_id_generator: MagicMock,
@@ -107,7 +109,7 @@ def test_creates_locked_user_if_specified(
     sut = UserService(user_id_generator, password_hasher)
 
     # Act
-    result = sut.create_user(
+    result = await sut.create_user(
         username=username,
         raw_password=raw_password,
         email=expected_email,
@@ -130,7 +132,8 @@ def test_creates_locked_user_if_specified(
     "user_type",
     [UserType.VIEWER, UserType.STREAMER],
 )
-def test_creates_active_user_with_invalid_balance(
+@pytest.mark.asyncio
+async def test_creates_active_user_with_invalid_balance(
     role: UserRole,
     user_type: UserType,
     user_id_generator: MagicMock,
@@ -151,7 +154,7 @@ def test_creates_active_user_with_invalid_balance(
 
     # Act
     with pytest.raises(DomainFieldError, match="Money cannot be negative"):
-        sut.create_user(
+        await sut.create_user(
             username=username,
             raw_password=raw_password,
             email=valid_email,
@@ -171,7 +174,8 @@ def test_creates_active_user_with_invalid_balance(
     "user_type",
     [UserType.VIEWER, UserType.STREAMER],
 )
-def test_increases_balance(
+@pytest.mark.asyncio
+async def test_increases_balance(
     role: UserRole,
     user_type: UserType,
     user_id_generator: MagicMock,
@@ -192,7 +196,7 @@ def test_increases_balance(
     sut = UserService(user_id_generator, password_hasher)
 
     # Act
-    user = sut.create_user(
+    user = await sut.create_user(
         username=username,
         raw_password=raw_password,
         email=valid_email,
@@ -218,7 +222,8 @@ def test_increases_balance(
     "user_type",
     [UserType.VIEWER, UserType.STREAMER],
 )
-def test_decrease_insufficient_funds(
+@pytest.mark.asyncio
+async def test_decrease_insufficient_funds(
     role: UserRole,
     user_type: UserType,
     user_id_generator: MagicMock,
@@ -239,7 +244,7 @@ def test_decrease_insufficient_funds(
     sut = UserService(user_id_generator, password_hasher)
 
     # Act
-    user = sut.create_user(
+    user = await sut.create_user(
         username=username,
         raw_password=raw_password,
         email=valid_email,
@@ -61,3 +61,185 @@ def create_postgres_settings_data(
         PORT=port,
         DRIVER=driver,
     )
+
+
+class SqlaEngineSettingsData(TypedDict):
+    ECHO: bool
+    ECHO_POOL: bool
+    POOL_SIZE: int
+    MAX_OVERFLOW: int
+    ADAPTIVE_OVERFLOW: bool
+    MIN_OVERFLOW: int
+    TARGET_CHECKOUT_WAIT_MS: int | float
+    OVERFLOW_ADJUST_INTERVAL_SEC: int | float
+    SHARE_REQUEST_SESSION: bool
+    PREPARE_THRESHOLD: int
+    PGBOUNCER_TRANSACTION_MODE: bool
+    POOL_RECYCLE_SEC: int | float
+    PING_AFTER_ERROR_SEC: int | float
+    WARM_UP_CONNECTIONS: int
+    WARM_UP_STATEMENTS: bool
+    REPLICA_MAX_LAG_SEC: int | float
+    REPLICA_LAG_CHECK_INTERVAL_SEC: int | float
+
+
+def create_sqla_engine_settings_data(
+    max_overflow: int = 10,
+    min_overflow: int = 0,
+    target_checkout_wait_ms: int | float = 10,
+    overflow_adjust_interval_sec: int | float = 10,
+    share_request_session: bool = True,
+    prepare_threshold: int = 2,
+    pgbouncer_transaction_mode: bool = False,
+    pool_recycle_sec: int | float = 1800,
+    ping_after_error_sec: int | float = 30,
+    warm_up_connections: int = 10,
+) -> SqlaEngineSettingsData:
+    return SqlaEngineSettingsData(
+        ECHO=False,
+        ECHO_POOL=False,
+        POOL_SIZE=50,
+        MAX_OVERFLOW=max_overflow,
+        ADAPTIVE_OVERFLOW=True,
+        MIN_OVERFLOW=min_overflow,
+        TARGET_CHECKOUT_WAIT_MS=target_checkout_wait_ms,
+        OVERFLOW_ADJUST_INTERVAL_SEC=overflow_adjust_interval_sec,
+        SHARE_REQUEST_SESSION=share_request_session,
+        PREPARE_THRESHOLD=prepare_threshold,
+        PGBOUNCER_TRANSACTION_MODE=pgbouncer_transaction_mode,
+        POOL_RECYCLE_SEC=pool_recycle_sec,
+        PING_AFTER_ERROR_SEC=ping_after_error_sec,
+        WARM_UP_CONNECTIONS=warm_up_connections,
+        WARM_UP_STATEMENTS=True,
+        REPLICA_MAX_LAG_SEC=5,
+        REPLICA_LAG_CHECK_INTERVAL_SEC=1,
+    )
+
+
+class AuthSessionCacheSettingsData(TypedDict):
+    ENABLED: bool
+    MAX_SIZE: int
+    TTL_SEC: int | float
+    INVALIDATION_CHANNEL: Literal["in_process", "pg_notify"]
+
+
+def create_auth_session_cache_settings_data(
+    enabled: bool = True,
+    max_size: int = 100,
+    ttl_sec: int | float = 30,
+    invalidation_channel: Literal["in_process", "pg_notify"] = "in_process",
+) -> AuthSessionCacheSettingsData:
+    return AuthSessionCacheSettingsData(
+        ENABLED=enabled,
+        MAX_SIZE=max_size,
+        TTL_SEC=ttl_sec,
+        INVALIDATION_CHANNEL=invalidation_channel,
+    )
+
+
+class AuthSessionStatelessSettingsData(TypedDict):
+    ENABLED: bool
+    EPOCH_SYNC_INTERVAL_SEC: int | float
+
+
+def create_auth_session_stateless_settings_data(
+    enabled: bool = True,
+    epoch_sync_interval_sec: int | float = 5,
+) -> AuthSessionStatelessSettingsData:
+    return AuthSessionStatelessSettingsData(
+        ENABLED=enabled,
+        EPOCH_SYNC_INTERVAL_SEC=epoch_sync_interval_sec,
+    )
+
+
+class AuthSessionExtensionWriterSettingsData(TypedDict):
+    ENABLED: bool
+    FLUSH_INTERVAL_SEC: int | float
+    MAX_BATCH_SIZE: int
+
+
+def create_auth_session_extension_writer_settings_data(
+    enabled: bool = True,
+    flush_interval_sec: int | float = 1,
+    max_batch_size: int = 1000,
+) -> AuthSessionExtensionWriterSettingsData:
+    return AuthSessionExtensionWriterSettingsData(
+        ENABLED=enabled,
+        FLUSH_INTERVAL_SEC=flush_interval_sec,
+        MAX_BATCH_SIZE=max_batch_size,
+    )
+
+
+class AuthSessionReaperSettingsData(TypedDict):
+    ENABLED: bool
+    INTERVAL_SEC: int | float
+    BATCH_SIZE: int
+
+
+def create_auth_session_reaper_settings_data(
+    enabled: bool = True,
+    interval_sec: int | float = 300,
+    batch_size: int = 5000,
+) -> AuthSessionReaperSettingsData:
+    return AuthSessionReaperSettingsData(
+        ENABLED=enabled,
+        INTERVAL_SEC=interval_sec,
+        BATCH_SIZE=batch_size,
+    )
+
+
+class LoginThrottleSettingsData(TypedDict):
+    ENABLED: bool
+    STORE: str
+    WINDOW_SEC: int | float
+    MAX_ATTEMPTS_PER_USERNAME: int
+    MAX_ATTEMPTS_PER_ADDRESS: int
+    MAX_TRACKED_KEYS: int
+
+
+def create_login_throttle_settings_data(
+    enabled: bool = True,
+    store: str = "in_memory",
+    window_sec: int | float = 900,
+    max_attempts_per_username: int = 10,
+    max_attempts_per_address: int = 100,
+    max_tracked_keys: int = 100_000,
+) -> LoginThrottleSettingsData:
+    return LoginThrottleSettingsData(
+        ENABLED=enabled,
+        STORE=store,
+        WINDOW_SEC=window_sec,
+        MAX_ATTEMPTS_PER_USERNAME=max_attempts_per_username,
+        MAX_ATTEMPTS_PER_ADDRESS=max_attempts_per_address,
+        MAX_TRACKED_KEYS=max_tracked_keys,
+    )
+
+
+class PasswordHasherSettingsData(TypedDict):
+    EXECUTOR: str
+    MAX_WORKERS: int
+    MAX_PENDING: int
+    ROUNDS: int | str
+    TARGET_HASH_TIME_MS: int | float
+    MIN_ROUNDS: int
+    MAX_ROUNDS: int
+
+
+def create_password_hasher_settings_data(
+    executor: str = "thread",
+    max_workers: int = 4,
+    max_pending: int = 64,
+    rounds: int | str = "auto",
+    target_hash_time_ms: int | float = 250,
+    min_rounds: int = 12,
+    max_rounds: int = 16,
+) -> PasswordHasherSettingsData:
+    return PasswordHasherSettingsData(
+        EXECUTOR=executor,
+        MAX_WORKERS=max_workers,
+        MAX_PENDING=max_pending,
+        ROUNDS=rounds,
+        TARGET_HASH_TIME_MS=target_hash_time_ms,
+        MIN_ROUNDS=min_rounds,
+        MAX_ROUNDS=max_rounds,
+    )
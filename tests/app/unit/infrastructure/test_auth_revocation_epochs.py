@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+from app.infrastructure.auth.session.config import AuthSessionStatelessConfig
+from app.infrastructure.auth.session.revocation_epochs import (
+    STALENESS_SYNC_INTERVALS,
+    AuthRevocationEpochs,
+)
+from tests.app.unit.factories.value_objects import create_user_id
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_revocation_epochs(
+    clock: FakeClock | None = None,
+    sync_interval_sec: float = 5,
+) -> AuthRevocationEpochs:
+    config = AuthSessionStatelessConfig(
+        enabled=True,
+        epoch_sync_interval=timedelta(seconds=sync_interval_sec),
+    )
+    return AuthRevocationEpochs(config, clock or FakeClock())
+
+
+def test_unknown_user_has_zero_epoch() -> None:
+    sut = create_revocation_epochs()
+
+    assert sut.get(create_user_id()) == 0
+    assert len(sut) == 0
+
+
+def test_epochs_never_go_backwards() -> None:
+    sut = create_revocation_epochs()
+    user_id = create_user_id()
+
+    sut.advance(user_id.value, 3)
+    sut.apply_sync([(user_id.value, 2)])
+
+    assert sut.get(user_id) == 3
+
+
+def test_is_not_fresh_before_first_sync() -> None:
+    sut = create_revocation_epochs()
+
+    assert not sut.is_fresh
+
+
+def test_becomes_stale_without_recent_sync() -> None:
+    clock = FakeClock()
+    sut = create_revocation_epochs(clock, sync_interval_sec=5)
+    sut.apply_sync([])
+
+    clock.now = 5 * STALENESS_SYNC_INTERVALS
+    assert sut.is_fresh
+
+    clock.now += 0.1
+    assert not sut.is_fresh
@@ -0,0 +1,64 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.auth.adapters.extension_writer_sqla import (
+    SqlaAuthSessionExtensionWriter,
+)
+from app.infrastructure.auth.session.config import AuthSessionExtensionWriterConfig
+from app.infrastructure.auth.session.model import AuthSession
+from tests.app.unit.factories.value_objects import create_user_id
+
+
+def create_extension_writer(engine: MagicMock) -> SqlaAuthSessionExtensionWriter:
+    config = AuthSessionExtensionWriterConfig(
+        enabled=True,
+        flush_interval=timedelta(seconds=1),
+        max_batch_size=10,
+    )
+    return SqlaAuthSessionExtensionWriter(engine, config)
+
+
+def create_auth_session(auth_session_id: str, expiration: datetime) -> AuthSession:
+    return AuthSession(
+        id_=auth_session_id,
+        user_id=create_user_id(),
+        expiration=expiration,
+    )
+
+
+def test_coalesces_extensions_of_same_session() -> None:
+    sut = create_extension_writer(MagicMock(spec=AsyncEngine))
+    now = datetime.now(tz=UTC)
+
+    sut.schedule(create_auth_session("a", now))
+    sut.schedule(create_auth_session("a", now + timedelta(minutes=1)))
+    sut.schedule(create_auth_session("b", now))
+
+    assert len(sut) == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_without_extensions_does_not_touch_database() -> None:
+    engine = MagicMock(spec=AsyncEngine)
+    sut = create_extension_writer(engine)
+
+    await sut.flush()
+
+    engine.begin.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_extensions_for_retry() -> None:
+    engine = MagicMock(spec=AsyncEngine)
+    engine.begin.side_effect = SQLAlchemyError("connection lost")
+    sut = create_extension_writer(engine)
+    sut.schedule(create_auth_session("a", datetime.now(tz=UTC)))
+
+    with pytest.raises(SQLAlchemyError):
+        await sut.flush()
+
+    assert len(sut) == 1
@@ -0,0 +1,104 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.infrastructure.auth.adapters.reaper_sqla import SqlaAuthSessionReaper
+from app.infrastructure.auth.session.config import AuthSessionReaperConfig
+from app.infrastructure.metrics import MetricsRegistry
+
+BATCH_SIZE = 10
+
+
+def create_engine(connection: AsyncMock) -> MagicMock:
+    engine = MagicMock(spec=AsyncEngine)
+    engine.connect.return_value.__aenter__.return_value = connection
+    return engine
+
+
+def create_lock_result(is_locked: bool) -> MagicMock:
+    return MagicMock(scalar_one=MagicMock(return_value=is_locked))
+
+
+def create_connection(is_locked: bool, deleted_per_batch: list[int]) -> AsyncMock:
+    results: list[MagicMock] = []
+    for n_deleted in deleted_per_batch:
+        results += [create_lock_result(is_locked), MagicMock(rowcount=n_deleted)]
+
+    connection = AsyncMock(spec=AsyncConnection)
+    connection.execute.side_effect = results or [create_lock_result(is_locked)]
+    return connection
+
+
+def create_reaper(
+    engine: MagicMock,
+    metrics: MetricsRegistry,
+) -> SqlaAuthSessionReaper:
+    config = AuthSessionReaperConfig(
+        enabled=True,
+        interval=timedelta(minutes=5),
+        batch_size=BATCH_SIZE,
+    )
+    return SqlaAuthSessionReaper(engine, config, metrics)
+
+
+@pytest.mark.asyncio
+async def test_skips_run_when_another_worker_holds_lock() -> None:
+    connection = create_connection(is_locked=False, deleted_per_batch=[])
+    metrics = MetricsRegistry()
+    sut = create_reaper(create_engine(connection), metrics)
+
+    result = await sut.reap()
+
+    assert result is None
+    assert connection.execute.await_count == 1
+    connection.rollback.assert_awaited_once()
+    assert (
+        metrics.counter("auth_session_reaper_runs_total", "").value(
+            outcome="skipped",
+        )
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_deletes_batches_until_short_batch() -> None:
+    connection = create_connection(
+        is_locked=True,
+        deleted_per_batch=[BATCH_SIZE, BATCH_SIZE, 3],
+    )
+    metrics = MetricsRegistry()
+    sut = create_reaper(create_engine(connection), metrics)
+
+    result = await sut.reap()
+
+    assert result == 2 * BATCH_SIZE + 3
+    assert connection.commit.await_count == 3
+    assert metrics.counter("auth_session_reaper_rows_reaped_total", "").value() == 23
+    assert (
+        metrics.histogram("auth_session_reaper_batch_duration_seconds", "").count() == 3
+    )
+
+
+@pytest.mark.asyncio
+async def test_stops_when_lock_taken_elsewhere_between_batches() -> None:
+    connection = AsyncMock(spec=AsyncConnection)
+    connection.execute.side_effect = [
+        create_lock_result(is_locked=True),
+        MagicMock(rowcount=BATCH_SIZE),
+        create_lock_result(is_locked=False),
+    ]
+    metrics = MetricsRegistry()
+    sut = create_reaper(create_engine(connection), metrics)
+
+    result = await sut.reap()
+
+    assert result == BATCH_SIZE
+    connection.rollback.assert_awaited_once()
+    assert (
+        metrics.counter("auth_session_reaper_runs_total", "").value(
+            outcome="completed",
+        )
+        == 1
+    )
@@ -0,0 +1,35 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.common.services.current_user import CurrentUserService
+from app.infrastructure.auth.handlers.list_sessions import (
+    ListSessionsHandler,
+    ListSessionsRequest,
+)
+from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.service import AuthSessionService
+from tests.app.unit.factories.value_objects import create_user_id
+
+
+@pytest.mark.asyncio
+async def test_marks_current_session_without_disclosing_ids() -> None:
+    user_id = create_user_id()
+    expiration = datetime.now(tz=UTC) + timedelta(minutes=5)
+    current_user_service = AsyncMock(spec=CurrentUserService)
+    current_user_service.get_current_user.return_value = MagicMock(id_=user_id)
+    auth_session_service = AsyncMock(spec=AuthSessionService)
+    auth_session_service.count_live_sessions_for_user.return_value = 2
+    auth_session_service.list_live_sessions_for_user.return_value = [
+        AuthSession(id_="current", user_id=user_id, expiration=expiration),
+        AuthSession(id_="other", user_id=user_id, expiration=expiration),
+    ]
+    auth_session_service.get_current_session_id = MagicMock(return_value="current")
+    sut = ListSessionsHandler(current_user_service, auth_session_service)
+
+    response = await sut.execute(ListSessionsRequest(limit=20))
+
+    assert response["total"] == 2
+    assert [view["is_current"] for view in response["sessions"]] == [True, False]
+    assert all("id" not in view for view in response["sessions"])
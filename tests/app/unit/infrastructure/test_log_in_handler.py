@@ -0,0 +1,96 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+
+from app.application.common.exceptions.concurrency import ConcurrentUpdateError
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.services.user import UserService
+from app.infrastructure.auth.exceptions import (
+    AuthenticationError,
+    LoginThrottledError,
+)
+from app.infrastructure.auth.handlers.log_in import LogInHandler, LogInRequest
+from app.infrastructure.auth.session.service import AuthSessionService
+from app.infrastructure.auth.throttle.service import LoginThrottle
+from tests.app.unit.factories.value_objects import create_password_hash
+
+
+def create_handler(
+    user_command_gateway: AsyncMock,
+    user_service: AsyncMock,
+    transaction_manager: AsyncMock,
+    login_throttle: AsyncMock | None = None,
+) -> LogInHandler:
+    current_user_service = AsyncMock(spec=CurrentUserService)
+    current_user_service.get_current_user.side_effect = AuthenticationError("")
+    return LogInHandler(
+        current_user_service=current_user_service,
+        user_command_gateway=user_command_gateway,
+        user_service=user_service,
+        auth_session_service=AsyncMock(spec=AuthSessionService),
+        transaction_manager=transaction_manager,
+        login_throttle=login_throttle or AsyncMock(spec=LoginThrottle),
+    )
+
+
+def create_user_service(needs_rehash: bool) -> AsyncMock:
+    user_service = AsyncMock(spec=UserService)
+    user_service.is_password_valid.return_value = True
+    user_service.needs_password_rehash = MagicMock(return_value=needs_rehash)
+    return user_service
+
+
+REQUEST = LogInRequest(username="alice", password="secure-password")
+
+
+@pytest.mark.asyncio
+async def test_rehashes_outdated_hash_after_login() -> None:
+    user = MagicMock(password_hash=create_password_hash(b"old"))
+    gateway = create_autospec(UserCommandGateway, instance=True)
+    gateway.read_by_username.return_value = user
+    user_service = create_user_service(needs_rehash=True)
+    transaction_manager = create_autospec(TransactionManager, instance=True)
+    sut = create_handler(gateway, user_service, transaction_manager)
+
+    await sut.execute(REQUEST)
+
+    user_service.change_password.assert_awaited_once()
+    transaction_manager.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_does_not_overwrite_password_changed_concurrently() -> None:
+    user = MagicMock(password_hash=create_password_hash(b"old"))
+    gateway = create_autospec(UserCommandGateway, instance=True)
+    gateway.read_by_username.return_value = user
+    user_service = create_user_service(needs_rehash=True)
+    transaction_manager = create_autospec(TransactionManager, instance=True)
+    savepoint = transaction_manager.savepoint.return_value
+    savepoint.__aexit__.side_effect = ConcurrentUpdateError("")
+    sut = create_handler(gateway, user_service, transaction_manager)
+
+    await sut.execute(REQUEST)
+
+    transaction_manager.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_throttled_attempt_skips_password_check() -> None:
+    gateway = create_autospec(UserCommandGateway, instance=True)
+    user_service = create_user_service(needs_rehash=False)
+    transaction_manager = create_autospec(TransactionManager, instance=True)
+    login_throttle = AsyncMock(spec=LoginThrottle)
+    login_throttle.check.side_effect = LoginThrottledError(
+        "",
+        retry_after=timedelta(seconds=30),
+    )
+    sut = create_handler(gateway, user_service, transaction_manager, login_throttle)
+
+    with pytest.raises(LoginThrottledError):
+        await sut.execute(REQUEST)
+
+    gateway.read_by_username.assert_not_awaited()
+    user_service.is_password_valid.assert_not_awaited()
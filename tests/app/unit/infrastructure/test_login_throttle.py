@@ -0,0 +1,123 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.value_objects.username.username import Username
+from app.infrastructure.auth.exceptions import LoginThrottledError
+from app.infrastructure.auth.throttle.attempt_store_in_memory import (
+    InMemoryLoginAttemptStore,
+)
+from app.infrastructure.auth.throttle.config import LoginThrottleConfig
+from app.infrastructure.auth.throttle.ports.client_address import (
+    ClientAddressProvider,
+)
+from app.infrastructure.auth.throttle.service import LoginThrottle
+from app.infrastructure.metrics import MetricsRegistry
+
+WINDOW_SEC = 60
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_config(
+    max_attempts_per_username: int = 3,
+    max_attempts_per_address: int = 5,
+    max_tracked_keys: int = 100,
+) -> LoginThrottleConfig:
+    return LoginThrottleConfig(
+        enabled=True,
+        store="in_memory",
+        window=timedelta(seconds=WINDOW_SEC),
+        max_attempts_per_username=max_attempts_per_username,
+        max_attempts_per_address=max_attempts_per_address,
+        max_tracked_keys=max_tracked_keys,
+    )
+
+
+def create_throttle(
+    config: LoginThrottleConfig,
+    store: InMemoryLoginAttemptStore,
+    metrics: MetricsRegistry,
+    client_address: str | None = "203.0.113.7",
+) -> LoginThrottle:
+    client_address_provider = MagicMock(spec=ClientAddressProvider)
+    client_address_provider.get_client_address.return_value = client_address
+    return LoginThrottle(config, store, client_address_provider, metrics)
+
+
+@pytest.mark.asyncio
+async def test_store_rejects_over_limit_until_oldest_attempt_expires() -> None:
+    clock = FakeClock()
+    sut = InMemoryLoginAttemptStore(create_config(), clock)
+
+    assert await sut.try_acquire("key", limit=2) is None
+    clock.now += 10
+    assert await sut.try_acquire("key", limit=2) is None
+    assert await sut.try_acquire("key", limit=2) == timedelta(
+        seconds=WINDOW_SEC - 10,
+    )
+
+    clock.now += WINDOW_SEC - 10
+    assert await sut.try_acquire("key", limit=2) is None
+
+
+@pytest.mark.asyncio
+async def test_store_sweeps_idle_keys_and_caps_tracked_keys() -> None:
+    clock = FakeClock()
+    sut = InMemoryLoginAttemptStore(create_config(max_tracked_keys=2), clock)
+
+    for key in ("a", "b", "c"):
+        await sut.try_acquire(key, limit=1)
+    assert len(sut) == 2
+
+    clock.now += WINDOW_SEC
+    await sut.try_acquire("d", limit=1)
+    assert len(sut) == 1
+
+
+@pytest.mark.asyncio
+async def test_throttle_rejects_username_and_resets_on_success() -> None:
+    config = create_config(max_attempts_per_username=2)
+    metrics = MetricsRegistry()
+    store = InMemoryLoginAttemptStore(config, FakeClock())
+    sut = create_throttle(config, store, metrics)
+    username = Username("alice")
+
+    await sut.check(username)
+    await sut.check(username)
+    with pytest.raises(LoginThrottledError) as exc_info:
+        await sut.check(username)
+
+    assert exc_info.value.retry_after == timedelta(seconds=WINDOW_SEC)
+    counter = metrics.counter(
+        "login_throttle_decisions_total",
+        "",
+        label_names=("scope", "decision"),
+    )
+    assert counter.value(scope="username", decision="rejected") == 1
+
+    await sut.reset(username)
+    await sut.check(username)
+
+
+@pytest.mark.asyncio
+async def test_rejected_address_does_not_consume_username_budget() -> None:
+    config = create_config(max_attempts_per_username=3, max_attempts_per_address=1)
+    store = InMemoryLoginAttemptStore(config, FakeClock())
+    attacker = create_throttle(config, store, MetricsRegistry())
+    owner = create_throttle(config, store, MetricsRegistry(), client_address=None)
+
+    await attacker.check(Username("mallory"))
+    for _ in range(3):
+        with pytest.raises(LoginThrottledError):
+            await attacker.check(Username("alice"))
+
+    for _ in range(3):
+        await owner.check(Username("alice"))
@@ -0,0 +1,41 @@
+import pytest
+
+from app.infrastructure.metrics import MetricsRegistry
+
+
+def test_registering_same_name_returns_existing_metric() -> None:
+    sut = MetricsRegistry()
+
+    first = sut.counter("requests_total", "Requests.")
+    second = sut.counter("requests_total", "Requests.")
+
+    assert first is second
+
+
+def test_registering_same_name_with_other_kind_is_rejected() -> None:
+    sut = MetricsRegistry()
+    sut.counter("requests_total", "Requests.")
+
+    with pytest.raises(ValueError):
+        sut.gauge("requests_total", "Requests.")
+
+
+def test_counter_rejects_unknown_labels() -> None:
+    counter = MetricsRegistry().counter("hits_total", "Hits.", ("outcome",))
+
+    with pytest.raises(ValueError):
+        counter.inc(result="hit")
+
+
+def test_renders_prometheus_text_format() -> None:
+    sut = MetricsRegistry()
+    sut.counter("hits_total", "Hits.", ("outcome",)).inc(outcome="hit")
+    sut.histogram("batch_seconds", "Batch time.", buckets=(0.1, 1.0)).observe(0.5)
+
+    rendered = sut.render()
+
+    assert '# TYPE hits_total counter\nhits_total{outcome="hit"} 1.0\n' in rendered
+    assert 'batch_seconds_bucket{le="0.1"} 0\n' in rendered
+    assert 'batch_seconds_bucket{le="1.0"} 1\n' in rendered
+    assert 'batch_seconds_bucket{le="+Inf"} 1\n' in rendered
+    assert "batch_seconds_count 1\n" in rendered
@@ -0,0 +1,71 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.overflow_controller import (
+    SqlaOverflowController,
+)
+from app.infrastructure.persistence_sqla.pool_telemetry import TimedQueuePool
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_pool(size: int, checked_out: int) -> MagicMock:
+    pool = MagicMock(spec=TimedQueuePool)
+    pool.wait_listeners = []
+    pool.size.return_value = size
+    pool.checkedout.return_value = checked_out
+    return pool
+
+
+def install_controller(pool: MagicMock, clock: FakeClock) -> SqlaOverflowController:
+    sut = SqlaOverflowController(
+        min_overflow=0,
+        max_overflow=8,
+        target_wait=timedelta(milliseconds=10),
+        adjust_interval=timedelta(seconds=10),
+        metrics=MetricsRegistry(),
+        pool_name="primary",
+        clock=clock,
+    )
+    engine = MagicMock(spec=AsyncEngine)
+    engine.sync_engine.pool = pool
+    sut.install(engine)
+    return sut
+
+
+def test_lowers_unused_overflow_one_connection_per_interval() -> None:
+    clock = FakeClock()
+    pool = create_pool(size=5, checked_out=3)
+    sut = install_controller(pool, clock)
+    assert pool.max_overflow == 8
+
+    sut.record_wait(pool, 0.001, False)
+    assert pool.max_overflow == 8
+
+    clock.now += 10
+    sut.record_wait(pool, 0.001, False)
+    assert pool.max_overflow == 7
+
+
+def test_raises_limit_when_checkouts_wait() -> None:
+    clock = FakeClock()
+    pool = create_pool(size=5, checked_out=5)
+    sut = install_controller(pool, clock)
+    pool.max_overflow = 0
+
+    clock.now += 10
+    sut.record_wait(pool, 0.05, False)
+    assert pool.max_overflow == 2
+
+    clock.now += 10
+    sut.record_wait(pool, 30.0, True)
+    assert pool.max_overflow == 4
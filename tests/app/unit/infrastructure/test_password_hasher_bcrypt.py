@@ -1,63 +1,149 @@
+import asyncio
+import threading
+from collections.abc import Iterator
+
 import pytest
 
 from app.infrastructure.adapters.password_hasher_bcrypt import (
+    BULK_HASH_CHUNK_SIZE,
     BcryptPasswordHasher,
     PasswordPepper,
 )
+from app.infrastructure.adapters.password_hasher_bcrypt_cost import BcryptRounds
+from app.infrastructure.adapters.password_hasher_executor import (
+    PasswordHasherExecutor,
+    PasswordHasherExecutorConfig,
+)
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+from app.infrastructure.metrics import MetricsRegistry
 from tests.app.unit.factories.value_objects import create_raw_password
 
 
-def create_bcrypt_password_hasher(pepper: str = "Habanero!") -> BcryptPasswordHasher:
-    return BcryptPasswordHasher(PasswordPepper(pepper))
+@pytest.fixture
+def executor() -> Iterator[PasswordHasherExecutor]:
+    config = PasswordHasherExecutorConfig(kind="thread", max_workers=2, max_pending=8)
+    executor = PasswordHasherExecutor(config, MetricsRegistry())
+    yield executor
+    executor.shutdown()
+
+
+def create_bcrypt_password_hasher(
+    executor: PasswordHasherExecutor,
+    pepper: str = "Habanero!",
+    rounds: int = 12,
+) -> BcryptPasswordHasher:
+    return BcryptPasswordHasher(PasswordPepper(pepper), executor, BcryptRounds(rounds))
 
 
 @pytest.mark.slow
-def test_verifies_correct_password() -> None:
-    sut = create_bcrypt_password_hasher()
+@pytest.mark.asyncio
+async def test_verifies_correct_password(executor: PasswordHasherExecutor) -> None:
+    sut = create_bcrypt_password_hasher(executor)
     pwd = create_raw_password()
 
-    hashed = sut.hash(pwd)
+    hashed = await sut.hash(pwd)
 
-    assert sut.verify(raw_password=pwd, hashed_password=hashed)
+    assert await sut.verify(raw_password=pwd, hashed_password=hashed)
 
 
 @pytest.mark.slow
-def test_does_not_verify_incorrect_password() -> None:
-    sut = create_bcrypt_password_hasher()
+@pytest.mark.asyncio
+async def test_does_not_verify_incorrect_password(
+    executor: PasswordHasherExecutor,
+) -> None:
+    sut = create_bcrypt_password_hasher(executor)
     correct_pwd = create_raw_password("secure")
     incorrect_pwd = create_raw_password("bruteforce")
 
-    hashed = sut.hash(correct_pwd)
+    hashed = await sut.hash(correct_pwd)
 
-    assert not sut.verify(raw_password=incorrect_pwd, hashed_password=hashed)
+    assert not await sut.verify(raw_password=incorrect_pwd, hashed_password=hashed)
 
 
 @pytest.mark.slow
-def test_supports_passwords_longer_than_bcrypt_limit() -> None:
+@pytest.mark.asyncio
+async def test_supports_passwords_longer_than_bcrypt_limit(
+    executor: PasswordHasherExecutor,
+) -> None:
     bcrypt_limit = 72
-    sut = create_bcrypt_password_hasher()
+    sut = create_bcrypt_password_hasher(executor)
     pwd = create_raw_password("x" * (bcrypt_limit + 1))
 
-    hashed = sut.hash(pwd)
+    hashed = await sut.hash(pwd)
 
-    assert sut.verify(raw_password=pwd, hashed_password=hashed)
+    assert await sut.verify(raw_password=pwd, hashed_password=hashed)
 
 
 @pytest.mark.slow
-def test_hashes_are_unique_for_same_password() -> None:
-    sut = create_bcrypt_password_hasher()
+@pytest.mark.asyncio
+async def test_hashes_are_unique_for_same_password(
+    executor: PasswordHasherExecutor,
+) -> None:
+    sut = create_bcrypt_password_hasher(executor)
     pwd = create_raw_password()
 
-    assert sut.hash(pwd) != sut.hash(pwd)
+    assert await sut.hash(pwd) != await sut.hash(pwd)
 
 
 @pytest.mark.slow
-def test_different_peppers_fail_verification() -> None:
+@pytest.mark.asyncio
+async def test_different_peppers_fail_verification(
+    executor: PasswordHasherExecutor,
+) -> None:
+    pwd = create_raw_password()
+    hasher1 = create_bcrypt_password_hasher(executor, "PepperA")
+    hasher2 = create_bcrypt_password_hasher(executor, "PepperB")
+
+    hashed = await hasher1.hash(pwd)
+
+    assert await hasher1.verify(raw_password=pwd, hashed_password=hashed)
+    assert not await hasher2.verify(raw_password=pwd, hashed_password=hashed)
+
+
+@pytest.mark.asyncio
+async def test_needs_rehash_only_for_weaker_work_factor(
+    executor: PasswordHasherExecutor,
+) -> None:
     pwd = create_raw_password()
-    hasher1 = create_bcrypt_password_hasher("PepperA")
-    hasher2 = create_bcrypt_password_hasher("PepperB")
+    weak_hasher = create_bcrypt_password_hasher(executor, rounds=4)
+    strong_hasher = create_bcrypt_password_hasher(executor, rounds=5)
 
-    hashed = hasher1.hash(pwd)
+    weak_hash = await weak_hasher.hash(pwd)
+    strong_hash = await strong_hasher.hash(pwd)
 
-    assert hasher1.verify(raw_password=pwd, hashed_password=hashed)
-    assert not hasher2.verify(raw_password=pwd, hashed_password=hashed)
+    assert strong_hasher.needs_rehash(weak_hash)
+    assert not strong_hasher.needs_rehash(strong_hash)
+    assert not weak_hasher.needs_rehash(strong_hash)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_hash_many_keeps_order(executor: PasswordHasherExecutor) -> None:
+    sut = create_bcrypt_password_hasher(executor, rounds=4)
+    passwords = [create_raw_password(f"password{i}") for i in range(10)]
+
+    hashed = await sut.hash_many(passwords)
+
+    for pwd, hashed_password in zip(passwords, hashed, strict=True):
+        assert await sut.verify(raw_password=pwd, hashed_password=hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_hash_many_raises_busy_error_of_first_failed_chunk() -> None:
+    config = PasswordHasherExecutorConfig(kind="thread", max_workers=1, max_pending=0)
+    executor = PasswordHasherExecutor(config, MetricsRegistry())
+    release = threading.Event()
+    sut = create_bcrypt_password_hasher(executor, rounds=4)
+    passwords = [create_raw_password() for _ in range(BULK_HASH_CHUNK_SIZE * 3)]
+    try:
+        running_task = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHasherBusyError):
+            await sut.hash_many(passwords)
+
+        release.set()
+        assert await running_task
+    finally:
+        release.set()
+        executor.shutdown()
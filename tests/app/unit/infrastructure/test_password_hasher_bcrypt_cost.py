@@ -0,0 +1,32 @@
+import bcrypt
+import pytest
+
+from app.infrastructure.adapters.password_hasher_bcrypt_cost import (
+    calibrate_rounds,
+    read_rounds,
+)
+
+
+def test_reads_rounds_from_hash() -> None:
+    hashed = bcrypt.hashpw(b"password", bcrypt.gensalt(5))
+
+    assert read_rounds(hashed) == 5
+
+
+@pytest.mark.parametrize(
+    "hashed",
+    [
+        pytest.param(b"plain", id="not_modular_crypt"),
+        pytest.param(b"$2b$xx$salt", id="non_numeric_rounds"),
+    ],
+)
+def test_unreadable_hash_has_no_rounds(hashed: bytes) -> None:
+    assert read_rounds(hashed) is None
+
+
+def test_calibration_never_goes_below_minimum() -> None:
+    assert calibrate_rounds(target_sec=0.0, min_rounds=5, max_rounds=8) == 5
+
+
+def test_calibration_never_goes_above_maximum() -> None:
+    assert calibrate_rounds(target_sec=3600.0, min_rounds=4, max_rounds=6) == 6
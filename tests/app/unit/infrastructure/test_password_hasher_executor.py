@@ -0,0 +1,65 @@
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from app.infrastructure.adapters.password_hasher_executor import (
+    PasswordHasherExecutor,
+    PasswordHasherExecutorConfig,
+)
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+from app.infrastructure.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def executor() -> Iterator[PasswordHasherExecutor]:
+    config = PasswordHasherExecutorConfig(kind="thread", max_workers=1, max_pending=1)
+    executor = PasswordHasherExecutor(config, MetricsRegistry())
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_runs_job_off_event_loop(executor: PasswordHasherExecutor) -> None:
+    caller_thread = threading.get_ident()
+
+    job_thread = await executor.run(threading.get_ident)
+
+    assert job_thread != caller_thread
+
+
+@pytest.mark.asyncio
+async def test_rejects_jobs_beyond_capacity(executor: PasswordHasherExecutor) -> None:
+    release = threading.Event()
+    running_task = asyncio.create_task(executor.run(release.wait))
+    queued_task = asyncio.create_task(executor.run(release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHasherBusyError):
+        await executor.run(release.wait)
+
+    release.set()
+    assert await running_task
+    assert await queued_task
+
+
+@pytest.mark.asyncio
+async def test_bulk_jobs_of_all_callers_leave_a_worker_free() -> None:
+    config = PasswordHasherExecutorConfig(kind="thread", max_workers=2, max_pending=0)
+    executor = PasswordHasherExecutor(config, MetricsRegistry())
+    release = threading.Event()
+    try:
+        bulk_tasks = [
+            asyncio.create_task(executor.run_bulk(release.wait)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        job_thread = await executor.run(threading.get_ident)
+
+        release.set()
+        assert job_thread != threading.get_ident()
+        assert await asyncio.gather(*bulk_tasks) == [True, True]
+    finally:
+        release.set()
+        executor.shutdown()
@@ -0,0 +1,70 @@
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.util import greenlet_spawn
+
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.pool_telemetry import (
+    SqlaPoolTelemetry,
+    TimedQueuePool,
+)
+
+
+def test_tracks_connections_in_use_and_churn(tmp_path: Path) -> None:
+    metrics = MetricsRegistry()
+    in_use = metrics.gauge("sqla_pool_connections_in_use", "", ("pool",))
+    overflow = metrics.gauge("sqla_pool_overflow_connections", "", ("pool",))
+    opened = metrics.counter("sqla_pool_connections_opened_total", "", ("pool",))
+    invalidations = metrics.counter(
+        "sqla_pool_invalidations_total",
+        "",
+        ("pool", "kind"),
+    )
+    engine = MagicMock(spec=AsyncEngine)
+    engine.sync_engine = create_engine(
+        f"sqlite:///{tmp_path / 'db.sqlite'}",
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=1,
+    )
+    SqlaPoolTelemetry(metrics, "primary").install(engine)
+
+    with engine.sync_engine.connect() as first, engine.sync_engine.connect():
+        first.execute(text("SELECT 1"))
+        assert in_use.value(pool="primary") == 2
+        assert overflow.value(pool="primary") == 1
+        first.invalidate()
+
+    assert in_use.value(pool="primary") == 0
+    assert opened.value(pool="primary") == 2
+    assert invalidations.value(pool="primary", kind="hard") == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_pool_reports_waits_and_timeouts(tmp_path: Path) -> None:
+    waits: list[bool] = []
+    pool = TimedQueuePool(
+        lambda: sqlite3.connect(tmp_path / "db.sqlite"),
+        pool_size=1,
+        max_overflow=0,
+        timeout=0.01,
+    )
+    pool.wait_listeners.append(
+        lambda _pool, _wait_sec, timed_out: waits.append(timed_out),
+    )
+
+    def check_out_twice() -> None:
+        connection = pool.connect()
+        with pytest.raises(PoolTimeoutError):
+            pool.connect()
+        connection.close()
+
+    await greenlet_spawn(check_out_twice)
+
+    assert waits == [False, True]
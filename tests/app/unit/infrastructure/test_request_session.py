@@ -0,0 +1,56 @@
+from datetime import timedelta
+from typing import cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.persistence_sqla.config import SqlaEngineConfig
+from app.infrastructure.persistence_sqla.provider import get_auth_async_session
+
+
+def create_engine_config(*, share_request_session: bool) -> SqlaEngineConfig:
+    return SqlaEngineConfig(
+        echo=False,
+        echo_pool=False,
+        pool_size=5,
+        max_overflow=0,
+        share_request_session=share_request_session,
+        prepare_threshold=2,
+        pool_recycle=timedelta(minutes=30),
+        ping_after_error=timedelta(seconds=30),
+        adaptive_overflow=False,
+        min_overflow=0,
+        target_checkout_wait=timedelta(milliseconds=10),
+        overflow_adjust_interval=timedelta(seconds=10),
+    )
+
+
+@pytest.mark.asyncio
+async def test_auth_shares_main_session() -> None:
+    session = AsyncSession()
+    sessions = get_auth_async_session(
+        create_engine_config(share_request_session=True),
+        async_sessionmaker(),
+        cast(MainAsyncSession, session),
+    )
+
+    auth_session = await anext(sessions)
+
+    assert auth_session is session
+    assert await anext(sessions, None) is None
+
+
+@pytest.mark.asyncio
+async def test_auth_opens_own_session() -> None:
+    session = AsyncSession()
+    sessions = get_auth_async_session(
+        create_engine_config(share_request_session=False),
+        async_sessionmaker(),
+        cast(MainAsyncSession, session),
+    )
+
+    auth_session = await anext(sessions)
+
+    assert auth_session is not session
+    assert await anext(sessions, None) is None
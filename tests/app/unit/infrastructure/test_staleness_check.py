@@ -0,0 +1,54 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.staleness_check import SqlaStalenessCheck
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pings_only_within_window_after_error() -> None:
+    clock = FakeClock()
+    sut = SqlaStalenessCheck(timedelta(seconds=30), MetricsRegistry(), clock)
+
+    assert not sut.should_ping()
+
+    sut.record_error()
+    clock.now += 29
+    assert sut.should_ping()
+
+    clock.now += 1
+    assert not sut.should_ping()
+
+
+def test_checkout_pinged_after_connection_error() -> None:
+    metrics = MetricsRegistry()
+    pings = metrics.counter(
+        "sqla_pool_checkout_pings_total",
+        "",
+        label_names=("result",),
+    )
+    engine = MagicMock(spec=AsyncEngine)
+    engine.sync_engine = create_engine("sqlite://")
+    SqlaStalenessCheck(timedelta(seconds=30), metrics).install(engine)
+
+    with engine.sync_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing"))
+    assert pings.value(result="alive") == 0
+
+    with engine.sync_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    assert pings.value(result="alive") == 1
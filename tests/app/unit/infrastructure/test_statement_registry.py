@@ -0,0 +1,61 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.common.query_params.user import UserListFilters
+from app.infrastructure.adapters.types import ReaderAsyncSession
+from app.infrastructure.adapters.user_listing_cache import (
+    UserCountCache,
+    UserCountConfig,
+    UserPageCache,
+)
+from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+from app.infrastructure.persistence_sqla.statement_registry import (
+    SqlaStatementRegistry,
+)
+
+
+def test_builds_statement_once_per_shape() -> None:
+    metrics = MetricsRegistry()
+    sut = SqlaStatementRegistry(metrics)
+    build = MagicMock(side_effect=lambda: select(users_table.c.id))
+
+    first = sut.get(("users_ids",), build)
+    second = sut.get(("users_ids",), build)
+
+    assert second is first
+    build.assert_called_once()
+    lookups = metrics.counter("sqla_statement_registry_lookups_total", "")
+    assert lookups.value(result="miss") == 1
+    assert lookups.value(result="hit") == 1
+
+
+@pytest.mark.asyncio
+async def test_reader_binds_filter_values_to_shared_statement() -> None:
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=0))
+    statements = SqlaStatementRegistry(MetricsRegistry())
+    config = UserCountConfig(exact_threshold=1_000, cache_ttl=timedelta(seconds=30))
+    count_cache = create_autospec(UserCountCache, instance=True)
+    count_cache.get.return_value = None
+    sut = SqlaUserReader(
+        ReaderAsyncSession(session),
+        count_cache,
+        create_autospec(UserPageCache, instance=True),
+        config,
+        statements,
+    )
+
+    await sut.count_all(UserListFilters(username_prefix="a_b"))
+    await sut.count_all(UserListFilters(username_prefix="100%"))
+
+    first_call, second_call = session.execute.await_args_list
+    assert first_call.args[0] is second_call.args[0]
+    assert first_call.args[1]["username_prefix"] == "a/_b"
+    assert second_call.args[1]["username_prefix"] == "100/%"
+    assert len(statements) == 1
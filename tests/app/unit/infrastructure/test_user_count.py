@@ -0,0 +1,157 @@
+from collections.abc import Callable
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.common.query_models.user import UserQueryCount
+from app.application.common.query_params.user import UserListFilters
+from app.infrastructure.adapters.types import ReaderAsyncSession
+from app.infrastructure.adapters.user_listing_cache import (
+    MAX_CACHED_COUNTS,
+    UserCountCache,
+    UserCountConfig,
+    UserListingGeneration,
+    UserPageCache,
+)
+from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.statement_registry import (
+    SqlaStatementRegistry,
+)
+
+EXACT_THRESHOLD = 1_000
+CONFIG = UserCountConfig(
+    exact_threshold=EXACT_THRESHOLD,
+    cache_ttl=timedelta(seconds=30),
+)
+
+
+def create_session(*scalars: int) -> AsyncMock:
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.side_effect = [
+        MagicMock(scalar_one=MagicMock(return_value=value)) for value in scalars
+    ]
+    return session
+
+
+def create_cache(
+    generation: UserListingGeneration | None = None,
+    clock: Callable[[], float] = lambda: 0.0,
+) -> UserCountCache:
+    return UserCountCache(
+        CONFIG.cache_ttl,
+        MAX_CACHED_COUNTS,
+        generation or UserListingGeneration(),
+        MetricsRegistry(),
+        clock,
+    )
+
+
+def create_reader(session: AsyncMock, cache: UserCountCache) -> SqlaUserReader:
+    page_cache = create_autospec(UserPageCache, instance=True)
+    return SqlaUserReader(
+        ReaderAsyncSession(session),
+        cache,
+        page_cache,
+        CONFIG,
+        SqlaStatementRegistry(MetricsRegistry()),
+    )
+
+
+@pytest.mark.parametrize(
+    ("estimate", "exact_total", "expected"),
+    [
+        pytest.param(
+            -1,
+            3,
+            UserQueryCount(total=3, is_exact=True),
+            id="never_analyzed",
+        ),
+        pytest.param(
+            EXACT_THRESHOLD - 1,
+            998,
+            UserQueryCount(total=998, is_exact=True),
+            id="below_threshold",
+        ),
+        pytest.param(
+            EXACT_THRESHOLD,
+            None,
+            UserQueryCount(total=EXACT_THRESHOLD, is_exact=False),
+            id="estimated",
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_counts_exactly_only_below_threshold(
+    estimate: int,
+    exact_total: int | None,
+    expected: UserQueryCount,
+) -> None:
+    scalars = (estimate,) if exact_total is None else (estimate, exact_total)
+    sut = create_reader(create_session(*scalars), create_cache())
+
+    assert await sut.count_all(UserListFilters()) == expected
+
+
+@pytest.mark.parametrize(
+    ("matching", "expected"),
+    [
+        pytest.param(
+            EXACT_THRESHOLD - 1,
+            UserQueryCount(total=EXACT_THRESHOLD - 1, is_exact=True),
+            id="below_threshold",
+        ),
+        pytest.param(
+            EXACT_THRESHOLD,
+            UserQueryCount(total=EXACT_THRESHOLD, is_exact=False),
+            id="capped",
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_counts_filtered_users_up_to_threshold(
+    matching: int,
+    expected: UserQueryCount,
+) -> None:
+    session = create_session(matching)
+    sut = create_reader(session, create_cache())
+
+    assert await sut.count_all(UserListFilters(is_active=True)) == expected
+    session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_serves_cached_count_until_invalidated() -> None:
+    generation = UserListingGeneration()
+    session = create_session(-1, 3, -1, 4)
+    sut = create_reader(session, create_cache(generation))
+
+    await sut.count_all(UserListFilters())
+    assert (await sut.count_all(UserListFilters()))["total"] == 3
+
+    generation.invalidate()
+    assert (await sut.count_all(UserListFilters()))["total"] == 4
+    assert session.execute.await_count == 4
+
+
+def test_drops_count_computed_before_invalidation() -> None:
+    listing_generation = UserListingGeneration()
+    sut = create_cache(listing_generation)
+    generation = sut.generation
+
+    listing_generation.invalidate()
+    sut.put(UserListFilters(), UserQueryCount(total=3, is_exact=True), generation)
+
+    assert sut.get(UserListFilters()) is None
+
+
+def test_expires_count_after_ttl() -> None:
+    now = 0.0
+    sut = create_cache(clock=lambda: now)
+    sut.put(UserListFilters(), UserQueryCount(total=3, is_exact=True), sut.generation)
+
+    now = 30.0
+
+    assert sut.get(UserListFilters()) is None
@@ -0,0 +1,102 @@
+from collections.abc import AsyncIterator, Sequence
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+from uuid import UUID
+
+import orjson
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.common.query_params.user import (
+    UserExportFormat,
+    UserListFilters,
+)
+from app.domain.enums.user_type import UserRole
+from app.infrastructure.adapters.types import ReaderAsyncSession
+from app.infrastructure.adapters.user_listing_cache import (
+    UserCountCache,
+    UserCountConfig,
+    UserPageCache,
+)
+from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
+from app.infrastructure.exceptions.gateway import ReaderError
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.statement_registry import (
+    SqlaStatementRegistry,
+)
+
+CONFIG = UserCountConfig(exact_threshold=1_000, cache_ttl=timedelta(seconds=30))
+ALICE = (UUID(int=1), "alice", UserRole.ADMIN, True)
+BOBBY = (UUID(int=2), "bobby", UserRole.USER, False)
+
+
+def create_reader_for(session: AsyncMock) -> SqlaUserReader:
+    return SqlaUserReader(
+        ReaderAsyncSession(session),
+        create_autospec(UserCountCache, instance=True),
+        create_autospec(UserPageCache, instance=True),
+        CONFIG,
+        SqlaStatementRegistry(MetricsRegistry()),
+    )
+
+
+def create_reader(*partitions: Sequence[tuple[object, ...]]) -> SqlaUserReader:
+    result = MagicMock()
+    result.partitions.return_value.__aiter__.return_value = partitions
+    session = AsyncMock(spec=AsyncSession)
+    session.stream.return_value = result
+    return create_reader_for(session)
+
+
+async def collect(chunks: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_chunk_per_partition() -> None:
+    sut = create_reader([ALICE], [BOBBY])
+
+    chunks = await collect(
+        sut.export_all(UserListFilters(), UserExportFormat.NDJSON),
+    )
+
+    assert [orjson.loads(chunk) for chunk in chunks] == [
+        {
+            "id": str(UUID(int=1)),
+            "username": "alice",
+            "role": "admin",
+            "is_active": True,
+        },
+        {
+            "id": str(UUID(int=2)),
+            "username": "bobby",
+            "role": "user",
+            "is_active": False,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_csv_starts_with_header() -> None:
+    sut = create_reader([ALICE, BOBBY])
+
+    body = b"".join(
+        await collect(sut.export_all(UserListFilters(), UserExportFormat.CSV)),
+    )
+
+    assert body.decode().splitlines() == [
+        "id,username,role,is_active",
+        f"{UUID(int=1)},alice,admin,True",
+        f"{UUID(int=2)},bobby,user,False",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_query_failure_raises_reader_error() -> None:
+    session = AsyncMock(spec=AsyncSession)
+    session.stream.side_effect = OperationalError("SELECT", {}, Exception())
+    sut = create_reader_for(session)
+
+    with pytest.raises(ReaderError):
+        await collect(sut.export_all(UserListFilters(), UserExportFormat.NDJSON))
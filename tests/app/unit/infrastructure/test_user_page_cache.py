@@ -0,0 +1,82 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.common.query_params.pagination import Pagination
+from app.application.common.query_params.sorting import SortingOrder
+from app.application.common.query_params.user import (
+    UserListFilters,
+    UserListParams,
+    UserListSorting,
+)
+from app.infrastructure.adapters.types import ReaderAsyncSession
+from app.infrastructure.adapters.user_listing_cache import (
+    UserCountCache,
+    UserCountConfig,
+    UserListingGeneration,
+    UserPageCache,
+)
+from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence_sqla.statement_registry import (
+    SqlaStatementRegistry,
+)
+
+CONFIG = UserCountConfig(exact_threshold=1_000, cache_ttl=timedelta(seconds=30))
+
+
+def create_params(username_prefix: str) -> UserListParams:
+    return UserListParams(
+        pagination=Pagination(limit=20, offset=0),
+        sorting=UserListSorting(
+            sorting_field="username",
+            sorting_order=SortingOrder.ASC,
+        ),
+        filters=UserListFilters(username_prefix=username_prefix),
+    )
+
+
+def create_reader(
+    generation: UserListingGeneration,
+    metrics: MetricsRegistry,
+) -> tuple[SqlaUserReader, AsyncMock]:
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+    page_cache = UserPageCache(timedelta(seconds=5), 16, generation, metrics)
+    reader = SqlaUserReader(
+        ReaderAsyncSession(session),
+        create_autospec(UserCountCache, instance=True),
+        page_cache,
+        CONFIG,
+        SqlaStatementRegistry(metrics),
+    )
+    return reader, session
+
+
+@pytest.mark.asyncio
+async def test_serves_page_regardless_of_pattern_case() -> None:
+    metrics = MetricsRegistry()
+    sut, session = create_reader(UserListingGeneration(), metrics)
+
+    first_page = await sut.read_all(create_params("Ali"))
+    second_page = await sut.read_all(create_params("ali"))
+
+    assert second_page is first_page
+    session.execute.assert_awaited_once()
+    requests = metrics.counter("user_listing_cache_requests_total", "")
+    assert requests.value(cache="page", result="miss") == 1
+    assert requests.value(cache="page", result="hit") == 1
+
+
+@pytest.mark.asyncio
+async def test_reads_page_again_once_users_change() -> None:
+    generation = UserListingGeneration()
+    sut, session = create_reader(generation, MetricsRegistry())
+
+    await sut.read_all(create_params("ali"))
+    generation.invalidate()
+    await sut.read_all(create_params("ali"))
+
+    assert session.execute.await_count == 2
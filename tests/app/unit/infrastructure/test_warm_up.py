@@ -0,0 +1,54 @@
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio.exc import AsyncContextNotStarted
+
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_query_gateway import UserQueryGateway
+from app.infrastructure.auth.session.ports.user_reader import AuthSessionUserReader
+from app.infrastructure.persistence_sqla.warm_up import (
+    WARM_UP_USER_LIST_PARAMS,
+    SqlaStatementWarmUp,
+    open_pool_connections,
+)
+
+
+@pytest.mark.asyncio
+async def test_runs_hot_reads_once() -> None:
+    auth_session_user_reader = create_autospec(AuthSessionUserReader, instance=True)
+    user_command_gateway = create_autospec(UserCommandGateway, instance=True)
+    user_query_gateway = create_autospec(UserQueryGateway, instance=True)
+    sut = SqlaStatementWarmUp(
+        auth_session_user_reader,
+        user_command_gateway,
+        user_query_gateway,
+    )
+
+    await sut.run()
+
+    auth_session_user_reader.read_by_id_with_user.assert_awaited_once()
+    user_command_gateway.read_by_id.assert_awaited_once()
+    user_command_gateway.read_by_username.assert_awaited_once()
+    user_query_gateway.read_all.assert_awaited_once_with(WARM_UP_USER_LIST_PARAMS)
+    user_query_gateway.count_all.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_returns_connections_even_if_one_fails_to_open() -> None:
+    connect_error = OperationalError("", {}, Exception("connection refused"))
+    failed = MagicMock(
+        start=AsyncMock(side_effect=connect_error),
+        close=AsyncMock(side_effect=AsyncContextNotStarted()),
+    )
+    opened = MagicMock(start=AsyncMock(), close=AsyncMock())
+    engine = MagicMock(spec=AsyncEngine)
+    engine.connect.side_effect = [failed, opened]
+
+    with pytest.raises(OperationalError) as exc_info:
+        await open_pool_connections(engine, 2)
+
+    assert exc_info.value is connect_error
+    failed.close.assert_not_awaited()
+    opened.close.assert_awaited_once()
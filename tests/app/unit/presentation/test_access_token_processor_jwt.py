@@ -0,0 +1,54 @@
+from datetime import UTC, datetime, timedelta
+
+import jwt
+
+from app.infrastructure.auth.session.model import AuthSession
+from app.presentation.http.auth.access_token_processor_jwt import (
+    JwtAccessTokenProcessor,
+    JwtSecret,
+)
+from tests.app.unit.factories.value_objects import create_user_id
+
+
+def create_jwt_processor(secret: str = "secret") -> JwtAccessTokenProcessor:
+    return JwtAccessTokenProcessor(JwtSecret(secret), "HS256")
+
+
+def create_auth_session() -> AuthSession:
+    return AuthSession(
+        id_="session",
+        user_id=create_user_id(),
+        expiration=datetime.now(tz=UTC).replace(microsecond=0) + timedelta(hours=1),
+    )
+
+
+def test_claims_round_trip() -> None:
+    sut = create_jwt_processor()
+    auth_session = create_auth_session()
+
+    claims = sut.decode_claims(sut.encode(auth_session, revocation_epoch=7))
+
+    assert claims is not None
+    assert claims.auth_session_id == auth_session.id_
+    assert claims.user_id == auth_session.user_id
+    assert claims.expiration == auth_session.expiration
+    assert claims.revocation_epoch == 7
+
+
+def test_legacy_token_has_no_claims_but_keeps_session_id() -> None:
+    sut = create_jwt_processor()
+    exp = int((datetime.now(tz=UTC) + timedelta(hours=1)).timestamp())
+    legacy_token = jwt.encode(
+        {"auth_session_id": "session", "exp": exp},
+        key="secret",
+        algorithm="HS256",
+    )
+
+    assert sut.decode_claims(legacy_token) is None
+    assert sut.decode_auth_session_id(legacy_token) == "session"
+
+
+def test_rejects_token_signed_with_another_secret() -> None:
+    token = create_jwt_processor("another").encode(create_auth_session(), 0)
+
+    assert create_jwt_processor().decode_claims(token) is None
@@ -0,0 +1,48 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.application.queries.list_users import ListUsersResponse
+from app.domain.enums.user_type import UserRole
+from app.infrastructure.auth.handlers.list_sessions import ListSessionsResponse
+from app.presentation.http.responses import QueryJSONResponse
+
+
+def test_users_match_validated_serialization() -> None:
+    content = ListUsersResponse(
+        users=[
+            {
+                "id_": uuid4(),
+                "username": "alice",
+                "role": UserRole.ADMIN,
+                "is_active": True,
+            },
+        ],
+        next_cursor=None,
+        total=1,
+        is_total_exact=True,
+    )
+    adapter = TypeAdapter(ListUsersResponse)
+    # What FastAPI sends after validating against the response model
+    validated = adapter.dump_python(adapter.validate_python(content), mode="json")
+
+    assert orjson.loads(QueryJSONResponse(content).body) == validated
+
+
+def test_sessions_match_validated_serialization() -> None:
+    content = ListSessionsResponse(
+        total=1,
+        sessions=[
+            {
+                "expiration": datetime(2030, 1, 1, 12, 30, 15, 250, tzinfo=UTC),
+                "is_current": True,
+            },
+        ],
+    )
+    adapter = TypeAdapter(ListSessionsResponse)
+    # What FastAPI sends after validating against the response model
+    validated = adapter.dump_python(adapter.validate_python(content), mode="json")
+
+    assert orjson.loads(QueryJSONResponse(content).body) == validated
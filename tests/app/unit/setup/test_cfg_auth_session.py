@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from app.setup.config.auth_session import (
+    AuthSessionCacheSettings,
+    AuthSessionExtensionWriterSettings,
+    AuthSessionReaperSettings,
+    AuthSessionStatelessSettings,
+)
+from tests.app.unit.factories.settings_data import (
+    create_auth_session_cache_settings_data,
+    create_auth_session_extension_writer_settings_data,
+    create_auth_session_reaper_settings_data,
+    create_auth_session_stateless_settings_data,
+)
+
+
+def test_cache_converts_ttl_to_timedelta() -> None:
+    data = create_auth_session_cache_settings_data(ttl_sec=2.5)
+
+    sut = AuthSessionCacheSettings.model_validate(data)
+
+    assert sut.ttl_sec == timedelta(seconds=2.5)
+
+
+@pytest.mark.parametrize(
+    "ttl",
+    [
+        pytest.param("1", id="wrong_type"),
+        pytest.param(0, id="zero"),
+    ],
+)
+def test_cache_rejects_invalid_ttl(ttl: int | str) -> None:
+    data = create_auth_session_cache_settings_data(ttl_sec=ttl)  # type: ignore[arg-type]
+
+    with pytest.raises(ValidationError):
+        AuthSessionCacheSettings.model_validate(data)
+
+
+def test_cache_rejects_non_positive_max_size() -> None:
+    data = create_auth_session_cache_settings_data(max_size=0)
+
+    with pytest.raises(ValidationError):
+        AuthSessionCacheSettings.model_validate(data)
+
+
+def test_stateless_converts_sync_interval_to_timedelta() -> None:
+    data = create_auth_session_stateless_settings_data(epoch_sync_interval_sec=5)
+
+    sut = AuthSessionStatelessSettings.model_validate(data)
+
+    assert sut.epoch_sync_interval_sec == timedelta(seconds=5)
+
+
+def test_stateless_rejects_non_positive_sync_interval() -> None:
+    data = create_auth_session_stateless_settings_data(epoch_sync_interval_sec=0)
+
+    with pytest.raises(ValidationError):
+        AuthSessionStatelessSettings.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    ("flush_interval_sec", "max_batch_size"),
+    [
+        pytest.param(0, 1000, id="zero_interval"),
+        pytest.param(1, 0, id="zero_batch"),
+    ],
+)
+def test_extension_writer_rejects_invalid_values(
+    flush_interval_sec: int,
+    max_batch_size: int,
+) -> None:
+    data = create_auth_session_extension_writer_settings_data(
+        flush_interval_sec=flush_interval_sec,
+        max_batch_size=max_batch_size,
+    )
+
+    with pytest.raises(ValidationError):
+        AuthSessionExtensionWriterSettings.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    ("interval_sec", "batch_size"),
+    [
+        pytest.param(0, 5000, id="zero_interval"),
+        pytest.param(300, 0, id="zero_batch"),
+    ],
+)
+def test_reaper_rejects_invalid_values(
+    interval_sec: int,
+    batch_size: int,
+) -> None:
+    data = create_auth_session_reaper_settings_data(
+        interval_sec=interval_sec,
+        batch_size=batch_size,
+    )
+
+    with pytest.raises(ValidationError):
+        AuthSessionReaperSettings.model_validate(data)
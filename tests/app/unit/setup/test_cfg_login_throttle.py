@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from app.setup.config.login_throttle import LoginThrottleSettings
+from tests.app.unit.factories.settings_data import (
+    create_login_throttle_settings_data,
+)
+
+
+def test_converts_window_to_timedelta() -> None:
+    data = create_login_throttle_settings_data(window_sec=60)
+
+    sut = LoginThrottleSettings.model_validate(data)
+
+    assert sut.window_sec == timedelta(seconds=60)
+
+
+@pytest.mark.parametrize(
+    ("store", "window_sec", "max_attempts_per_username"),
+    [
+        pytest.param("redis", 900, 10, id="unknown_store"),
+        pytest.param("in_memory", 0, 10, id="zero_window"),
+        pytest.param("in_memory", 900, 0, id="zero_attempts"),
+    ],
+)
+def test_rejects_invalid_values(
+    store: str,
+    window_sec: int,
+    max_attempts_per_username: int,
+) -> None:
+    data = create_login_throttle_settings_data(
+        store=store,
+        window_sec=window_sec,
+        max_attempts_per_username=max_attempts_per_username,
+    )
+
+    with pytest.raises(ValidationError):
+        LoginThrottleSettings.model_validate(data)
@@ -0,0 +1,72 @@
+from datetime import timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from app.setup.config.password_hasher import PasswordHasherSettings
+from tests.app.unit.factories.settings_data import (
+    create_password_hasher_settings_data,
+)
+
+
+def test_accepts_zero_pending_jobs() -> None:
+    data = create_password_hasher_settings_data(max_pending=0)
+
+    sut = PasswordHasherSettings.model_validate(data)
+
+    assert sut.max_pending == 0
+
+
+@pytest.mark.parametrize(
+    ("executor", "max_workers", "max_pending"),
+    [
+        pytest.param("greenlet", 4, 64, id="unknown_executor"),
+        pytest.param("thread", 0, 64, id="zero_workers"),
+        pytest.param("thread", 4, -1, id="negative_pending"),
+    ],
+)
+def test_rejects_invalid_values(
+    executor: str,
+    max_workers: int,
+    max_pending: int,
+) -> None:
+    data = create_password_hasher_settings_data(
+        executor=executor,
+        max_workers=max_workers,
+        max_pending=max_pending,
+    )
+
+    with pytest.raises(ValidationError):
+        PasswordHasherSettings.model_validate(data)
+
+
+def test_auto_rounds_means_calibration() -> None:
+    data = create_password_hasher_settings_data(rounds="auto")
+
+    sut = PasswordHasherSettings.model_validate(data)
+
+    assert sut.rounds is None
+    assert sut.target_hash_time_ms == timedelta(milliseconds=250)
+
+
+@pytest.mark.parametrize(
+    ("rounds", "min_rounds", "max_rounds"),
+    [
+        pytest.param("fast", 12, 16, id="unknown_rounds"),
+        pytest.param(3, 12, 16, id="rounds_below_bcrypt_minimum"),
+        pytest.param(12, 13, 12, id="min_above_max"),
+    ],
+)
+def test_rejects_invalid_rounds(
+    rounds: int | str,
+    min_rounds: int,
+    max_rounds: int,
+) -> None:
+    data = create_password_hasher_settings_data(
+        rounds=rounds,
+        min_rounds=min_rounds,
+        max_rounds=max_rounds,
+    )
+
+    with pytest.raises(ValidationError):
+        PasswordHasherSettings.model_validate(data)